@@ -0,0 +1,60 @@
+"""Draws per second of BufferedSystemRNG versus DefaultRNG.
+
+Run from the repository root with::
+
+    PYTHONPATH=. python benchmarks/bench_buffered_rng.py [draws]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from dice.execution import ExecutionConfig, compile_plan, execute
+from dice.grammar import parse
+from dice.rng import BufferedSystemRNG, DefaultRNG
+
+TOTAL = ExecutionConfig(detail="total")
+
+
+def main(draws: int = 200_000) -> None:
+    for a, b in [(1, 6), (1, 20), (1, 1000)]:
+        timings = []
+        for rng in (DefaultRNG(), BufferedSystemRNG()):
+            randint = rng.randint
+            start = time.perf_counter()
+            for _ in range(draws):
+                randint(a, b)
+            single = time.perf_counter() - start
+            start = time.perf_counter()
+            rng.randints(draws, a, b)
+            timings.append((single, time.perf_counter() - start))
+        (default, default_bulk), (buffered, buffered_bulk) = timings
+        for label, default_time, buffered_time in [
+            (f"randint({a}, {b})", default, buffered),
+            (f"randints(n, {a}, {b})", default_bulk, buffered_bulk),
+        ]:
+            print(
+                f"{label:<22} default {draws / default_time:10.0f}/s  "
+                f"buffered {draws / buffered_time:10.0f}/s  "
+                f"x{default_time / buffered_time:.1f}"
+            )
+
+    for expression in ["1d20+5", "4d6kh3", "2d6!"]:
+        plan = compile_plan(parse(expression))
+        rolls = draws // 4
+        timings = []
+        for rng in (DefaultRNG(), BufferedSystemRNG()):
+            start = time.perf_counter()
+            for _ in range(rolls):
+                execute(plan, rng=rng, config=TOTAL)
+            timings.append(time.perf_counter() - start)
+        default, buffered = timings
+        print(
+            f"{'execute ' + expression:<22} default {rolls / default:10.0f}/s  "
+            f"buffered {rolls / buffered:10.0f}/s  x{default / buffered:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,57 @@
+"""Dice per second drawn one at a time versus with the bulk ``randints``.
+
+Run from the repository root with::
+
+    PYTHONPATH=. python benchmarks/bench_bulk_draws.py [dice]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from dice.execution import ExecutionConfig, compile_plan, execute
+from dice.grammar import parse
+from dice.rng import DefaultRNG, SeededRNG
+
+TOTAL = ExecutionConfig(detail="total")
+
+
+class SingleDrawRNG:
+    """Hides the bulk method of an RNG, as a third-party RNG would."""
+
+    def __init__(self, rng) -> None:
+        self.randint = rng.randint
+
+
+def main(dice: int = 1_000_000) -> None:
+    for name, rng in [("SeededRNG", SeededRNG(1)), ("DefaultRNG", DefaultRNG())]:
+        start = time.perf_counter()
+        [rng.randint(1, 6) for _ in range(dice)]
+        single = time.perf_counter() - start
+        start = time.perf_counter()
+        rng.randints(dice, 1, 6)
+        bulk = time.perf_counter() - start
+        print(
+            f"{name:<11} randint {dice / single:11.0f}/s  "
+            f"randints {dice / bulk:11.0f}/s  x{single / bulk:.1f}"
+        )
+
+    for expression in ["100d6", "20d6!", "50d6r<2"]:
+        plan = compile_plan(parse(expression))
+        rolls = dice // 100
+        timings = []
+        for rng in (SingleDrawRNG(SeededRNG(1)), SeededRNG(1)):
+            start = time.perf_counter()
+            for _ in range(rolls):
+                execute(plan, rng=rng, config=TOTAL)
+            timings.append(time.perf_counter() - start)
+        single, bulk = timings
+        print(
+            f"{expression:<11} single {rolls / single:9.0f}/s  "
+            f"bulk {rolls / bulk:9.0f}/s  x{single / bulk:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,57 @@
+"""Bytes per die held by an evaluated dice term, measured with tracemalloc.
+
+Compares the packed results container used for large pools with the list
+of DieResult objects used below PACKED_RESULTS_THRESHOLD, and with the
+unslotted dataclass DieResult used to be. Run from the repository root with::
+
+    PYTHONPATH=. python benchmarks/bench_die_memory.py [dice]
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+from dice.rng import SeededRNG
+from dice.terms import DiceTerm, DieResult, die_results
+
+
+@dataclass
+class _UnslottedDieResult:
+    value: int
+    kept: bool = True
+    exploded: bool = False
+    rerolled: bool = False
+    critical: str | None = None
+    matched: bool = False
+
+
+def _measure(build) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return after - before
+
+
+def main(dice: int = 1000) -> None:
+    values = [SeededRNG(1).randint(1, 6) for _ in range(dice)]
+    cases = {
+        "dataclass DieResult": lambda: [_UnslottedDieResult(v) for v in values],
+        "slotted DieResult": lambda: [DieResult(v) for v in values],
+        "packed DieResults": lambda: die_results.DieResults(values),
+    }
+    for name, build in cases.items():
+        print(f"{name:<22} {_measure(build) / dice:7.1f} bytes/die")
+
+    term = DiceTerm(count=dice, faces=6)
+    size = _measure(lambda: term.evaluate(SeededRNG(1)))
+    print(f"{f'DiceTerm {dice}d6':<22} {size / dice:7.1f} bytes/die "
+          f"({type(term.results).__name__})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,74 @@
+"""Peak memory and time per execute() call, with and without a copied tree.
+
+``execute()`` used to return ``copy.deepcopy(ast.to_dict())``; it now
+returns ``ast.to_dict()`` directly. This measures both with tracemalloc.
+Run from the repository root with::
+
+    PYTHONPATH=. python benchmarks/bench_execute_alloc.py [rolls]
+"""
+
+from __future__ import annotations
+
+import copy
+import sys
+import time
+import tracemalloc
+
+from dice.execution import compile_plan, execute
+from dice.execution.config import ExecutionConfig
+from dice.execution.evaluator import _EvalContext, evaluate_tree
+from dice.grammar import parse
+from dice.rng import SeededRNG
+
+EXPRESSIONS = ["1d20+5", "8d6!", "4d6kh3 + 2d8 + (1d4 * 3)"]
+
+
+def _deepcopy_execute(plan, rng):
+    ast = plan.instantiate()
+    evaluate_tree(ast, _EvalContext(rng, ExecutionConfig()))
+    return copy.deepcopy(ast.to_dict())
+
+
+def _execute(plan, rng):
+    return execute(plan, rng=rng).tree
+
+
+def measure(fn, plan, rolls: int) -> tuple[float, float]:
+    """Return (peak bytes/roll, µs/roll).
+
+    Peak is the most memory live at once during the call, which includes
+    the term tree, its serialized dict and any copy of that dict.
+    """
+    rng = SeededRNG(1)
+    fn(plan, rng)  # warm caches
+
+    tracemalloc.start()
+    peak = 0
+    for _ in range(rolls):
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        tree = fn(plan, rng)
+        peak += tracemalloc.get_traced_memory()[1] - base
+        del tree
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(rolls):
+        fn(plan, rng)
+    elapsed = time.perf_counter() - start
+    return peak / rolls, elapsed / rolls * 1e6
+
+
+def main(rolls: int = 2000) -> None:
+    for expression in EXPRESSIONS:
+        plan = compile_plan(parse(expression))
+        for name, fn in (("deepcopy", _deepcopy_execute), ("direct", _execute)):
+            peak, us = measure(fn, plan, rolls)
+            print(
+                f"{expression:<28} {name:<9} peak {peak:7.0f} B/roll  "
+                f"{us:7.1f} µs/roll"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,41 @@
+"""Rows per second of execute_many() versus a loop of total-only executes.
+
+Run from the repository root with::
+
+    PYTHONPATH=. python benchmarks/bench_execute_many.py [rows]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from dice.execution import ExecutionConfig, compile_plan, execute, execute_many
+from dice.grammar import parse
+from dice.rng import SeededRNG
+
+EXPRESSIONS = ["1d20+5", "3d6", "4d6kh3", "2d6 + floor(1d8 / 2)", "8d6!"]
+
+TOTAL = ExecutionConfig(detail="total")
+
+
+def main(rows: int = 100_000) -> None:
+    for expression in EXPRESSIONS:
+        plan = compile_plan(parse(expression))
+        rng = SeededRNG(1)
+        start = time.perf_counter()
+        for _ in range(rows):
+            execute(plan, rng=rng, config=TOTAL)
+        loop = time.perf_counter() - start
+
+        start = time.perf_counter()
+        execute_many(plan, rows, rng=rng)
+        batch = time.perf_counter() - start
+        print(
+            f"{expression:<22} loop {rows / loop:9.0f}/s  "
+            f"execute_many {rows / batch:9.0f}/s  x{loop / batch:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,47 @@
+"""Time to roll a keep-highest pool as individual dice versus a histogram.
+
+Run from the repository root with::
+
+    PYTHONPATH=. python benchmarks/bench_histogram.py [rolls]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from dice.execution import ExecutionConfig, compile_plan, execute
+from dice.grammar import parse
+from dice.rng import SeededRNG
+
+COUNTS = [1000, 10_000, 100_000]
+
+CONFIGS = {
+    "dice": ExecutionConfig(max_dice=max(COUNTS)),
+    "histogram": ExecutionConfig(histogram_threshold=1),
+}
+
+
+def per_roll(plan, config: ExecutionConfig, rolls: int) -> float:
+    rng = SeededRNG(1)
+    start = time.perf_counter()
+    for _ in range(rolls):
+        execute(plan, rng=rng, config=config)
+    return (time.perf_counter() - start) / rolls
+
+
+def main(rolls: int = 20) -> None:
+    for count in COUNTS:
+        plan = compile_plan(parse(f"{count}d6kh3"))
+        times = {
+            name: per_roll(plan, config, rolls) for name, config in CONFIGS.items()
+        }
+        print(
+            f"{count:>7}d6kh3  dice {times['dice'] * 1e3:9.2f} ms  "
+            f"histogram {times['histogram'] * 1e3:7.3f} ms  "
+            f"x{times['dice'] / times['histogram']:.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
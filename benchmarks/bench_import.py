@@ -0,0 +1,45 @@
+"""Cold-start cost of ``import dice`` and of the first roll.
+
+Each sample runs in a fresh interpreter. Run from the repository root with::
+
+    PYTHONPATH=. python benchmarks/bench_import.py [samples]
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+
+CASES = {
+    "import dice": "import dice",
+    "import + first roll": "import dice; dice.roll('1d20+7')",
+    "import + first compile": "import dice; dice.compile('1d20+7').roll_total()",
+}
+
+_TIMER = """
+import time
+_start = time.perf_counter()
+{code}
+print(time.perf_counter() - _start)
+"""
+
+
+def sample(code: str) -> float:
+    proc = subprocess.run(
+        [sys.executable, "-c", _TIMER.format(code=code)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(proc.stdout)
+
+
+def main(samples: int = 20) -> None:
+    for name, code in CASES.items():
+        times = [sample(code) for _ in range(samples)]
+        print(f"{name:<24} median {statistics.median(times) * 1e3:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
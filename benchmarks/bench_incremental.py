@@ -0,0 +1,67 @@
+"""Per-keystroke validation latency: full validate() vs incremental reparse().
+
+Types a ~500-character macro one character at a time, then deletes it again
+from the middle, timing each keystroke. Run from the repository root with::
+
+    PYTHONPATH=. python benchmarks/bench_incremental.py
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+
+from dice.grammar import parse_state, validate
+
+MACRO = (
+    "4d6kh3 + 2d8! + (1d4 * 3) - floor(2d6 / 2) + 10d10!>9 + 3d6r<2 "
+    "+ ceil(1.5 * 2d6) + round(3d4 / 2) - abs(1d6 - 4) + 4dF + 1d100 "
+    "+ (2d6 + 3) * 2 + 8d6kl2 + 6d6dh1 + 1d20 + 5 + 1d12 + 1d10! + 2d4 "
+    "+ (1d8 + 1d6) * (1d4 + 1) + 5d10ro<3 + floor(4d6kh3 / 3) + 3d6! + 7 "
+    "+ 1d20 + 1d20 + 2d20kh1 + 2d20kl1 + (3d8 + 2d6 + 1d4) - 2 + 6d6 "
+    "+ 2d6 + 2d6 + 1d4 * 3 + 9d6r<3 + ceil(1d100 / 10) + 1d3 + 4d4 + 3 "
+    "+ 2d10 + round(1d6 * 1.5) + (4d6kh3 - 1) * 2 + 3d12dl1 + 1d8 + 2 "
+    "+ 1d8 [fireball damage]"
+)
+
+
+def _ms(samples: list[float]) -> str:
+    return (
+        f"median {statistics.median(samples) * 1e3:6.3f} ms  "
+        f"p99 {sorted(samples)[int(len(samples) * 0.99)] * 1e3:6.3f} ms"
+    )
+
+
+def main() -> None:
+    full: list[float] = []
+    incremental: list[float] = []
+
+    state = parse_state("")
+    for i, ch in enumerate(MACRO):
+        text = MACRO[: i + 1]
+        start = time.perf_counter()
+        validate(text, backend="descent")
+        full.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        state = state.edit(i, 0, ch)
+        incremental.append(time.perf_counter() - start)
+
+    middle = len(MACRO) // 2
+    while len(state.expression) > middle:
+        text = state.expression[:middle - 1] + state.expression[middle:]
+        start = time.perf_counter()
+        validate(text, backend="descent")
+        full.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        state = state.edit(middle - 1, 1, "")
+        incremental.append(time.perf_counter() - start)
+
+    print(f"macro length {len(MACRO)} chars, {len(full)} keystrokes")
+    print(f"validate()  {_ms(full)}")
+    print(f"reparse()   {_ms(incremental)}")
+
+
+if __name__ == "__main__":
+    main()
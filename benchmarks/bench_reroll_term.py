@@ -0,0 +1,64 @@
+"""Rerolling one term of a large execution versus rolling it again.
+
+Run from the repository root with::
+
+    PYTHONPATH=. python benchmarks/bench_reroll_term.py [terms]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from dice.execution import ExecutionConfig, compile_plan, execute, reroll_term
+from dice.rng import SeededRNG
+from dice.terms import (
+    DiceTerm,
+    NumericTerm,
+    OperatorTerm,
+    ParentheticalTerm,
+    RollExpression,
+    assign_ids,
+)
+
+
+def build(terms: int) -> RollExpression:
+    """``(1d8 + 0) + (2d8 + 1) + ...``, built directly: it is too long to parse."""
+    children = []
+    for i in range(terms):
+        if children:
+            children.append(OperatorTerm(operator="+"))
+        inner = [
+            DiceTerm(count=i % 6 + 1, faces=8),
+            OperatorTerm(operator="+"),
+            NumericTerm(value=i),
+        ]
+        children.append(ParentheticalTerm(expression="(...)", children=inner))
+    ast = RollExpression(expression="...", children=children)
+    assign_ids(ast)
+    return ast
+
+
+def per_call(fn, calls: int = 200) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
+
+
+def main(terms: int = 200) -> None:
+    config = ExecutionConfig(max_dice=10 * terms, max_depth=4)
+    plan = compile_plan(build(terms))
+    rng = SeededRNG(1)
+    result = execute(plan, rng=rng, config=config)
+    result.tree
+    target = result.terms.children[terms].id
+
+    full = per_call(lambda: execute(plan, rng=rng, config=config).tree)
+    partial = per_call(lambda: reroll_term(result, target, rng=rng, config=config))
+    print(f"{terms} terms: execute + tree {full * 1e6:8.0f} us  "
+          f"reroll_term {partial * 1e6:6.0f} us  x{full / partial:.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,45 @@
+"""Throughput of full execution versus ``detail="total"``.
+
+Run from the repository root with::
+
+    PYTHONPATH=. python benchmarks/bench_total_only.py [rolls]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from dice.execution import ExecutionConfig, compile_plan, execute
+from dice.grammar import parse
+from dice.rng import SeededRNG
+
+EXPRESSIONS = ["1d20+5", "2d6+3", "8d6!", "4d6kh3 + 2d8 + (1d4 * 3)"]
+
+CONFIGS = {
+    "full": ExecutionConfig(),
+    "total": ExecutionConfig(detail="total"),
+}
+
+
+def rate(plan, config: ExecutionConfig, rolls: int) -> float:
+    rng = SeededRNG(1)
+    start = time.perf_counter()
+    for _ in range(rolls):
+        execute(plan, rng=rng, config=config)
+    return rolls / (time.perf_counter() - start)
+
+
+def main(rolls: int = 20000) -> None:
+    for expression in EXPRESSIONS:
+        plan = compile_plan(parse(expression))
+        rates = {name: rate(plan, config, rolls) for name, config in CONFIGS.items()}
+        print(
+            f"{expression:<28} full {rates['full']:9.0f}/s  "
+            f"total {rates['total']:9.0f}/s  "
+            f"x{rates['total'] / rates['full']:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
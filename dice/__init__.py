@@ -1,73 +1,154 @@
-"""dice — a Python library for rolling dice with Roll20-compatible notation."""
+"""dice — a Python library for rolling dice with Roll20-compatible notation.
 
-import logging
+Public names are resolved lazily (PEP 562): ``import dice`` loads nothing
+but this module, and the grammar, terms and modifiers are imported on first
+use. The package never configures logging; that is left to the host
+application.
+"""
 
-logging.basicConfig(
-    format="%(asctime)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-)
-logger = logging.getLogger(__name__)
+from __future__ import annotations
 
-from dice.api import roll  # noqa: E402
-from dice.constants import SYNTAX_VERSION  # noqa: E402
-from dice.errors import DiceError, DiceExecutionError, DiceParseError  # noqa: E402
-from dice.evaluation import (  # noqa: E402
-    DefaultEvaluator,
-    Evaluator,
-    evaluate,
-    register_evaluator,
-)
-from dice.execution import ExecutionConfig, ExecutionResult, execute  # noqa: E402
-from dice.grammar import ParseResult, parse, validate  # noqa: E402
-from dice.rng import RNG, DefaultRNG, SeededRNG  # noqa: E402
-from dice.roll_result import RollResult  # noqa: E402
-from dice.terms import (  # noqa: E402
-    DiceTerm,
-    DieResult,
-    FateDiceTerm,
-    FunctionTerm,
-    GroupTerm,
-    NumericTerm,
-    OperatorTerm,
-    ParentheticalTerm,
-    RollExpression,
-    RollTerm,
-)
+import importlib
 
-__all__ = [
+# Avoids importing ``typing`` (the bulk of a cold import) at runtime;
+# type checkers still treat the block below as taken.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from dice.analysis import CostEstimate, estimate_cost
+    from dice.api import compile, roll
+    from dice.cache import (
+        BatchParseResult,
+        CacheInfo,
+        ExpressionCache,
+        expression_cache,
+        parse_many,
+    )
+    from dice.constants import SYNTAX_VERSION
+    from dice.errors import DiceError, DiceExecutionError, DiceParseError
+    from dice.evaluation import (
+        DefaultEvaluator,
+        Evaluator,
+        evaluate,
+        register_evaluator,
+    )
+    from dice.execution import (
+        BatchExecutionResult,
+        CompiledExpression,
+        ExecutionConfig,
+        ExecutionPlan,
+        ExecutionResult,
+        compile_plan,
+        execute,
+        execute_many,
+        optimize,
+        reroll_term,
+    )
+    from dice.grammar import (
+        ParseResult,
+        ParseState,
+        parse,
+        parse_state,
+        reparse,
+        validate,
+    )
+    from dice.rng import (
+        RNG,
+        BufferedSystemRNG,
+        DefaultRNG,
+        ExecutionBudget,
+        SeededRNG,
+    )
+    from dice.roll_result import RollResult
+    from dice.store import PlanStore
+    from dice.template import Template, compile_template
+    from dice.terms import (
+        DiceTerm,
+        DieResult,
+        FateDiceTerm,
+        FunctionTerm,
+        GroupTerm,
+        NumericTerm,
+        OperatorTerm,
+        ParentheticalTerm,
+        RollExpression,
+        RollTerm,
+    )
+
+# Public name -> module that defines it.
+_EXPORTS: dict[str, str] = {
     # Core API
-    "roll",
-    "parse",
-    "validate",
-    "execute",
-    "evaluate",
-    "register_evaluator",
+    "roll": "dice.api",
+    "compile": "dice.api",
+    "compile_template": "dice.template",
+    "parse": "dice.grammar",
+    "parse_many": "dice.cache",
+    "validate": "dice.grammar",
+    "parse_state": "dice.grammar",
+    "reparse": "dice.grammar",
+    "execute": "dice.execution",
+    "execute_many": "dice.execution",
+    "compile_plan": "dice.execution",
+    "optimize": "dice.execution",
+    "reroll_term": "dice.execution",
+    "evaluate": "dice.evaluation",
+    "register_evaluator": "dice.evaluation",
+    "estimate_cost": "dice.analysis",
     # Result types
-    "ParseResult",
-    "ExecutionResult",
-    "ExecutionConfig",
-    "RollResult",
+    "ParseResult": "dice.grammar",
+    "ParseState": "dice.grammar",
+    "ExecutionResult": "dice.execution",
+    "ExecutionConfig": "dice.execution",
+    "ExecutionPlan": "dice.execution",
+    "BatchExecutionResult": "dice.execution",
+    "CompiledExpression": "dice.execution",
+    "Template": "dice.template",
+    "RollResult": "dice.roll_result",
+    "CostEstimate": "dice.analysis",
+    # Caching
+    "ExpressionCache": "dice.cache",
+    "CacheInfo": "dice.cache",
+    "BatchParseResult": "dice.cache",
+    "PlanStore": "dice.store",
+    "expression_cache": "dice.cache",
     # Evaluator
-    "Evaluator",
-    "DefaultEvaluator",
+    "Evaluator": "dice.evaluation",
+    "DefaultEvaluator": "dice.evaluation",
     # RNG
-    "RNG",
-    "DefaultRNG",
-    "SeededRNG",
+    "RNG": "dice.rng",
+    "DefaultRNG": "dice.rng",
+    "BufferedSystemRNG": "dice.rng",
+    "SeededRNG": "dice.rng",
+    "ExecutionBudget": "dice.rng",
     # Errors
-    "DiceError",
-    "DiceParseError",
-    "DiceExecutionError",
+    "DiceError": "dice.errors",
+    "DiceParseError": "dice.errors",
+    "DiceExecutionError": "dice.errors",
     # Terms
-    "RollTerm",
-    "RollExpression",
-    "DiceTerm",
-    "FateDiceTerm",
-    "NumericTerm",
-    "OperatorTerm",
-    "ParentheticalTerm",
-    "GroupTerm",
-    "FunctionTerm",
-    "DieResult",
+    "RollTerm": "dice.terms",
+    "RollExpression": "dice.terms",
+    "DiceTerm": "dice.terms",
+    "FateDiceTerm": "dice.terms",
+    "NumericTerm": "dice.terms",
+    "OperatorTerm": "dice.terms",
+    "ParentheticalTerm": "dice.terms",
+    "GroupTerm": "dice.terms",
+    "FunctionTerm": "dice.terms",
+    "DieResult": "dice.terms",
     # Constants
-    "SYNTAX_VERSION",
-]
+    "SYNTAX_VERSION": "dice.constants",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> object:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,6 @@
+from dice.analysis.cost import CostEstimate, estimate_cost
+
+__all__ = [
+    "CostEstimate",
+    "estimate_cost",
+]
@@ -0,0 +1,156 @@
+"""Static cost estimation of dice expressions, without rolling them.
+
+:func:`estimate_cost` walks an AST and works out how many dice an
+expression rolls (at worst and on average), how many explosion and reroll
+iterations its modifiers are expected to run, how deep it is and how large
+its execution tree will be. :func:`~dice.execution.executor.execute`
+compares the estimate with ``ExecutionConfig.max_cost`` before rolling, so
+pathological expressions such as ``1000d2!>1`` are refused up front.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from dice.constants import MAX_EXPLOSIONS
+from dice.grammar import ParseResult
+from dice.modifiers.base import spec_predicate
+from dice.modifiers.registry import modifier_plan_for
+from dice.terms import DiceTerm, RollTerm
+from dice.terms.die_histogram import histogram_applies
+
+if TYPE_CHECKING:
+    from dice.execution.plan import ExecutionPlan
+
+# Modifiers that roll a new die for each matching one, and keep going while
+# the new dice match too (see dice.modifiers.explode and .reroll).
+_CHAINED = {"!", "!!", "!p", "r"}
+_ONCE = {"ro"}
+
+
+@dataclass(frozen=True)
+class CostEstimate:
+    """The static cost of one execution of an expression.
+
+    ``max_dice`` is a hard bound: every dice term, plus the extra dice the
+    explode and reroll modifiers can add before the execution budget's
+    explosion limit (``max_explosions``, shared by the whole expression)
+    stops them. The expected figures describe the modifiers as written,
+    without that limit, so they show how far past it an expression would
+    go; they are ``inf`` when a modifier matches every face and would never
+    stop.
+    """
+
+    # Worst-case number of dice rolled, including explosions and rerolls.
+    max_dice: int
+    # Expected number of dice rolled, including explosions and rerolls.
+    expected_dice: float
+    # Expected number of explosion and reroll iterations.
+    expected_iterations: float
+    # Nesting depth, counted as the evaluator does (the root is 1).
+    depth: int
+    # Expected number of dicts in the serialized tree (terms and dice).
+    tree_size: float
+    # Expected number of RNG draws: one per die, or one per face for pools
+    # rolled as histograms.
+    expected_draws: float
+
+    @property
+    def cost(self) -> float:
+        """The figure compared with ``ExecutionConfig.max_cost``.
+
+        The expected number of RNG draws.
+        """
+        return self.expected_draws
+
+
+def estimate_cost(
+    source: ParseResult | RollTerm | ExecutionPlan,
+    *,
+    max_explosions: int = MAX_EXPLOSIONS,
+    histogram_threshold: int | None = None,
+) -> CostEstimate:
+    """Estimate the cost of executing a parse result, AST or plan.
+
+    *max_explosions* is the explosion limit ``max_dice`` is bounded by.
+    *histogram_threshold* is ``ExecutionConfig.histogram_threshold``: pools
+    rolled as histograms cost one draw per face rather than per die.
+
+    Raises:
+        DiceParseError: If *source* is a ``ParseResult`` with errors.
+        DiceValidationError: If a hand-built dice term has modifiers that
+            cannot be resolved.
+    """
+    root: RollTerm
+    if isinstance(source, ParseResult):
+        if source.errors:
+            raise source.errors[0]
+        root = source.ast
+    elif isinstance(source, RollTerm):
+        root = source
+    else:
+        root = source.instantiate()
+
+    dice = 0
+    extra_dice = 0
+    expected_dice = 0.0
+    draws = 0.0
+    iterations = 0.0
+    max_depth = 0
+    terms = 0
+    stack = [(root, 1)]
+    while stack:
+        term, depth = stack.pop()
+        terms += 1
+        max_depth = max(max_depth, depth)
+        if isinstance(term, DiceTerm):
+            worst, expected, extra = _dice_cost(term, max_explosions)
+            dice += term.count
+            extra_dice += worst - term.count
+            expected_dice += expected
+            iterations += extra
+            if term.supports_histogram and histogram_applies(
+                term.count, term.faces, histogram_threshold
+            ):
+                draws += term.faces
+            else:
+                draws += expected
+        stack.extend((child, depth + 1) for child in term.child_terms())
+
+    return CostEstimate(
+        max_dice=dice + min(extra_dice, max_explosions),
+        expected_dice=expected_dice,
+        expected_iterations=iterations,
+        depth=max_depth,
+        tree_size=terms + expected_dice,
+        expected_draws=draws,
+    )
+
+
+def _dice_cost(term: DiceTerm, max_explosions: int) -> tuple[int, float, float]:
+    """Return worst-case dice, expected dice and expected iterations."""
+    worst = term.count
+    expected = float(term.count)
+    iterations = 0.0
+    faces = range(term.lowest_face, term.lowest_face + term.faces)
+    for step in modifier_plan_for(term):
+        key = step.spec.key
+        if key not in _CHAINED and key not in _ONCE:
+            continue
+        matches = spec_predicate(step.spec, term.faces)
+        p = sum(1 for value in faces if matches(value)) / len(faces)
+        if not p:
+            continue
+        if key in _ONCE:
+            added = expected * p
+            worst += min(worst, max_explosions)
+        else:
+            # Each matching die starts a chain of geometric length.
+            added = expected * p / (1 - p) if p < 1 else math.inf
+            worst += max_explosions
+        expected += added
+        iterations += added
+    return worst, expected, iterations
+
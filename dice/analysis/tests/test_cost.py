@@ -0,0 +1,100 @@
+import math
+
+import pytest
+
+from dice.analysis import CostEstimate, estimate_cost
+from dice.constants import MAX_EXPLOSIONS
+from dice.errors import DiceParseError
+from dice.execution import compile_plan
+from dice.grammar import parse
+from dice.terms import DiceTerm, RollExpression
+
+
+def test_plain_expression():
+    estimate = estimate_cost(parse("4d6kh3 + 2"))
+    assert estimate == CostEstimate(
+        max_dice=4,
+        expected_dice=4.0,
+        expected_iterations=0.0,
+        depth=2,
+        tree_size=8.0,
+        expected_draws=4.0,
+    )
+    assert estimate.cost == 4.0
+
+
+def test_histogram_pools_cost_one_draw_per_face():
+    source = parse("1000d6kh1 + 1000d2000000000kh1 + 1000d6!")
+    assert estimate_cost(source).cost == 3200.0
+    estimate = estimate_cost(source, histogram_threshold=100)
+    assert estimate.expected_dice == 3200.0
+    assert estimate.cost == 6.0 + 1000.0 + 1200.0
+
+
+def test_depth_counts_nesting():
+    assert estimate_cost(parse("1d4")).depth == 2
+    assert estimate_cost(parse("floor((1d8 + 1) / 2)")).depth == 4
+
+
+def test_exploding_dice():
+    estimate = estimate_cost(parse("1000d2!>1"))
+    # Half the dice explode, and each explosion chain has mean length 1.
+    assert estimate.expected_iterations == 1000.0
+    assert estimate.expected_dice == 2000.0
+    assert estimate.max_dice == 1000 + MAX_EXPLOSIONS
+    assert estimate.tree_size == 2002.0
+
+
+def test_modifier_matching_every_face_never_stops():
+    estimate = estimate_cost(parse("1d1!"))
+    assert estimate.expected_dice == math.inf
+    assert estimate.max_dice == 1 + MAX_EXPLOSIONS
+
+
+@pytest.mark.parametrize(
+    "expression, iterations, max_dice",
+    [
+        ("10d10ro<3", 2.0, 20),
+        ("10d10r<3", 2.5, 10 + MAX_EXPLOSIONS),
+        ("10d10r>10", 0.0, 10),
+        ("2d6!r<2", 2 / 5 + (2 + 2 / 5) / 5, 2 + MAX_EXPLOSIONS),
+    ],
+)
+def test_reroll_iterations(expression, iterations, max_dice):
+    estimate = estimate_cost(parse(expression))
+    assert estimate.expected_iterations == pytest.approx(iterations)
+    assert estimate.max_dice == max_dice
+
+
+def test_explosion_limit_is_shared_by_the_expression():
+    parsed = parse("3d6! + 2d6r<2 + 4d4ro=1")
+    assert estimate_cost(parsed).max_dice == 9 + MAX_EXPLOSIONS
+    assert estimate_cost(parsed, max_explosions=5).max_dice == 14
+
+
+def test_plan_estimates_are_memoized_per_explosion_limit():
+    plan = compile_plan(parse("3d6! + 2d6r<2"))
+    assert plan.cost_estimate().max_dice == 5 + MAX_EXPLOSIONS
+    assert plan.cost_estimate(max_explosions=5).max_dice == 10
+    assert plan.cost_estimate(max_explosions=5) is plan.cost_estimate(max_explosions=5)
+
+
+def test_accepts_asts_and_plans():
+    parsed = parse("3d6! + 1d20")
+    expected = estimate_cost(parsed)
+    assert estimate_cost(parsed.ast) == expected
+    assert estimate_cost(compile_plan(parsed)) == expected
+    assert compile_plan(parsed).cost_estimate() == expected
+
+
+def test_hand_built_terms_are_resolved():
+    ast = RollExpression(
+        expression="6d6r<2",
+        children=[DiceTerm(count=6, faces=6, modifier_strings=["r<2"])],
+    )
+    assert estimate_cost(ast).expected_iterations == pytest.approx(6 / 5)
+
+
+def test_parse_errors_are_raised():
+    with pytest.raises(DiceParseError):
+        estimate_cost(parse("1d"))
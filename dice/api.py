@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import Any
 
+from dice.cache import expression_cache
 from dice.evaluation import evaluate
-from dice.execution import ExecutionConfig, execute
-from dice.grammar import parse
+from dice.execution import CompiledExpression, ExecutionConfig, execute
 from dice.rng import RNG
 from dice.roll_result import RollResult
 
@@ -17,10 +18,14 @@ def roll(
     system: str | None = None,
     template: str | None = None,
     context: dict[str, Any] | None = None,
+    detail: str | None = None,
 ) -> RollResult:
     """Parse, execute, and optionally evaluate a dice expression.
 
-    This is the primary entry point for the library.
+    This is the primary entry point for the library. Expressions are looked
+    up in the shared :data:`dice.cache.expression_cache`, so repeated
+    expressions skip the grammar entirely and execute a cached, immutable
+    plan.
 
     Args:
         expression: A Roll20-compatible dice expression (e.g. "2d20kh1+7").
@@ -29,6 +34,9 @@ def roll(
         system: Optional system identifier for evaluation (e.g. "dnd35e").
         template: Optional template identifier for evaluation (e.g. "attack").
         context: Optional context dict for evaluation (e.g. {"target_dc": 15}).
+        detail: Overrides ``config.detail``. ``"total"`` skips building the
+            execution tree (``result.tree`` is ``None``) and cannot be
+            combined with evaluation.
 
     Returns:
         RollResult containing execution tree and optional evaluation.
@@ -36,12 +44,35 @@ def roll(
     Raises:
         DiceParseError: If the expression cannot be parsed.
         DiceExecutionError: If execution fails (safety limits, etc.).
+        ValueError: If evaluation is requested without an execution tree.
     """
-    parsed = parse(expression)
-    if parsed.errors:
-        raise parsed.errors[0]
-    exec_result = execute(parsed.ast, rng=rng, config=config)
+    if detail is not None:
+        config = replace(config or ExecutionConfig(), detail=detail)
+    evaluating = system is not None or template is not None or context is not None
+    if evaluating and config is not None and config.detail != "full":
+        raise ValueError("Evaluation needs the execution tree; use detail='full'")
+
+    plan = expression_cache.plan(expression)
+    exec_result = execute(plan, rng=rng, config=config)
     eval_result = None
-    if system is not None or template is not None or context is not None:
-        eval_result = evaluate(exec_result.tree, system, template, context)
+    if evaluating:
+        tree = exec_result.tree
+        assert tree is not None  # detail="full", checked above
+        eval_result = evaluate(tree, system, template, context)
     return RollResult(execution=exec_result, evaluation=eval_result)
+
+
+def compile(expression: str) -> CompiledExpression:
+    """Compile a dice expression into generated Python code.
+
+    The result is cached alongside the parsed expression. Use it for hot
+    expressions that are rolled many times::
+
+        attack = dice.compile("1d20+7")
+        attack.roll_total(rng)   # -> int
+        attack.roll(rng)         # -> ExecutionResult, same tree as execute()
+
+    Raises:
+        DiceParseError: If the expression cannot be parsed.
+    """
+    return expression_cache.compiled(expression)
@@ -0,0 +1,328 @@
+"""Bounded LRU cache of parsed dice expressions.
+
+Entries are keyed on the normalized (whitespace-stripped) expression text.
+Each entry holds the parse result and, once requested, its compiled
+:class:`~dice.execution.plan.ExecutionPlan` and generated
+:class:`~dice.execution.codegen.CompiledExpression`. Plans are immutable and are
+shared as-is; ASTs are never handed out directly because execution mutates
+them, so :meth:`ExpressionCache.parse` returns a freshly instantiated tree.
+
+Entries are parsed from the normalized text; error positions are shifted
+back onto each caller's own expression. An optional
+:class:`~dice.store.PlanStore` serves misses from disk before falling back
+to the grammar.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
+
+from dice.constants import PARSE_CACHE_SIZE, PARSE_POOL_THRESHOLD
+from dice.errors import DiceParseError
+from dice.execution.codegen import CompiledExpression
+from dice.execution.plan import ExecutionPlan, compile_plan
+from dice.grammar import ParseResult, parse
+from dice.terms import RollExpression
+
+if TYPE_CHECKING:
+    from dice.store import PlanStore
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Snapshot of cache statistics."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+@dataclass(frozen=True)
+class BatchParseResult:
+    """The outcome of :meth:`ExpressionCache.parse_many`.
+
+    ``results`` is in input order. ``unique`` counts distinct normalized
+    expressions; each was either a ``cache_hits`` (in memory or in the
+    attached plan store) or freshly ``parsed``.
+    """
+
+    results: list[ParseResult]
+    unique: int
+    cache_hits: int
+    parsed: int
+
+    @property
+    def duplicates(self) -> int:
+        return len(self.results) - self.unique
+
+
+@dataclass
+class _Entry:
+    result: ParseResult
+    plan: ExecutionPlan | None = None
+    compiled: CompiledExpression | None = None
+
+
+def normalize_expression(expression: str) -> str:
+    """Return the cache key for *expression*."""
+    return expression.strip()
+
+
+class ExpressionCache:
+    """Thread-safe LRU cache in front of :func:`dice.grammar.parse`.
+
+    A *maxsize* of ``0`` disables caching; every lookup is a miss. Misses
+    are looked up in *plan_store* first when one is attached, and freshly
+    compiled plans are written back to it unless it is read-only.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = PARSE_CACHE_SIZE,
+        *,
+        plan_store: PlanStore | None = None,
+    ) -> None:
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be >= 0, got {maxsize}")
+        self.plan_store = plan_store
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def parse(self, expression: str) -> ParseResult:
+        """Parse *expression*, reusing a cached result when available."""
+        return _result(self._lookup(expression), expression)
+
+    def parse_many(
+        self, expressions: Iterable[str], *, processes: int | None = None
+    ) -> BatchParseResult:
+        """Parse a batch, parsing each distinct normalized expression once.
+
+        Expressions already in the cache are reused. When *processes* is
+        greater than one and at least ``PARSE_POOL_THRESHOLD`` expressions
+        need parsing, they are parsed across a process pool of that size.
+        Every input still gets its own result, with its own AST.
+        """
+        expressions = list(expressions)
+        keys = [normalize_expression(e) for e in expressions]
+        unique = list(dict.fromkeys(keys))
+
+        entries: dict[str, _Entry] = {}
+        missing: list[str] = []
+        with self._lock:
+            for key in unique:
+                entry = self._entries.get(key)
+                if entry is None:
+                    missing.append(key)
+                else:
+                    self._entries.move_to_end(key)
+                    entries[key] = entry
+            self._hits += len(entries)
+            self._misses += len(missing)
+
+        stored = self._from_store(missing)
+        entries.update(stored)
+        missing = [key for key in missing if key not in stored]
+
+        workers = processes or 1  # None: parse in this process
+        if workers > 1 and len(missing) >= PARSE_POOL_THRESHOLD:
+            # Imported here: it pulls in multiprocessing, which plain rolls
+            # never need.
+            from concurrent.futures import ProcessPoolExecutor
+
+            chunksize = max(1, len(missing) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parsed = list(pool.map(parse, missing, chunksize=chunksize))
+        else:
+            parsed = [parse(key) for key in missing]
+        fresh = {key: _Entry(result) for key, result in zip(missing, parsed)}
+        entries.update(fresh)
+        self._to_store(fresh)
+        for key, entry in {**stored, **fresh}.items():
+            self._store(key, entry)
+
+        return BatchParseResult(
+            results=[_result(entries[k], e) for k, e in zip(keys, expressions)],
+            unique=len(unique),
+            cache_hits=len(unique) - len(missing),
+            parsed=len(missing),
+        )
+
+    def plan(self, expression: str) -> ExecutionPlan:
+        """Return the shared, immutable execution plan for *expression*.
+
+        Raises:
+            DiceParseError: If the expression cannot be parsed.
+        """
+        entry = self._lookup(expression)
+        if entry.result.errors:
+            raise _errors(entry, expression)[0]
+        return _plan(entry)
+
+    def compiled(self, expression: str) -> CompiledExpression:
+        """Return the shared code-generated callable for *expression*.
+
+        Raises:
+            DiceParseError: If the expression cannot be parsed.
+        """
+        plan = self.plan(expression)
+        with self._lock:
+            entry = self._entries.get(normalize_expression(expression))
+        if entry is None:  # caching disabled or already evicted
+            return CompiledExpression(plan)
+        if entry.compiled is None:
+            entry.compiled = CompiledExpression(plan)
+        return entry.compiled
+
+    def resize(self, maxsize: int) -> None:
+        """Change the capacity, evicting least-recently-used entries."""
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be >= 0, got {maxsize}")
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self._maxsize,
+                currsize=len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, expression: object) -> bool:
+        if not isinstance(expression, str):
+            return False
+        return normalize_expression(expression) in self._entries
+
+    def _lookup(self, expression: str) -> _Entry:
+        key = normalize_expression(expression)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        if entry is None:
+            entry = self._from_store([key]).get(key)
+            if entry is None:
+                entry = _Entry(parse(key))
+                self._to_store({key: entry})
+            self._store(key, entry)
+        return entry
+
+    def _from_store(self, keys: list[str]) -> dict[str, _Entry]:
+        store = self.plan_store
+        if store is None:
+            return {}
+        found: dict[str, _Entry] = {}
+        for key in keys:
+            plan = store.get(key)
+            if plan is not None:
+                result = ParseResult(
+                    ast=plan.instantiate(),
+                    expression=key,
+                    syntax_version=plan.syntax_version,
+                )
+                found[key] = _Entry(result, plan)
+        return found
+
+    def _to_store(self, entries: dict[str, _Entry]) -> None:
+        store = self.plan_store
+        if store is None or store.readonly:
+            return
+        store.put_many(
+            (key, _plan(entry))
+            for key, entry in entries.items()
+            if not entry.result.errors
+        )
+
+    def _store(self, key: str, entry: _Entry) -> None:
+        with self._lock:
+            if self._maxsize == 0:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+def _result(entry: _Entry, expression: str) -> ParseResult:
+    """Build a caller-owned ParseResult for *expression* from *entry*."""
+    if entry.result.errors:
+        return ParseResult(
+            ast=RollExpression(expression=expression, children=[], label=None),
+            expression=expression,
+            syntax_version=entry.result.syntax_version,
+            errors=_errors(entry, expression),
+        )
+    return ParseResult(
+        ast=_plan(entry).instantiate(),
+        expression=expression,
+        syntax_version=entry.result.syntax_version,
+    )
+
+
+def _errors(entry: _Entry, expression: str) -> list[DiceParseError]:
+    stripped = expression.lstrip()
+    offset = len(expression) - len(stripped) if stripped else 0
+    return [
+        replace(
+            e,
+            expression=expression,
+            position=None if e.position is None else e.position + offset,
+        )
+        for e in entry.result.errors
+    ]
+
+
+def _plan(entry: _Entry) -> ExecutionPlan:
+    # Compiled lazily; a race only compiles the same immutable plan twice.
+    if entry.plan is None:
+        entry.plan = compile_plan(entry.result)
+    return entry.plan
+
+
+expression_cache = ExpressionCache()
+
+
+def parse_many(
+    expressions: Iterable[str], *, processes: int | None = None
+) -> BatchParseResult:
+    """Parse a batch through the shared :data:`expression_cache`.
+
+    See :meth:`ExpressionCache.parse_many`.
+    """
+    return expression_cache.parse_many(expressions, processes=processes)
@@ -3,3 +3,9 @@ MAX_EXPLOSIONS = 100
 MAX_EXPRESSION_DEPTH = 10
 MAX_EXPRESSION_LENGTH = 500
 SYNTAX_VERSION = "1.0"
+PARSE_CACHE_SIZE = 1024
+PARSE_POOL_THRESHOLD = 4096
+PACKED_RESULTS_THRESHOLD = 64
+MAX_HISTOGRAM_DICE = 10_000_000
+BATCH_CHUNK_ROWS = 4096
+ENTROPY_BLOCK_SIZE = 4096
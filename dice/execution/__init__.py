@@ -1,9 +1,22 @@
+from dice.execution.batch import BatchExecutionResult, execute_many
+from dice.execution.codegen import CompiledExpression, compile_expression
 from dice.execution.config import ExecutionConfig
 from dice.execution.executor import execute
+from dice.execution.optimizer import optimize
+from dice.execution.partial import reroll_term
+from dice.execution.plan import ExecutionPlan, compile_plan
 from dice.execution.result import ExecutionResult
 
 __all__ = [
+    "BatchExecutionResult",
+    "CompiledExpression",
     "ExecutionConfig",
+    "ExecutionPlan",
     "ExecutionResult",
+    "compile_expression",
+    "compile_plan",
     "execute",
+    "execute_many",
+    "optimize",
+    "reroll_term",
 ]
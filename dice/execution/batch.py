@@ -0,0 +1,313 @@
+"""Batched execution: roll one plan many times, column by column.
+
+:func:`execute_many` walks the plan once per chunk of rows instead of once
+per row. Each node yields a column holding its value in every row, or a
+single number when it is the same in all of them. Dice are drawn for the
+whole chunk in one go and summed per row; keep/drop pools sum a slice of
+each row's sorted dice. Other modifiers, and term types without a column
+implementation (groups, third-party terms), run row by row. The totals,
+and optionally one column per term, are returned as compact :mod:`array`
+columns.
+
+Every row gets the limits of one execution: the static depth, dice and
+cost limits are checked once, and each row that runs explode/reroll
+modifiers or fallback terms draws from an :class:`~dice.rng.ExecutionBudget` of its
+own. With ``max_rng_draws`` or ``timeout`` set, every draw goes through the
+row's budget.
+"""
+
+from __future__ import annotations
+
+import operator
+from array import array
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from dice.constants import BATCH_CHUNK_ROWS
+from dice.execution.config import ExecutionConfig
+from dice.execution.evaluator import (
+    _EvalContext,
+    check_cost,
+    check_dice,
+    check_histogram_dice,
+    evaluate_tree,
+    rolls_histogram,
+)
+from dice.execution.plan import (
+    DiceNode,
+    ExecutionPlan,
+    FateDiceNode,
+    FunctionNode,
+    NumericNode,
+    OperatorNode,
+    ParentheticalNode,
+    PlanNode,
+    compile_plan,
+)
+from dice.execution.totals import _check_depth
+from dice.modifiers.registry import ModifierPlan
+from dice.rng import RNG, DefaultRNG, roll_dice
+from dice.terms import RollExpression
+from dice.terms.die_histogram import (
+    DieHistogram,
+    apply_histogram_modifiers,
+    histogram_supports,
+)
+from dice.terms.die_result import DieResult
+from dice.terms.function_term import FUNCTIONS
+
+# A node's values for every row of a chunk, or one value shared by all rows.
+Column = list | int | float
+
+# Keep/drop modifier key -> the slice of *count* sorted dice it keeps, for
+# an argument *n*. (Not slice(-n, None): -0 would select every die.)
+_KEEP_SLICES: dict[str, Callable[[int, int], slice]] = {
+    "kh": lambda n, count: slice(max(count - n, 0), None),
+    "k": lambda n, count: slice(max(count - n, 0), None),
+    "kl": lambda n, count: slice(None, n),
+    "dh": lambda n, count: slice(None, max(count - n, 0)),
+    "dl": lambda n, count: slice(n, None),
+}
+
+_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.floordiv,
+}
+
+
+@dataclass(frozen=True)
+class BatchExecutionResult:
+    """The outcome of :func:`execute_many`.
+
+    ``totals`` holds one total per row. ``columns``, when requested, maps
+    the id of every dice, parenthetical, function and group term to its
+    total in each row. Columns are ``array('q')``, or ``array('d')`` once
+    a value is not an integer.
+    """
+
+    totals: array
+    columns: dict[str, array] | None
+    expression: str
+    syntax_version: str
+
+    def __len__(self) -> int:
+        return len(self.totals)
+
+
+def execute_many(
+    source: RollExpression | ExecutionPlan,
+    n: int,
+    *,
+    rng: RNG | None = None,
+    config: ExecutionConfig | None = None,
+    columns: bool = False,
+) -> BatchExecutionResult:
+    """Execute a plan (or an AST, compiled first) *n* times.
+
+    Rows are drawn column by column, so the totals differ from those of *n*
+    calls to :func:`~dice.execution.executor.execute` with the same seeded
+    RNG, but are just as reproducible. ``config.detail`` is ignored: no
+    trees are built. With ``config.optimize`` set, and no *columns*
+    requested, the optimized plan is rolled.
+
+    Raises:
+        ValueError: If *n* is negative.
+        DiceExecutionError: If any row exceeds a safety limit.
+    """
+    if n < 0:
+        raise ValueError(f"n must be non-negative, got {n}")
+    if rng is None:
+        rng = DefaultRNG()
+    if config is None:
+        config = ExecutionConfig()
+    plan = source if isinstance(source, ExecutionPlan) else compile_plan(source)
+    if config.max_cost is not None:
+        estimate = plan.cost_estimate(
+            max_explosions=config.max_explosions,
+            histogram_threshold=config.histogram_threshold,
+        )
+        check_cost(estimate, config)
+    if config.optimize and not columns:
+        plan = plan.optimized(merge_dice=True)
+
+    _check_depth(1, config)
+    totals = array("q")
+    term_columns: dict[str, array] | None = {} if columns else None
+    for start in range(0, n, BATCH_CHUNK_ROWS):
+        chunk = _Chunk(rng, config, min(BATCH_CHUNK_ROWS, n - start), columns)
+        total = chunk.sequence(plan.children, 2)
+        totals = _extend(totals, chunk.expand(total))
+        if term_columns is not None:
+            for term_id, values in chunk.columns.items():
+                term_columns[term_id] = _extend(
+                    term_columns.get(term_id, array("q")), values
+                )
+    return BatchExecutionResult(
+        totals=totals,
+        columns=term_columns,
+        expression=plan.expression,
+        syntax_version=plan.syntax_version,
+    )
+
+
+class _Chunk:
+    """Column-wise evaluation state for one chunk of rows."""
+
+    def __init__(
+        self, rng: RNG, config: ExecutionConfig, rows: int, columns: bool
+    ) -> None:
+        self.rng = rng
+        self.config = config
+        self.rows = rows
+        self.columns: dict[str, list] = {}
+        self.keep_columns = columns
+        # Draws must be counted (and timed) per row.
+        self.limited = config.max_rng_draws is not None or config.timeout is not None
+        # Dice and histogram dice rolled per row so far; the same in every row.
+        self.total_dice_rolled = 0
+        self.histogram_dice_rolled = 0
+        self._contexts: list[_EvalContext | None] = [None] * rows
+
+    def context(self, row: int) -> _EvalContext:
+        """Return the evaluation context (and budget) of *row*."""
+        ctx = self._contexts[row]
+        if ctx is None:
+            ctx = self._contexts[row] = _EvalContext(self.rng, self.config)
+        return ctx
+
+    def expand(self, column: Column) -> list:
+        return column if isinstance(column, list) else [column] * self.rows
+
+    def sequence(self, nodes: tuple[PlanNode, ...], depth: int) -> Column:
+        items = [self.node(node, depth) for node in nodes]
+        if not items:
+            return 0
+        result: Column = 0
+        pending = "+"
+        product = items[0]
+        for i in range(1, len(items) - 1, 2):
+            op, right = items[i], items[i + 1]
+            if op == "*" or op == "/":
+                product = _apply(_OPERATORS[op], product, right)
+            else:
+                result = _apply(_OPERATORS[pending], result, product)
+                pending = op
+                product = right
+        return _apply(_OPERATORS[pending], result, product)
+
+    def node(self, node: PlanNode, depth: int) -> Any:
+        _check_depth(depth, self.config)
+        if type(node) is OperatorNode:
+            return node.operator
+        if type(node) is NumericNode:
+            return node.value
+        column: Column
+        if type(node) is DiceNode:
+            column = self.dice(node, node.faces, 0)
+        elif type(node) is FateDiceNode:
+            column = self.dice(node, 3, -2)
+        elif type(node) is ParentheticalNode:
+            column = self.sequence(node.children, depth + 1)
+        elif type(node) is FunctionNode:
+            fn = FUNCTIONS[node.function]
+            inner = self.sequence(node.children, depth + 1)
+            column = [fn(v) for v in inner] if isinstance(inner, list) else fn(inner)
+        else:
+            column = self.fallback(node, depth)
+        if self.keep_columns:
+            self.columns[node.id] = self.expand(column)
+        return column
+
+    def dice(self, node: DiceNode | FateDiceNode, faces: int, shift: int) -> Column:
+        count = node.count
+        steps = node.modifier_plan
+        if rolls_histogram(count, faces, histogram_supports(steps), self.config):
+            self.histogram_dice_rolled += count
+            check_histogram_dice(self.histogram_dice_rolled, self.config)
+            column = []
+            for row in range(self.rows):
+                rng = self.context(row).rng if self.limited else self.rng
+                histogram = DieHistogram.roll(count, faces, rng, low=1 + shift)
+                apply_histogram_modifiers(histogram, steps)
+                column.append(histogram.kept_total())
+            return column
+
+        self.total_dice_rolled += count
+        check_dice(self.total_dice_rolled, self.config)
+
+        if self.limited:
+            column = []
+            for row in range(self.rows):
+                rng = self.context(row).rng
+                values = [v + shift for v in roll_dice(count, faces, rng)]
+                column.append(_roll_modifiers(values, steps, rng, faces))
+            return column
+
+        draws = roll_dice(self.rows * count, faces, self.rng)
+        if shift:
+            draws = [v + shift for v in draws]
+        if not steps:
+            if count == 1:
+                return draws
+            return [sum(draws[i : i + count]) for i in range(0, len(draws), count)]
+
+        rows = range(0, len(draws), count)
+        if histogram_supports(steps):
+            # Each keep/drop step re-ranks every die, so the last one decides
+            # which dice are kept: a slice of the sorted values.
+            spec = steps[-1].spec
+            n = spec.argument if spec.argument is not None else 1
+            keep = _KEEP_SLICES[spec.key](n, count)
+            return [sum(sorted(draws[i : i + count])[keep]) for i in rows]
+        return [
+            _roll_modifiers(draws[i : i + count], steps, self.context(row).rng, faces)
+            for row, i in enumerate(rows)
+        ]
+
+    def fallback(self, node: PlanNode, depth: int) -> list:
+        column = []
+        rolled = self.total_dice_rolled
+        for row in range(self.rows):
+            ctx = self.context(row)
+            ctx.current_depth = depth - 1
+            ctx.total_dice_rolled = rolled
+            term = node.instantiate()
+            evaluate_tree(term, ctx)
+            column.append(term.total)
+            self.total_dice_rolled = ctx.total_dice_rolled
+        return column
+
+
+def _roll_modifiers(
+    values: list[int], steps: ModifierPlan, rng: RNG, faces: int
+) -> int:
+    results = [DieResult(value=v) for v in values]
+    for step in steps:
+        results = step.fn(results, step.spec, rng, faces)
+    return sum([d.value for d in results if d.kept])
+
+
+def _apply(fn: Callable[[Any, Any], Any], left: Column, right: Column) -> Column:
+    if isinstance(left, list):
+        if isinstance(right, list):
+            return list(map(fn, left, right))
+        return [fn(a, right) for a in left]
+    if isinstance(right, list):
+        return [fn(left, b) for b in right]
+    return fn(left, right)
+
+
+def _extend(column: array, values: list) -> array:
+    """Append *values* to *column*, widening it to floats if needed."""
+    if column.typecode == "q":
+        size = len(column)
+        try:
+            column.extend(values)
+            return column
+        except (TypeError, OverflowError):
+            del column[size:]
+            column = array("d", column)
+    column.extend(values)
+    return column
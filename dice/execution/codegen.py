@@ -0,0 +1,404 @@
+"""Compile an execution plan into generated, straight-line Python code.
+
+The tree-walking executor pays for the recursive walk, a virtual
+``evaluate()`` call per term and the :func:`compute_infix_total` loop on
+every roll. For hot expressions, :func:`compile_expression` instead emits
+the source of one function per expression that draws from the RNG, applies
+the resolved modifier plans and combines the results with native Python
+operators, then ``exec``s it once.
+
+Generated functions draw from the RNG in exactly the same order as
+:func:`execute`, so results agree under a seeded RNG. Pools that
+``ExecutionConfig.histogram_threshold`` selects are rolled as face
+histograms, as :func:`execute` rolls them. Term types without a code
+generator (groups, third-party terms) are instantiated and evaluated in
+place from their plan node; their dice are always rolled one by one.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from dice.errors import DiceExecutionError
+from dice.execution.config import ExecutionConfig
+from dice.execution.evaluator import (
+    check_cost,
+    check_dice,
+    check_histogram_dice,
+    new_budget,
+)
+from dice.execution.plan import (
+    DiceNode,
+    ExecutionPlan,
+    FateDiceNode,
+    FunctionNode,
+    NumericNode,
+    OperatorNode,
+    ParentheticalNode,
+    PlanNode,
+    compile_plan,
+)
+from dice.execution.result import ExecutionResult
+from dice.grammar import ParseResult
+from dice.rng import RNG, DefaultRNG, roll_dice
+from dice.terms import DiceTerm, RollExpression, RollTerm
+from dice.terms.die_histogram import (
+    DieHistogram,
+    apply_histogram_modifiers,
+    histogram_applies,
+    histogram_supports,
+)
+from dice.terms.die_result import DieResult
+from dice.terms.function_term import FUNCTIONS
+
+# Dice counts up to this are unrolled into a chain of randint() calls.
+UNROLL_LIMIT = 8
+
+_DEFAULT_CONFIG = ExecutionConfig()
+
+
+class CompiledExpression:
+    """A dice expression compiled to native Python callables.
+
+    Safety limits are checked against the expression's static dice counts
+    and depth on every call, with the same error codes as :func:`execute`.
+    """
+
+    def __init__(self, plan: ExecutionPlan) -> None:
+        self.plan = plan
+        self.expression = plan.expression
+        self.syntax_version = plan.syntax_version
+
+        self.total_source, self._roll_total, self._budgeted, histograms = _generate(
+            plan, tree=False
+        )
+        self.tree_source, self._roll_tree, _, _ = _generate(plan, tree=True)
+
+        ast = plan.instantiate()
+        self._depth = _depth(ast)
+        # (count, faces) of every pool, and whether it may be a histogram.
+        self._pools = tuple(_pools(ast, histograms))
+        self._dice = sum(count for count, _, _ in self._pools)
+
+    def roll_total(
+        self, rng: RNG | None = None, config: ExecutionConfig | None = None
+    ) -> int | float:
+        """Roll the expression and return only its total."""
+        config = config or _DEFAULT_CONFIG
+        self._check_limits(config)
+        return self._roll_total(self._rng(rng, config), config.histogram_threshold)
+
+    def roll(
+        self, rng: RNG | None = None, config: ExecutionConfig | None = None
+    ) -> ExecutionResult:
+        """Roll the expression and return the execution result.
+
+        The tree is omitted when ``config.detail`` is ``"total"``.
+        """
+        config = config or _DEFAULT_CONFIG
+        self._check_limits(config)
+        rng = self._rng(rng, config)
+        threshold = config.histogram_threshold
+        if config.detail == "total":
+            total, tree = self._roll_total(rng, threshold), None
+        else:
+            total, tree = self._roll_tree(rng, threshold)
+        return ExecutionResult(
+            tree=tree,
+            total=total,
+            expression=self.expression,
+            syntax_version=self.syntax_version,
+        )
+
+    def _rng(self, rng: RNG | None, config: ExecutionConfig) -> RNG:
+        if rng is None:
+            rng = DefaultRNG()
+        # Straight-line code with no modifiers or fallback terms can only
+        # exhaust the draw and time limits, and its dice are counted up
+        # front, so it skips the budget when those limits are off.
+        limited = config.max_rng_draws is not None or config.timeout is not None
+        if self._budgeted or limited:
+            return new_budget(rng, config)
+        return rng
+
+    def _check_limits(self, config: ExecutionConfig) -> None:
+        threshold = config.histogram_threshold
+        if config.max_cost is not None:
+            estimate = self.plan.cost_estimate(
+                max_explosions=config.max_explosions, histogram_threshold=threshold
+            )
+            check_cost(estimate, config)
+        if self._depth > config.max_depth:
+            raise DiceExecutionError(
+                code="MAX_DEPTH_EXCEEDED",
+                message=(
+                    f"Expression depth ({config.max_depth + 1}) "
+                    f"exceeds maximum ({config.max_depth})"
+                ),
+            )
+        if self._dice <= config.max_dice and (
+            threshold is None or self._dice <= config.max_histogram_dice
+        ):
+            return
+        # Count the pools in the evaluator's order, to fail on the same one.
+        rolled = histogram = 0
+        for count, faces, supported in self._pools:
+            if supported and histogram_applies(count, faces, threshold):
+                histogram += count
+                check_histogram_dice(histogram, config)
+            else:
+                rolled += count
+                check_dice(rolled, config)
+
+
+def compile_expression(
+    source: ParseResult | RollExpression | ExecutionPlan,
+) -> CompiledExpression:
+    """Compile a parse result, AST or plan into a :class:`CompiledExpression`.
+
+    Raises:
+        DiceParseError: If *source* is a ``ParseResult`` with errors.
+    """
+    if not isinstance(source, ExecutionPlan):
+        source = compile_plan(source)
+    return CompiledExpression(source)
+
+
+def _depth(term: RollTerm) -> int:
+    return 1 + max((_depth(c) for c in term.child_terms()), default=0)
+
+
+def _pools(term: RollTerm, histograms: set[str]) -> list[tuple[int, int, bool]]:
+    # Post-order, matching the order in which the evaluator counts dice.
+    pools = [pool for c in term.child_terms() for pool in _pools(c, histograms)]
+    if isinstance(term, DiceTerm):
+        pools.append((term.count, term.faces, term.id in histograms))
+    return pools
+
+
+def _generate(
+    plan: ExecutionPlan, *, tree: bool
+) -> tuple[str, Callable[..., Any], bool, set[str]]:
+    """Return the source and function for *plan*.
+
+    Also returns whether the function spends a budget, and the ids of the
+    pools it rolls as histograms when the threshold allows.
+    """
+    gen = _CodeGen(tree)
+    value, children = gen.sequence(plan.children)
+    if tree:
+        root = plan.instantiate()
+        gen.emit(f"total = {value}")
+        fields = [
+            ("id", repr(plan.id)),
+            ("kind", repr(root.kind)),
+            ("expression", repr(plan.expression)),
+            ("children", _list(children)),
+            ("total", "total"),
+        ]
+        if plan.label:
+            fields.append(("label", repr(plan.label)))
+        gen.emit(f"return total, {_dict(fields)}")
+    else:
+        gen.emit(f"return {value}")
+
+    header = "def _roll(rng, threshold=None):\n    randint = rng.randint\n"
+    source = header + "\n".join(gen.lines)
+    namespace = dict(gen.namespace)
+    exec(compile(source, f"<dice {plan.expression!r}>", "exec"), namespace)
+    return source, namespace["_roll"], gen.budgeted, gen.histograms
+
+
+class _CodeGen:
+    def __init__(self, tree: bool) -> None:
+        self.tree = tree
+        self.lines: list[str] = []
+        self.namespace: dict[str, Any] = {
+            "_DieHistogram": DieHistogram,
+            "_DieResult": DieResult,
+            "_apply_histogram": apply_histogram_modifiers,
+            "_roll_dice": roll_dice,
+        }
+        self._counter = 0
+        self._indent = "    "
+        # Set once the code hands the RNG to modifiers or evaluated terms.
+        self.budgeted = False
+        # Ids of the dice nodes with a histogram branch.
+        self.histograms: set[str] = set()
+
+    def emit(self, line: str) -> None:
+        self.lines.append(self._indent + line)
+
+    def name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def constant(self, value: Any) -> str:
+        name = self.name("_k")
+        self.namespace[name] = value
+        return name
+
+    def sequence(self, nodes: tuple[PlanNode, ...]) -> tuple[str, list[str]]:
+        """Return the value expression and tree expressions of an infix sequence."""
+        if not nodes:
+            return "0", []
+        values: list[str] = []
+        trees: list[str] = []
+        for node in nodes:
+            value, tree = self.node(node)
+            values.append(value)
+            trees.append(tree)
+        return "(" + " ".join(values) + ")", trees
+
+    def node(self, node: PlanNode) -> tuple[str, str]:
+        if type(node) is NumericNode:
+            return self.numeric(node)
+        if type(node) is OperatorNode:
+            return self.operator(node)
+        if type(node) is DiceNode or type(node) is FateDiceNode:
+            return self.dice(node)
+        if type(node) is ParentheticalNode:
+            return self.parenthetical(node)
+        if type(node) is FunctionNode:
+            return self.function(node)
+        return self.fallback(node)
+
+    def numeric(self, node: NumericNode) -> tuple[str, str]:
+        value = repr(node.value)
+        if node.value < 0:
+            value = f"({value})"
+        fields = [
+            ("id", repr(node.id)),
+            ("kind", repr("numeric_term")),
+            ("value", value),
+        ]
+        return value, _dict(fields)
+
+    def operator(self, node: OperatorNode) -> tuple[str, str]:
+        fields = [
+            ("id", repr(node.id)),
+            ("kind", repr("operator_term")),
+            ("operator", repr(node.operator)),
+        ]
+        return ("//" if node.operator == "/" else node.operator), _dict(fields)
+
+    def dice(self, node: DiceNode | FateDiceNode) -> tuple[str, str]:
+        term = node.instantiate()
+        value = self.name("v")
+        fields = [
+            ("id", repr(node.id)),
+            ("kind", repr(term.kind)),
+            ("notation", repr(term.notation)),
+        ]
+        if term.faces > term.count or not histogram_supports(node.modifier_plan):
+            dice = self.pool(node, term, value)
+            fields += [("dice", dice), ("total", value)]
+            return value, _dict(fields)
+
+        # Rolled as a histogram, as the evaluator would, at a low enough
+        # threshold; the tree then has a "histogram" entry instead of "dice".
+        self.histograms.add(node.id)
+        histogram = self.name("h")
+        rolled = self.name("d")
+        self.emit(f"if threshold is not None and threshold <= {term.count}:")
+        self._indent += "    "
+        self.emit(
+            f"{histogram} = _DieHistogram.roll({term.count}, {term.faces}, rng, "
+            f"low={term.lowest_face})"
+        )
+        if node.modifier_plan:
+            steps = self.constant(node.modifier_plan)
+            self.emit(f"_apply_histogram({histogram}, {steps})")
+        self.emit(f"{value} = {histogram}.kept_total()")
+        if self.tree:
+            self.emit(f"{rolled} = {{'histogram': {histogram}.to_list()}}")
+        self._indent = self._indent[:-4]
+        self.emit("else:")
+        self._indent += "    "
+        dice = self.pool(node, term, value)
+        if self.tree:
+            self.emit(f"{rolled} = {{'dice': {dice}}}")
+        self._indent = self._indent[:-4]
+        if not self.tree:
+            return value, ""
+        body = ", ".join(f"{key!r}: {expr}" for key, expr in fields)
+        return value, f"{{{body}, **{rolled}, 'total': {value}}}"
+
+    def pool(self, node: DiceNode | FateDiceNode, term: DiceTerm, value: str) -> str:
+        """Emit the die-by-die roll of a pool into *value*; return its dice."""
+        faces = term.faces
+        fate = type(node) is FateDiceNode
+        offset = " - 2" if fate else ""
+        draw = f"randint(1, {faces}){offset}"
+        # Pools that are not unrolled into randint() calls are drawn in bulk.
+        pool = f"_roll_dice({term.count}, {faces}, rng)"
+        results = self.name("r")
+
+        if node.modifier_plan:
+            steps = self.constant(node.modifier_plan)
+            self.budgeted = True
+            self.emit(f"{results} = [_DieResult(x{offset}) for x in {pool}]")
+            self.emit(f"for step in {steps}:")
+            self.emit(f"    {results} = step.fn({results}, step.spec, rng, {faces})")
+            self.emit(f"{value} = sum([d.value for d in {results} if d.kept])")
+            return f"[d.to_dict() for d in {results}]"
+        if self.tree:
+            if fate:
+                pool = f"[x{offset} for x in {pool}]"
+            self.emit(f"{results} = {pool}")
+            self.emit(f"{value} = sum({results})")
+            return f"[{{'value': x, 'kept': True}} for x in {results}]"
+        if term.count == 0:
+            self.emit(f"{value} = 0")
+        elif term.count <= UNROLL_LIMIT:
+            self.emit(f"{value} = " + " + ".join([f"({draw})"] * term.count))
+        else:
+            total = f"sum({pool})" + (f" - {2 * term.count}" if fate else "")
+            self.emit(f"{value} = {total}")
+        return ""
+
+    def parenthetical(self, node: ParentheticalNode) -> tuple[str, str]:
+        inner, children = self.sequence(node.children)
+        if not self.tree:
+            return inner, ""
+        value = self.name("v")
+        self.emit(f"{value} = {inner}")
+        fields = [
+            ("id", repr(node.id)),
+            ("kind", repr("parenthetical_term")),
+            ("expression", repr(node.expression)),
+            ("children", _list(children)),
+            ("total", value),
+        ]
+        return value, _dict(fields)
+
+    def function(self, node: FunctionNode) -> tuple[str, str]:
+        inner, children = self.sequence(node.children)
+        fn = self.constant(FUNCTIONS[node.function])
+        if not self.tree:
+            return f"{fn}({inner})", ""
+        value = self.name("v")
+        self.emit(f"{value} = {fn}({inner})")
+        fields = [
+            ("id", repr(node.id)),
+            ("kind", repr("function_term")),
+            ("function", repr(node.function)),
+            ("children", _list(children)),
+            ("total", value),
+        ]
+        return value, _dict(fields)
+
+    def fallback(self, node: PlanNode) -> tuple[str, str]:
+        source = self.constant(node)
+        term = self.name("t")
+        self.budgeted = True
+        self.emit(f"{term} = {source}.instantiate().evaluate(rng)")
+        return f"{term}.total", f"{term}.to_dict()"
+
+
+def _dict(fields: list[tuple[str, str]]) -> str:
+    return "{" + ", ".join(f"{key!r}: {value}" for key, value in fields) + "}"
+
+
+def _list(items: list[str]) -> str:
+    return "[" + ", ".join(items) + "]"
@@ -2,13 +2,60 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from dice.constants import MAX_DICE_COUNT, MAX_EXPLOSIONS, MAX_EXPRESSION_DEPTH
+from dice.constants import (
+    MAX_DICE_COUNT,
+    MAX_EXPLOSIONS,
+    MAX_EXPRESSION_DEPTH,
+    MAX_HISTOGRAM_DICE,
+)
+
+DETAIL_LEVELS = ("full", "total")
 
 
 @dataclass
 class ExecutionConfig:
-    """Safety limits and execution options."""
+    """Safety limits and execution options.
+
+    ``detail`` says how much of the result the caller needs: ``"full"`` for
+    the complete execution tree, ``"total"`` when only the total matters.
+    ``optimize`` enables the :mod:`dice.execution.optimizer` pass. It always
+    applies to total-only executions (including dice merging); for full
+    executions the reported tree keeps the original structure unless
+    ``preserve_structure`` is turned off, in which case constants are folded.
+
+    Pools of at least ``histogram_threshold`` dice, with no more faces than
+    dice, whose modifiers are all keep/drop are rolled as per-face counts
+    (:class:`~dice.terms.die_histogram.DieHistogram`) at O(faces) cost, and
+    reported in the tree as a ``histogram`` instead of a ``dice`` list.
+    Those dice count towards ``max_histogram_dice`` rather than
+    ``max_dice``. Off (``None``) by default.
+
+    ``max_cost`` is an admission limit: an expression whose estimated cost
+    (:attr:`~dice.analysis.CostEstimate.cost`, its expected number of draws)
+    exceeds it is rejected before anything is rolled. Off (``None``) by
+    default.
+
+    Each execution draws from one :class:`~dice.rng.ExecutionBudget`:
+    ``max_explosions`` caps explosions and rerolls across the whole
+    expression, ``max_rng_draws`` caps RNG draws and ``timeout`` caps the
+    wall-clock seconds spent rolling. The last two are off (``None``) by
+    default.
+    """
 
     max_dice: int = MAX_DICE_COUNT
     max_depth: int = MAX_EXPRESSION_DEPTH
     max_explosions: int = MAX_EXPLOSIONS
+    detail: str = "full"
+    optimize: bool = False
+    preserve_structure: bool = True
+    histogram_threshold: int | None = None
+    max_histogram_dice: int = MAX_HISTOGRAM_DICE
+    max_cost: float | None = None
+    max_rng_draws: int | None = None
+    timeout: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.detail not in DETAIL_LEVELS:
+            raise ValueError(
+                f"detail must be one of {DETAIL_LEVELS}, got {self.detail!r}"
+            )
@@ -1,56 +1,128 @@
-"""Depth-first AST evaluator with safety limit enforcement."""
+"""Single-pass, depth-first AST evaluator with safety limit enforcement."""
 
 from __future__ import annotations
 
+from dice.analysis import CostEstimate
 from dice.errors import DiceExecutionError
 from dice.execution.config import ExecutionConfig
-from dice.rng import RNG
+from dice.rng import RNG, ExecutionBudget
 from dice.terms.base import RollTerm
 from dice.terms.dice_term import DiceTerm
+from dice.terms.die_histogram import histogram_applies
 
 
 class _EvalContext:
     """Mutable state tracked across the recursive evaluation walk."""
 
     def __init__(self, rng: RNG, config: ExecutionConfig) -> None:
-        self.rng = rng
+        self.rng = new_budget(rng, config)
         self.config = config
         self.total_dice_rolled = 0
+        self.histogram_dice_rolled = 0
         self.current_depth = 0
 
+    def count_histogram_dice(self, count: int) -> None:
+        """Charge a histogram pool against ``config.max_histogram_dice``."""
+        self.histogram_dice_rolled += count
+        check_histogram_dice(self.histogram_dice_rolled, self.config)
 
-def evaluate_tree(root: RollTerm, ctx: _EvalContext) -> None:
-    """Recursively evaluate *root* and all its children, enforcing limits."""
-    ctx.current_depth += 1
-    if ctx.current_depth > ctx.config.max_depth:
+    def count_dice(self, count: int) -> None:
+        """Charge a pool of dice against ``config.max_dice``."""
+        self.total_dice_rolled += count
+        check_dice(self.total_dice_rolled, self.config)
+
+
+def new_budget(rng: RNG, config: ExecutionConfig) -> ExecutionBudget:
+    """Wrap *rng* in a fresh budget for one execution under *config*."""
+    return ExecutionBudget(
+        rng,
+        max_draws=config.max_rng_draws,
+        max_iterations=config.max_explosions,
+        timeout=config.timeout,
+    )
+
+
+def rolls_histogram(
+    count: int, faces: int, supported: bool, config: ExecutionConfig
+) -> bool:
+    """Whether a pool of *count* dice is rolled as a face histogram."""
+    return supported and histogram_applies(count, faces, config.histogram_threshold)
+
+
+def check_cost(estimate: CostEstimate, config: ExecutionConfig) -> None:
+    """Refuse an expression whose estimated cost exceeds ``config.max_cost``."""
+    if config.max_cost is not None and estimate.cost > config.max_cost:
         raise DiceExecutionError(
-            code="MAX_DEPTH_EXCEEDED",
+            code="MAX_COST_EXCEEDED",
             message=(
-                f"Expression depth ({ctx.current_depth}) "
-                f"exceeds maximum ({ctx.config.max_depth})"
+                f"Estimated cost ({estimate.cost:g}) "
+                f"exceeds maximum ({config.max_cost:g})"
             ),
         )
 
-    try:
-        # If this node has children, evaluate them first (depth-first)
-        children: list[RollTerm] | None = getattr(root, "children", None)
-        if children is not None:
-            for child in children:
-                evaluate_tree(child, ctx)
-
-        # For dice terms, enforce dice count limit before rolling
-        if isinstance(root, DiceTerm) and not root._evaluated:
-            ctx.total_dice_rolled += root.count
-            if ctx.total_dice_rolled > ctx.config.max_dice:
+
+def check_dice(rolled: int, config: ExecutionConfig) -> None:
+    """Refuse to roll more than ``config.max_dice`` dice in one execution."""
+    if rolled > config.max_dice:
+        raise DiceExecutionError(
+            code="MAX_DICE_EXCEEDED",
+            message=f"Total dice rolled ({rolled}) exceeds maximum ({config.max_dice})",
+        )
+
+
+def check_histogram_dice(rolled: int, config: ExecutionConfig) -> None:
+    """Refuse to roll more than ``config.max_histogram_dice`` as histograms."""
+    if rolled > config.max_histogram_dice:
+        raise DiceExecutionError(
+            code="MAX_DICE_EXCEEDED",
+            message=(
+                f"Total dice rolled as histograms ({rolled}) "
+                f"exceeds maximum ({config.max_histogram_dice})"
+            ),
+        )
+
+
+def evaluate_tree(root: RollTerm, ctx: _EvalContext) -> None:
+    """Evaluate *root* and all its descendants once each, enforcing limits.
+
+    The walk is iterative: an explicit stack replaces recursion, so deep
+    trees are bounded by ``config.max_depth`` alone. Nodes are entered in
+    depth-first order, where the depth limit is checked, and resolved after
+    all their children, where dice are counted and rolled. *root* sits one
+    level below ``ctx.current_depth``.
+    """
+    config = ctx.config
+    max_depth = config.max_depth
+    # (term, depth, children_done) entries; a term is pushed once on entry
+    # and again, above its children, to be resolved after them.
+    stack: list[tuple[RollTerm, int, bool]] = [(root, ctx.current_depth + 1, False)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        term, depth, children_done = pop()
+        if not children_done:
+            if depth > max_depth:
                 raise DiceExecutionError(
-                    code="MAX_DICE_EXCEEDED",
+                    code="MAX_DEPTH_EXCEEDED",
                     message=(
-                        f"Total dice rolled ({ctx.total_dice_rolled}) "
-                        f"exceeds maximum ({ctx.config.max_dice})"
+                        f"Expression depth ({depth}) "
+                        f"exceeds maximum ({max_depth})"
                     ),
                 )
+            children = term.child_terms()
+            if children:
+                push((term, depth, True))
+                for child in reversed(children):
+                    push((child, depth + 1, False))
+                continue
+
+        if isinstance(term, DiceTerm):
+            supported = term.supports_histogram
+            if rolls_histogram(term.count, term.faces, supported, config):
+                ctx.count_histogram_dice(term.count)
+                term.evaluate_histogram(ctx.rng)
+                continue
+            ctx.count_dice(term.count)
 
-        # Evaluate the node itself
-        root.evaluate(ctx.rng)
-    finally:
-        ctx.current_depth -= 1
+        # Resolve the node from its already-evaluated children
+        term.resolve(ctx.rng)
@@ -1,32 +1,96 @@
 from __future__ import annotations
 
-import copy
-
+from dice.analysis import estimate_cost
 from dice.constants import SYNTAX_VERSION
 from dice.execution.config import ExecutionConfig
-from dice.execution.evaluator import _EvalContext, evaluate_tree
+from dice.execution.evaluator import _EvalContext, check_cost, evaluate_tree
+from dice.execution.optimizer import optimize
+from dice.execution.plan import ExecutionPlan
 from dice.execution.result import ExecutionResult
+from dice.execution.totals import evaluate_total
 from dice.rng import RNG, DefaultRNG
 from dice.terms import RollExpression
 
 
 def execute(
-    ast: RollExpression,
+    source: RollExpression | ExecutionPlan,
     *,
     rng: RNG | None = None,
     config: ExecutionConfig | None = None,
 ) -> ExecutionResult:
-    """Execute a parsed AST and return the execution tree."""
+    """Execute a parsed AST or a compiled plan and return the execution tree.
+
+    A ``RollExpression`` is evaluated in place. An ``ExecutionPlan`` is never
+    modified: each call evaluates a fresh term tree instantiated from it, so
+    plans are safe to share between threads and to execute repeatedly. That
+    term tree is kept by the result and serialized on first access of
+    ``tree``.
+
+    When ``config.optimize`` calls for it, an optimized copy is evaluated
+    instead (see :class:`ExecutionConfig`); the source is left untouched.
+
+    With ``config.detail == "total"`` the result's ``tree`` is ``None``. A
+    plan is then rolled straight from its nodes, without building terms or
+    a tree; an AST is still evaluated in place, but not serialized.
+
+    With ``config.max_cost`` set, the source's static cost estimate (see
+    :func:`~dice.analysis.estimate_cost`) is checked first, and nothing is
+    rolled if it is too high.
+    """
     if rng is None:
         rng = DefaultRNG()
     if config is None:
         config = ExecutionConfig()
 
-    evaluate_tree(ast, _EvalContext(rng, config))
+    rewrite = config.optimize and (
+        config.detail == "total" or not config.preserve_structure
+    )
+    merge_dice = config.detail == "total"
+
+    if config.max_cost is not None:
+        limit = config.max_explosions
+        threshold = config.histogram_threshold
+        if isinstance(source, ExecutionPlan):
+            estimate = source.cost_estimate(
+                max_explosions=limit, histogram_threshold=threshold
+            )
+        else:
+            estimate = estimate_cost(
+                source, max_explosions=limit, histogram_threshold=threshold
+            )
+        check_cost(estimate, config)
+
+    ctx = _EvalContext(rng, config)
+    if isinstance(source, ExecutionPlan):
+        if rewrite:
+            source = source.optimized(merge_dice=merge_dice)
+        if config.detail == "total":
+            return ExecutionResult(
+                tree=None,
+                total=evaluate_total(source, ctx),
+                expression=source.expression,
+                syntax_version=source.syntax_version,
+            )
+        # The instantiated terms belong to this execution alone, so the
+        # result can keep them and serialize the tree only when asked.
+        ast = source.instantiate()
+        evaluate_tree(ast, ctx)
+        return ExecutionResult(
+            tree=None,
+            total=ast.total,
+            expression=ast.expression,
+            syntax_version=source.syntax_version,
+            terms=ast,
+        )
+
+    ast = optimize(source, merge_dice=merge_dice) if rewrite else source
+    evaluate_tree(ast, ctx)
 
-    tree = copy.deepcopy(ast.to_dict())
+    # The caller owns (and may re-execute) the AST, so serialize it now.
+    # to_dict() builds new containers all the way down, so the result owns
+    # its tree outright and needs no defensive copy.
     return ExecutionResult(
-        tree=tree,
+        tree=ast.to_dict() if config.detail == "full" else None,
         total=ast.total,
         expression=ast.expression,
         syntax_version=SYNTAX_VERSION,
@@ -0,0 +1,177 @@
+"""Optional optimization pass over a parsed ``RollExpression``.
+
+The pass rewrites the term tree into a cheaper but equivalent one:
+
+* constant multiplicative chains (``4*2``) and pure-numeric parenthesized
+  or function terms (``(4*2)``, ``floor(7/2)``) fold into a single
+  ``NumericTerm``;
+* integer constants at the additive level fold into one term, so
+  ``1d20+2+3-1`` becomes ``1d20+4``;
+* with ``merge_dice=True``, unmodified dice with the same faces and sign
+  merge into one term (``1d6+1d6`` becomes ``2d6``). The total follows the
+  same distribution, but per-die structure is lost, so this is only done
+  when the caller asked for a total-only result.
+
+Folding reuses :func:`compute_infix_total`, so folded values are exactly
+what evaluation would have produced. Float constants are only folded inside
+a single evaluation unit, never re-associated across ``+``/``-``.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import TypeGuard, cast
+
+from dice.terms import (
+    DiceTerm,
+    FateDiceTerm,
+    FunctionTerm,
+    GroupTerm,
+    NumericTerm,
+    OperatorTerm,
+    ParentheticalTerm,
+    RollExpression,
+    RollTerm,
+)
+from dice.terms.eval_helpers import compute_infix_total
+
+
+def optimize(ast: RollExpression, *, merge_dice: bool = False) -> RollExpression:
+    """Return an optimized copy of *ast*; the input tree is not modified.
+
+    Args:
+        ast: An unevaluated AST.
+        merge_dice: Also merge same-sided, unmodified dice terms. Only
+            appropriate when the per-die results will not be reported.
+    """
+    ast = copy.deepcopy(ast)
+    ast.children = _optimize_sequence(ast.children, merge_dice)
+    return ast
+
+
+def _optimize_term(term: RollTerm, merge_dice: bool) -> RollTerm:
+    if type(term) is ParentheticalTerm or type(term) is FunctionTerm:
+        term.children = _optimize_sequence(term.children, merge_dice)
+        if _is_constant(term.children):
+            return _fold(term)
+    elif type(term) is GroupTerm:
+        term.children = [
+            _optimize_sequence(expr, merge_dice) for expr in term.children
+        ]
+    return term
+
+
+def _optimize_sequence(children: list[RollTerm], merge_dice: bool) -> list[RollTerm]:
+    if not children:
+        return children
+    children = [
+        c if isinstance(c, OperatorTerm) else _optimize_term(c, merge_dice)
+        for c in children
+    ]
+    if len(children) > 1 and _is_constant(children):
+        folded = _fold(RollExpression(expression="", children=children))
+        return [folded] if isinstance(folded, NumericTerm) else children
+
+    segments = [(sign, _fold_chain(chain)) for sign, chain in _segments(children)]
+    segments = _fold_integers(segments)
+    if merge_dice:
+        segments = _merge_dice(segments)
+
+    result: list[RollTerm] = []
+    for i, (sign, chain) in enumerate(segments):
+        if i:
+            result.append(OperatorTerm(operator=sign))
+        result.extend(chain)
+    return result
+
+
+def _segments(children: list[RollTerm]) -> list[tuple[str, list[RollTerm]]]:
+    """Split an infix sequence into signed ``*``/``/`` chains."""
+    segments: list[tuple[str, list[RollTerm]]] = [("+", [children[0]])]
+    for i in range(1, len(children) - 1, 2):
+        op = children[i]
+        if isinstance(op, OperatorTerm) and op.operator in ("+", "-"):
+            segments.append((op.operator, [children[i + 1]]))
+        else:
+            segments[-1][1].extend(children[i : i + 2])
+    return segments
+
+
+def _fold_chain(chain: list[RollTerm]) -> list[RollTerm]:
+    if len(chain) == 1 or not _is_constant(chain):
+        return chain
+    try:
+        return [NumericTerm(value=compute_infix_total(chain))]
+    except ZeroDivisionError:
+        return chain
+
+
+def _fold_integers(
+    segments: list[tuple[str, list[RollTerm]]],
+) -> list[tuple[str, list[RollTerm]]]:
+    indices = [i for i, (_, chain) in enumerate(segments) if _int_constant(chain)]
+    if len(indices) < 2:
+        return segments
+
+    value: int | float = 0
+    for i in indices:
+        sign, chain = segments[i]
+        term = cast(NumericTerm, chain[0])
+        value += term.value if sign == "+" else -term.value
+
+    first = indices[0]
+    folded: list[tuple[str, list[RollTerm]]] = []
+    for i, segment in enumerate(segments):
+        if i == first:
+            if first == 0:
+                folded.append(("+", [NumericTerm(value=value)]))
+            elif value:
+                sign = "+" if value > 0 else "-"
+                folded.append((sign, [NumericTerm(value=abs(value))]))
+        elif i not in indices:
+            folded.append(segment)
+    return folded
+
+
+def _merge_dice(
+    segments: list[tuple[str, list[RollTerm]]],
+) -> list[tuple[str, list[RollTerm]]]:
+    merged: list[tuple[str, list[RollTerm]]] = []
+    seen: dict[tuple[type, int, str], DiceTerm] = {}
+    for sign, chain in segments:
+        term = chain[0]
+        if len(chain) == 1 and _plain_dice(term):
+            key = (type(term), term.faces, sign)
+            target = seen.get(key)
+            if target is not None:
+                target.count += term.count
+                continue
+            seen[key] = term
+        merged.append((sign, chain))
+    return merged
+
+
+def _fold(term: RollTerm) -> RollTerm:
+    try:
+        term.resolve(None)  # type: ignore[arg-type]
+    except ZeroDivisionError:
+        return term
+    return NumericTerm(value=term.total)
+
+
+def _is_constant(children: list[RollTerm]) -> bool:
+    return all(type(c) is NumericTerm or type(c) is OperatorTerm for c in children)
+
+
+def _int_constant(chain: list[RollTerm]) -> bool:
+    return (
+        len(chain) == 1
+        and type(chain[0]) is NumericTerm
+        and type(chain[0].value) is int
+    )
+
+
+def _plain_dice(term: RollTerm) -> TypeGuard[DiceTerm]:
+    if type(term) is DiceTerm or type(term) is FateDiceTerm:
+        return not term.modifier_strings
+    return False
@@ -0,0 +1,148 @@
+"""Partial re-execution: reroll one term of an executed expression.
+
+:func:`reroll_term` re-evaluates the subtree rooted at one term of an
+:class:`~dice.execution.result.ExecutionResult` and then re-resolves only
+that term's ancestors, each from its already-evaluated children. The cost
+is the rerolled subtree plus the path to the root: the rest of the tree is
+neither rolled nor, if the result's tree was already serialized, serialized
+again.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+from dice.execution.config import ExecutionConfig
+from dice.execution.evaluator import _EvalContext, evaluate_tree
+from dice.execution.result import ExecutionResult
+from dice.rng import RNG, DefaultRNG
+from dice.terms import FunctionTerm, ParentheticalTerm, RollExpression, RollTerm
+
+# Terms whose serialized "children" are their child terms' dicts, in order.
+_PATCHABLE = (RollExpression, ParentheticalTerm, FunctionTerm)
+
+
+def reroll_term(
+    result: ExecutionResult,
+    term_id: str,
+    *,
+    rng: RNG | None = None,
+    config: ExecutionConfig | None = None,
+) -> ExecutionResult:
+    """Reroll the term *term_id* of *result* and recompute the totals above it.
+
+    *result* is updated in place and returned: its terms, ``total`` and, if
+    it was already serialized, ``tree``. Tree dicts handed out earlier are
+    not modified. The rerolled subtree is checked against the limits in
+    *config* as if it were executed on its own, at its depth in the tree.
+
+    Raises:
+        ValueError: If *result* did not keep its terms (it was executed
+            from an AST, with ``detail="total"`` or by a compiled
+            expression), or has no term *term_id*.
+        DiceExecutionError: If the reroll exceeds a safety limit. *result*
+            is then left unchanged.
+    """
+    root = result.terms
+    if root is None:
+        raise ValueError(
+            "Result has no terms to reroll; execute a plan with detail='full'"
+        )
+    path = _find_path(root, term_id)
+    if path is None:
+        raise ValueError(f"No term with id {term_id!r} in {result.expression!r}")
+    if rng is None:
+        rng = DefaultRNG()
+    if config is None:
+        config = ExecutionConfig()
+
+    # Roll a copy of the subtree, and re-resolve copies of its ancestors,
+    # so that a failed reroll changes nothing.
+    new = copy.deepcopy(path[-1])
+    ctx = _EvalContext(rng, config)
+    ctx.current_depth = len(path) - 1
+    evaluate_tree(new, ctx)
+
+    terms = [*path[:-1], new]
+    for i in range(len(path) - 2, -1, -1):
+        terms[i] = _with_child(path[i], path[i + 1], terms[i + 1])
+        terms[i].resolve(ctx.rng)
+
+    result.replace_terms(terms[0], lambda tree: _patch_tree(tree, terms))
+    return result
+
+
+def _find_path(root: RollTerm, term_id: str) -> list[RollTerm] | None:
+    """Return the terms from *root* down to the term *term_id*, inclusive."""
+    # Path ids ("0.2.1") spell out the child indices: follow them directly.
+    if root.id == "0" and (term_id == "0" or term_id.startswith("0.")):
+        path = [root]
+        for index in term_id.split(".")[1:]:
+            children = path[-1].child_terms()
+            if not index.isdigit() or int(index) >= len(children):
+                break
+            path.append(children[int(index)])
+        else:
+            if path[-1].id == term_id:
+                return path
+
+    # Otherwise search depth-first, keeping the path to each term.
+    stack = [[root]]
+    while stack:
+        path = stack.pop()
+        if path[-1].id == term_id:
+            return path
+        stack.extend(path + [child] for child in reversed(path[-1].child_terms()))
+    return None
+
+
+def _with_child(parent: RollTerm, old: RollTerm, new: RollTerm) -> RollTerm:
+    """Return a shallow copy of *parent* with *new* in place of its child *old*."""
+    # Container terms hold their children in ``children``: a list of terms,
+    # or (groups) a list of lists of terms.
+    children = getattr(parent, "children", ())
+    for i, child in enumerate(children):
+        replaced: RollTerm | list[RollTerm]
+        if child is old:
+            replaced = new
+        elif isinstance(child, list) and any(c is old for c in child):
+            replaced = [new if c is old else c for c in child]
+        else:
+            continue
+        clone = copy.copy(parent)
+        copied = [*children[:i], replaced, *children[i + 1 :]]
+        clone.children = copied  # type: ignore[attr-defined]
+        return clone
+    raise TypeError(f"Cannot replace a child of {type(parent).__name__}")
+
+
+def _patch_tree(tree: dict[str, Any], terms: list[RollTerm]) -> dict[str, Any]:
+    """Return a copy of *tree* with ``terms[-1]`` serialized in its place.
+
+    *terms* is the re-evaluated path from the root. Only the dicts along
+    the path are copied, and for ancestors that list their children's dicts
+    in order only the changed child and the total are replaced. The first
+    ancestor that does not (groups, third-party terms) is re-serialized
+    whole.
+    """
+    indices = [_index(parent, child) for parent, child in zip(terms, terms[1:])]
+    dicts = [tree]
+    for term, index in zip(terms, indices):
+        if not isinstance(term, _PATCHABLE):
+            break
+        dicts.append(dicts[-1]["children"][index])
+
+    level = len(dicts) - 1
+    patched = terms[level].to_dict()
+    for level in range(level - 1, -1, -1):
+        d = dict(dicts[level])
+        d["children"] = list(d["children"])
+        d["children"][indices[level]] = patched
+        d["total"] = terms[level].total
+        patched = d
+    return patched
+
+
+def _index(parent: RollTerm, child: RollTerm) -> int:
+    return next(i for i, c in enumerate(parent.child_terms()) if c is child)
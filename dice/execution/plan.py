@@ -0,0 +1,274 @@
+"""Immutable, re-executable execution plans.
+
+A plan is compiled once from a ``ParseResult`` (or a ``RollExpression``) and
+never mutated afterwards. Each execution instantiates a fresh, short-lived
+term tree from the plan and keeps all per-roll state there, so a single plan
+can be cached, shared between threads and executed any number of times.
+"""
+
+from __future__ import annotations
+
+import copy
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, replace
+
+from dice.analysis import CostEstimate, estimate_cost
+from dice.constants import MAX_EXPLOSIONS, SYNTAX_VERSION
+from dice.execution.optimizer import optimize
+from dice.grammar import ParseResult
+from dice.modifiers.registry import ModifierPlan, modifier_plan_for
+from dice.terms import (
+    DiceTerm,
+    FateDiceTerm,
+    FunctionTerm,
+    GroupTerm,
+    NumericTerm,
+    OperatorTerm,
+    ParentheticalTerm,
+    RollExpression,
+    RollTerm,
+)
+
+
+@dataclass(frozen=True)
+class PlanNode(ABC):
+    """Base class for the frozen nodes of an execution plan."""
+
+    id: str
+
+    @abstractmethod
+    def instantiate(self) -> RollTerm:
+        """Build a fresh, unevaluated term for one execution."""
+        ...
+
+
+@dataclass(frozen=True)
+class NumericNode(PlanNode):
+    value: int | float
+
+    def instantiate(self) -> NumericTerm:
+        return NumericTerm(value=self.value, id=self.id)
+
+
+@dataclass(frozen=True)
+class OperatorNode(PlanNode):
+    operator: str
+
+    def instantiate(self) -> OperatorTerm:
+        return OperatorTerm(operator=self.operator, id=self.id)
+
+
+@dataclass(frozen=True)
+class DiceNode(PlanNode):
+    count: int
+    faces: int
+    modifier_strings: tuple[str, ...]
+    modifier_plan: ModifierPlan
+
+    def instantiate(self) -> DiceTerm:
+        return DiceTerm(
+            count=self.count,
+            faces=self.faces,
+            modifier_strings=list(self.modifier_strings),
+            modifier_plan=self.modifier_plan,
+            id=self.id,
+        )
+
+
+@dataclass(frozen=True)
+class FateDiceNode(PlanNode):
+    count: int
+    modifier_strings: tuple[str, ...]
+    modifier_plan: ModifierPlan
+
+    def instantiate(self) -> FateDiceTerm:
+        return FateDiceTerm(
+            count=self.count,
+            modifier_strings=list(self.modifier_strings),
+            modifier_plan=self.modifier_plan,
+            id=self.id,
+        )
+
+
+@dataclass(frozen=True)
+class ParentheticalNode(PlanNode):
+    expression: str
+    children: tuple[PlanNode, ...]
+
+    def instantiate(self) -> ParentheticalTerm:
+        return ParentheticalTerm(
+            expression=self.expression,
+            children=[c.instantiate() for c in self.children],
+            id=self.id,
+        )
+
+
+@dataclass(frozen=True)
+class FunctionNode(PlanNode):
+    function: str
+    children: tuple[PlanNode, ...]
+
+    def instantiate(self) -> FunctionTerm:
+        return FunctionTerm(
+            function=self.function,
+            children=[c.instantiate() for c in self.children],
+            id=self.id,
+        )
+
+
+@dataclass(frozen=True)
+class GroupNode(PlanNode):
+    children: tuple[tuple[PlanNode, ...], ...]
+    modifier_strings: tuple[str, ...]
+
+    def instantiate(self) -> GroupTerm:
+        return GroupTerm(
+            children=[[c.instantiate() for c in expr] for expr in self.children],
+            modifier_strings=list(self.modifier_strings),
+            id=self.id,
+        )
+
+
+@dataclass(frozen=True)
+class TermNode(PlanNode):
+    """Fallback for third-party term types: copies a pristine template."""
+
+    template: RollTerm
+
+    def instantiate(self) -> RollTerm:
+        return copy.deepcopy(self.template)
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """A compiled, immutable dice expression ready for repeated execution."""
+
+    id: str
+    expression: str
+    children: tuple[PlanNode, ...]
+    label: str | None = None
+    syntax_version: str = SYNTAX_VERSION
+    # Memoized optimized variants, keyed by ``merge_dice``.
+    _optimized: dict[bool, ExecutionPlan] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Memoized cost estimates, keyed by explosion limit and histogram threshold.
+    _cost: dict[tuple[int, int | None], CostEstimate] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __getstate__(self) -> dict[str, object]:
+        # Optimized variants are a per-process memo; don't persist them.
+        return {**self.__dict__, "_optimized": {}, "_cost": {}}
+
+    def instantiate(self) -> RollExpression:
+        """Build a fresh, unevaluated AST for one execution."""
+        return RollExpression(
+            expression=self.expression,
+            children=[c.instantiate() for c in self.children],
+            label=self.label,
+            id=self.id,
+        )
+
+    def cost_estimate(
+        self,
+        *,
+        max_explosions: int = MAX_EXPLOSIONS,
+        histogram_threshold: int | None = None,
+    ) -> CostEstimate:
+        """Return the static cost estimate of this plan, computing it once.
+
+        The arguments are as in :func:`~dice.analysis.estimate_cost`.
+        """
+        key = (max_explosions, histogram_threshold)
+        estimate = self._cost.get(key)
+        if estimate is None:
+            estimate = estimate_cost(
+                self.instantiate(),
+                max_explosions=max_explosions,
+                histogram_threshold=histogram_threshold,
+            )
+            self._cost[key] = estimate
+        return estimate
+
+    def optimized(self, *, merge_dice: bool = False) -> ExecutionPlan:
+        """Return the optimized variant of this plan, compiling it once."""
+        plan = self._optimized.get(merge_dice)
+        if plan is None:
+            plan = compile_plan(optimize(self.instantiate(), merge_dice=merge_dice))
+            plan = replace(plan, syntax_version=self.syntax_version)
+            self._optimized[merge_dice] = plan
+        return plan
+
+
+def compile_plan(source: ParseResult | RollExpression) -> ExecutionPlan:
+    """Compile a parse result (or an unevaluated AST) into an execution plan.
+
+    Raises:
+        DiceParseError: If *source* is a ``ParseResult`` with errors.
+        DiceValidationError: If a hand-built dice term has modifiers that
+            cannot be resolved.
+    """
+    if isinstance(source, ParseResult):
+        if source.errors:
+            raise source.errors[0]
+        ast = source.ast
+        syntax_version = source.syntax_version
+    else:
+        ast = source
+        syntax_version = SYNTAX_VERSION
+    return ExecutionPlan(
+        id=ast.id,
+        expression=ast.expression,
+        children=_compile_children(ast.children),
+        label=ast.label,
+        syntax_version=syntax_version,
+    )
+
+
+def _compile_children(children: list[RollTerm]) -> tuple[PlanNode, ...]:
+    return tuple(_compile_node(c) for c in children)
+
+
+def _compile_node(term: RollTerm) -> PlanNode:
+    # Exact type checks: subclasses may override evaluation and must keep it.
+    # (Spelled ``type(term) is ...`` so that type checkers narrow *term*.)
+    if type(term) is NumericTerm:
+        return NumericNode(id=term.id, value=term.value)
+    if type(term) is OperatorTerm:
+        return OperatorNode(id=term.id, operator=term.operator)
+    if type(term) is FateDiceTerm:
+        return FateDiceNode(
+            id=term.id,
+            count=term.count,
+            modifier_strings=tuple(term.modifier_strings),
+            modifier_plan=modifier_plan_for(term),
+        )
+    if type(term) is DiceTerm:
+        return DiceNode(
+            id=term.id,
+            count=term.count,
+            faces=term.faces,
+            modifier_strings=tuple(term.modifier_strings),
+            modifier_plan=modifier_plan_for(term),
+        )
+    if type(term) is ParentheticalTerm:
+        return ParentheticalNode(
+            id=term.id,
+            expression=term.expression,
+            children=_compile_children(term.children),
+        )
+    if type(term) is FunctionTerm:
+        return FunctionNode(
+            id=term.id,
+            function=term.function,
+            children=_compile_children(term.children),
+        )
+    if type(term) is GroupTerm:
+        return GroupNode(
+            id=term.id,
+            children=tuple(_compile_children(expr) for expr in term.children),
+            modifier_strings=tuple(term.modifier_strings),
+        )
+    return TermNode(id=term.id, template=copy.deepcopy(term))
+
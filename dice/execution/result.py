@@ -1,14 +1,98 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from dice.terms.base import RollTerm
 
 
-@dataclass
 class ExecutionResult:
-    """The output of executing a parsed AST."""
+    """The output of executing a parsed AST.
+
+    ``total`` is available immediately. When the result is built from the
+    evaluated terms of a plan execution, ``tree`` is serialized from them on
+    first access and cached, so callers that never look at the tree never
+    pay for it. ``tree`` is ``None`` when executed with ``detail="total"``.
+
+    The result keeps those terms (see :attr:`terms`), so single terms can be
+    rerolled afterwards with :func:`~dice.execution.partial.reroll_term`.
+    """
+
+    def __init__(
+        self,
+        tree: dict[str, Any] | None,
+        total: int | float,
+        expression: str,
+        syntax_version: str,
+        *,
+        terms: RollTerm | None = None,
+    ) -> None:
+        self._tree = tree
+        # Evaluated terms owned by this result, serialized on demand.
+        self._terms = terms
+        self.total = total
+        self.expression = expression
+        self.syntax_version = syntax_version
+
+    @property
+    def tree(self) -> dict[str, Any] | None:
+        if self._tree is None and self._terms is not None:
+            self._tree = self._terms.to_dict()
+        return self._tree
+
+    @tree.setter
+    def tree(self, tree: dict[str, Any] | None) -> None:
+        self._tree = tree
+        self._terms = None
+
+    @property
+    def terms(self) -> RollTerm | None:
+        """The evaluated term tree owned by this result, if it kept one."""
+        return self._terms
+
+    def replace_terms(
+        self,
+        terms: RollTerm,
+        patch_tree: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+    ) -> None:
+        """Swap in a re-evaluated term tree, and its total.
+
+        If the tree was already serialized, *patch_tree* maps it to the new
+        tree; without *patch_tree* it is serialized again on next access.
+        """
+        tree = self._tree
+        if tree is not None and patch_tree is not None:
+            tree = patch_tree(tree)
+        else:
+            tree = None
+        self._terms = terms
+        self._tree = tree
+        self.total = terms.total
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "_tree": self.tree,
+            "_terms": None,
+            "total": self.total,
+            "expression": self.expression,
+            "syntax_version": self.syntax_version,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ExecutionResult):
+            return NotImplemented
+        return (
+            self.total == other.total
+            and self.expression == other.expression
+            and self.syntax_version == other.syntax_version
+            and self.tree == other.tree
+        )
+
+    __hash__ = None  # type: ignore[assignment]
 
-    tree: dict[str, Any]
-    total: int | float
-    expression: str
-    syntax_version: str
+    def __repr__(self) -> str:
+        return (
+            f"ExecutionResult(tree={self.tree!r}, total={self.total!r}, "
+            f"expression={self.expression!r}, "
+            f"syntax_version={self.syntax_version!r})"
+        )
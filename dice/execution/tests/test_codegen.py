@@ -0,0 +1,134 @@
+import pytest
+
+import dice
+from dice.errors import DiceExecutionError, DiceParseError
+from dice.execution import (
+    ExecutionConfig,
+    compile_expression,
+    compile_plan,
+    execute,
+)
+from dice.grammar import parse
+from dice.rng import SeededRNG
+from dice.terms import DiceTerm, GroupTerm, NumericTerm, OperatorTerm, RollExpression
+
+CORPUS = [
+    "1d20",
+    "1d20+7",
+    "3d6+1d8-2",
+    "12d6",
+    "4d6kh3",
+    "2d20kl1+5",
+    "5d10dl2",
+    "3d6!",
+    "4d6r<2",
+    "4d6ro<2",
+    "4dF",
+    "4dF+2",
+    "1d%",
+    "(2d6+3)*2",
+    "10/3+1d4",
+    "2.5*1d6",
+    "floor((1d6+5)/2)+abs(3-10)",
+    "round(1d6/4)+ceil(7/2)",
+    "1d20+2+3-1+(4*2)",
+    "0d6+1",
+    "1d20+5[attack roll]",
+]
+
+
+@pytest.mark.parametrize("expr", CORPUS)
+def test_roll_matches_execute(expr):
+    plan = compile_plan(parse(expr))
+    compiled = compile_expression(plan)
+    for seed in range(25):
+        expected = execute(plan, rng=SeededRNG(seed))
+        actual = compiled.roll(SeededRNG(seed))
+        assert actual.total == expected.total
+        assert actual.tree == expected.tree
+        assert actual.expression == expected.expression
+        assert actual.syntax_version == expected.syntax_version
+
+
+@pytest.mark.parametrize("expr", CORPUS)
+def test_roll_total_matches_execute(expr):
+    plan = compile_plan(parse(expr))
+    compiled = compile_expression(plan)
+    for seed in range(25):
+        expected = execute(plan, rng=SeededRNG(seed))
+        assert compiled.roll_total(SeededRNG(seed)) == expected.total
+
+
+def test_group_falls_back_to_evaluation():
+    group = GroupTerm(
+        children=[
+            [DiceTerm(count=2, faces=6)],
+            [NumericTerm(value=5), OperatorTerm(operator="+"), NumericTerm(value=1)],
+        ],
+        modifier_strings=["kh1"],
+    )
+    ast = RollExpression(
+        expression="{2d6, 5+1}kh1+1",
+        children=[group, OperatorTerm(operator="+"), NumericTerm(value=1)],
+    )
+    plan = compile_plan(ast)
+    compiled = compile_expression(plan)
+    for seed in range(10):
+        expected = execute(plan, rng=SeededRNG(seed))
+        assert compiled.roll(SeededRNG(seed)).tree == expected.tree
+        assert compiled.roll_total(SeededRNG(seed)) == expected.total
+
+
+def test_results_are_independent():
+    compiled = compile_expression(parse("2d6"))
+    first = compiled.roll(SeededRNG(1))
+    first.tree["children"][0]["dice"].clear()
+    second = compiled.roll(SeededRNG(1))
+    assert len(second.tree["children"][0]["dice"]) == 2
+
+
+def test_limits_checked_like_execute():
+    compiled = compile_expression(parse("3d6+3d6"))
+    with pytest.raises(DiceExecutionError, match=r"MAX_DICE_EXCEEDED.*\(6\)"):
+        compiled.roll_total(SeededRNG(1), ExecutionConfig(max_dice=5))
+    compiled = compile_expression(parse("(1d6+3)*2"))
+    with pytest.raises(DiceExecutionError, match="MAX_DEPTH_EXCEEDED"):
+        compiled.roll(SeededRNG(1), ExecutionConfig(max_depth=1))
+
+
+def test_division_by_zero_raises():
+    compiled = compile_expression(parse("1d6/0"))
+    with pytest.raises(ZeroDivisionError):
+        compiled.roll_total(SeededRNG(1))
+
+
+def test_dice_compile_is_cached():
+    assert dice.compile("1d20+7") is dice.compile(" 1d20+7 ")
+    assert dice.compile("1d20+7").roll_total(SeededRNG(3)) == dice.roll(
+        "1d20+7", rng=SeededRNG(3)
+    ).total
+
+
+def test_dice_compile_rejects_invalid():
+    with pytest.raises(DiceParseError):
+        dice.compile("1d")
+
+
+class _SingleDrawRNG:
+    """A seeded RNG without the optional ``randints`` bulk method."""
+
+    def __init__(self, seed):
+        self.randint = SeededRNG(seed).randint
+
+
+@pytest.mark.parametrize("expr", CORPUS + ["40d6", "40dF", "12d6!+3dF"])
+def test_bulk_draws_match_single_draws(expr):
+    plan = compile_plan(parse(expr))
+    compiled = compile_expression(plan)
+    total = ExecutionConfig(detail="total")
+    for seed in range(10):
+        expected = execute(plan, rng=_SingleDrawRNG(seed))
+        assert execute(plan, rng=SeededRNG(seed)).tree == expected.tree
+        assert execute(plan, rng=SeededRNG(seed), config=total).total == expected.total
+        assert compiled.roll(SeededRNG(seed)).tree == expected.tree
+        assert compiled.roll_total(SeededRNG(seed)) == expected.total
@@ -0,0 +1,58 @@
+import sys
+
+import pytest
+
+from dice.errors import DiceExecutionError
+from dice.execution import ExecutionConfig, execute
+from dice.grammar import parse
+from dice.rng import SeededRNG
+from dice.terms import DiceTerm, ParentheticalTerm, RollExpression, RollTerm
+
+
+class CountingRNG:
+    def __init__(self, seed: int) -> None:
+        self._rng = SeededRNG(seed)
+        self.draws = 0
+
+    def randint(self, a: int, b: int) -> int:
+        self.draws += 1
+        return self._rng.randint(a, b)
+
+
+@pytest.mark.parametrize(
+    "expression, dice",
+    [
+        ("1d6", 1),
+        ("((2d6 + 1) * (3d4))", 5),
+        ("floor((1d8 + 1d6) / 3) + abs(1d4 - 3)", 3),
+        ("(4d6kh3 + 2) * (1d20 + 4d4)", 9),
+    ],
+)
+def test_each_die_is_drawn_once(expression, dice):
+    rng = CountingRNG(1)
+    result = execute(parse(expression).ast, rng=rng)
+    assert rng.draws == dice
+    assert result.total == parse(expression).ast.evaluate(SeededRNG(1)).total
+
+
+def _nested(depth: int) -> RollExpression:
+    inner: RollTerm = DiceTerm(count=1, faces=1)
+    for _ in range(depth):
+        inner = ParentheticalTerm(expression="(...)", children=[inner])
+    return RollExpression(expression="...", children=[inner])
+
+
+def test_deep_trees_do_not_hit_the_recursion_limit():
+    depth = sys.getrecursionlimit() * 2
+    config = ExecutionConfig(max_depth=depth + 2, detail="total")
+    result = execute(_nested(depth), rng=SeededRNG(1), config=config)
+    assert result.total == 1
+
+
+def test_depth_limit_counts_the_root():
+    config = ExecutionConfig(max_depth=11)
+    execute(_nested(9), rng=SeededRNG(1), config=config)
+    with pytest.raises(DiceExecutionError) as exc_info:
+        execute(_nested(10), rng=SeededRNG(1), config=config)
+    assert exc_info.value.code == "MAX_DEPTH_EXCEEDED"
+    assert exc_info.value.message == "Expression depth (12) exceeds maximum (11)"
@@ -0,0 +1,84 @@
+import pytest
+
+from dice import compile, roll
+from dice.errors import DiceExecutionError
+from dice.execution import ExecutionConfig, compile_plan, execute
+from dice.grammar import parse
+from dice.rng import SeededRNG
+
+TOTAL = ExecutionConfig(detail="total")
+
+EXPRESSIONS = [
+    "1d20+5",
+    "4d6kh3",
+    "8d6!",
+    "2d20kl1 - 1",
+    "4dF + 2",
+    "3d6r<2 * 2",
+    "(2d6 + 3) * 2 - 1d4 / 2",
+    "floor((1d8 + 1d6) / 3) + abs(1d4 - 3)",
+    "10d10ro<3",
+]
+
+
+@pytest.mark.parametrize("expression", EXPRESSIONS)
+def test_total_only_matches_full_execution(expression):
+    plan = compile_plan(parse(expression))
+    for seed in range(20):
+        full = execute(plan, rng=SeededRNG(seed))
+        lean = execute(plan, rng=SeededRNG(seed), config=TOTAL)
+        assert lean.tree is None
+        assert lean.total == full.total
+        assert lean.expression == full.expression
+        assert lean.syntax_version == full.syntax_version
+
+
+def test_total_only_ast_is_evaluated_in_place():
+    ast = parse("2d6+3").ast
+    result = execute(ast, rng=SeededRNG(4), config=TOTAL)
+    assert result.tree is None
+    assert result.total == ast.total
+    assert len(ast.children[0].results) == 2
+
+
+@pytest.mark.parametrize(
+    "config, expression, code",
+    [
+        (
+            ExecutionConfig(detail="total", max_dice=5),
+            "3d6+3d6",
+            "MAX_DICE_EXCEEDED",
+        ),
+        (
+            ExecutionConfig(detail="total", max_depth=2),
+            "(1d6+3)*2",
+            "MAX_DEPTH_EXCEEDED",
+        ),
+    ],
+)
+def test_total_only_enforces_limits(config, expression, code):
+    plan = compile_plan(parse(expression))
+    with pytest.raises(DiceExecutionError) as lean:
+        execute(plan, rng=SeededRNG(1), config=config)
+    full_config = ExecutionConfig(max_dice=config.max_dice, max_depth=config.max_depth)
+    with pytest.raises(DiceExecutionError) as full:
+        execute(plan, rng=SeededRNG(1), config=full_config)
+    assert lean.value.code == full.value.code == code
+    assert lean.value.message == full.value.message
+
+
+def test_roll_detail_shortcut():
+    result = roll("1d20+7", rng=SeededRNG(3), detail="total")
+    assert result.tree is None
+    assert result.total == roll("1d20+7", rng=SeededRNG(3)).total
+
+
+def test_roll_detail_rejects_evaluation():
+    with pytest.raises(ValueError, match="detail"):
+        roll("1d20", detail="total", context={"target_dc": 10})
+
+
+def test_compiled_roll_total_detail():
+    result = compile("3d6+2").roll(SeededRNG(5), TOTAL)
+    assert result.tree is None
+    assert result.total == roll("3d6+2", rng=SeededRNG(5)).total
@@ -0,0 +1,164 @@
+import pytest
+
+from dice.errors import DiceExecutionError
+from dice.execution import (
+    ExecutionConfig,
+    compile_expression,
+    compile_plan,
+    execute,
+    execute_many,
+)
+from dice.grammar import parse
+from dice.rng import SeededRNG
+
+HISTOGRAM = ExecutionConfig(histogram_threshold=1000)
+ALWAYS_HISTOGRAM = ExecutionConfig(histogram_threshold=1)
+
+
+def test_large_pool_is_rolled_as_a_histogram():
+    result = execute(parse("100000d6").ast, rng=SeededRNG(1), config=HISTOGRAM)
+    term = result.tree["children"][0]
+    assert "dice" not in term
+    histogram = term["histogram"]
+    assert sum(face["count"] for face in histogram) == 100_000
+    assert [face["value"] for face in histogram] == [1, 2, 3, 4, 5, 6]
+    assert result.total == sum(face["value"] * face["kept"] for face in histogram)
+    assert 340_000 < result.total < 360_000
+
+
+def test_keep_highest_on_a_histogram():
+    result = execute(parse("200000d6kh3 + 1").ast, rng=SeededRNG(2), config=HISTOGRAM)
+    assert result.total == 19
+    kept = [face for face in result.tree["children"][0]["histogram"] if face["kept"]]
+    assert kept == [{"value": 6, "count": kept[0]["count"], "kept": 3}]
+
+
+def test_fate_histogram_uses_fate_faces():
+    result = execute(parse("5000dF").ast, rng=SeededRNG(3), config=HISTOGRAM)
+    histogram = result.tree["children"][0]["histogram"]
+    assert [face["value"] for face in histogram] == [-1, 0, 1]
+    assert result.total == sum(face["value"] * face["count"] for face in histogram)
+
+
+def test_small_pools_keep_individual_dice():
+    result = execute(parse("999d6 + 1000d6").ast, rng=SeededRNG(4), config=HISTOGRAM)
+    small, _, large = result.tree["children"]
+    assert len(small["dice"]) == 999
+    assert "histogram" in large
+
+
+@pytest.mark.parametrize("detail", ["full", "total"])
+def test_pools_with_more_faces_than_dice_are_rolled_die_by_die(detail):
+    # One binomial per face: as a histogram this would draw two billion.
+    config = ExecutionConfig(histogram_threshold=500, detail=detail)
+    plan = compile_plan(parse("1000d2000000000kh1"))
+    result = execute(plan, rng=SeededRNG(1), config=config)
+    assert 1 <= result.total <= 2_000_000_000
+    if detail == "full":
+        assert len(result.tree["children"][0]["dice"]) == 1000
+    totals = execute_many(plan, 2, rng=SeededRNG(1), config=config).totals
+    assert all(1 <= total <= 2_000_000_000 for total in totals)
+
+
+def test_histograms_are_off_by_default():
+    with pytest.raises(DiceExecutionError) as exc_info:
+        execute(parse("100000d6").ast, rng=SeededRNG(1))
+    assert exc_info.value.code == "MAX_DICE_EXCEEDED"
+
+
+def test_other_modifiers_still_count_against_max_dice():
+    with pytest.raises(DiceExecutionError) as exc_info:
+        execute(parse("100000d6!").ast, rng=SeededRNG(1), config=HISTOGRAM)
+    assert exc_info.value.code == "MAX_DICE_EXCEEDED"
+
+
+def test_max_histogram_dice_is_enforced():
+    config = ExecutionConfig(histogram_threshold=1000, max_histogram_dice=150_000)
+    execute(parse("100000d6").ast, rng=SeededRNG(1), config=config)
+    with pytest.raises(DiceExecutionError) as exc_info:
+        execute(parse("100000d6 + 100000d6").ast, rng=SeededRNG(1), config=config)
+    assert exc_info.value.code == "MAX_DICE_EXCEEDED"
+    assert "histograms" in exc_info.value.message
+
+
+@pytest.mark.parametrize("expression", ["100000d6", "50000d20dl10 - 3000dF"])
+def test_total_only_matches_full_execution(expression):
+    plan = compile_plan(parse(expression))
+    total_config = ExecutionConfig(histogram_threshold=1000, detail="total")
+    for seed in range(5):
+        full = execute(plan, rng=SeededRNG(seed), config=HISTOGRAM)
+        lean = execute(plan, rng=SeededRNG(seed), config=total_config)
+        assert lean.total == full.total
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["100000d6", "50000d20dl10 - 3000dF", "2000d6kh3 + 10d6", "(1500d4kl2)*2 + 4dF"],
+)
+@pytest.mark.parametrize("detail", ["full", "total"])
+def test_compiled_expressions_roll_histograms_like_execute(expression, detail):
+    plan = compile_plan(parse(expression))
+    compiled = compile_expression(plan)
+    config = ExecutionConfig(histogram_threshold=1000, detail=detail)
+    for seed in range(3):
+        expected = execute(plan, rng=SeededRNG(seed), config=config)
+        result = compiled.roll(rng=SeededRNG(seed), config=config)
+        assert result.total == expected.total
+        assert result.tree == expected.tree
+        assert compiled.roll_total(rng=SeededRNG(seed), config=config) == result.total
+
+
+@pytest.mark.parametrize(
+    "expression, config, histograms",
+    [
+        ("100000d6", ExecutionConfig(), False),
+        ("100000d6!", HISTOGRAM, False),
+        (
+            "100000d6 + 100000d6",
+            ExecutionConfig(histogram_threshold=1000, max_histogram_dice=150_000),
+            True,
+        ),
+    ],
+)
+def test_compiled_expressions_enforce_histogram_limits(expression, config, histograms):
+    plan = compile_plan(parse(expression))
+    with pytest.raises(DiceExecutionError) as executed:
+        execute(plan, rng=SeededRNG(1), config=config)
+    with pytest.raises(DiceExecutionError) as compiled:
+        compile_expression(plan).roll(rng=SeededRNG(1), config=config)
+    assert compiled.value == executed.value
+    assert executed.value.code == "MAX_DICE_EXCEEDED"
+    assert ("histograms" in executed.value.message) == histograms
+
+
+def _paths(expression, seed):
+    plan = compile_plan(parse(expression))
+    compiled = compile_expression(plan)
+    return [
+        execute(plan, rng=SeededRNG(seed)).total,
+        execute(plan, rng=SeededRNG(seed), config=ALWAYS_HISTOGRAM).total,
+        execute_many(plan, 1, rng=SeededRNG(seed)).totals[0],
+        compiled.roll_total(rng=SeededRNG(seed), config=ALWAYS_HISTOGRAM),
+    ]
+
+
+@pytest.mark.parametrize(
+    "modifier, keeps_all",
+    [
+        ("kh0", False),
+        ("kl0", False),
+        ("dh0", True),
+        ("dl0", True),
+        ("kh150", True),
+        ("kl150", True),
+        ("dh150", False),
+        ("dl150", False),
+    ],
+)
+def test_edge_arguments_agree_above_and_below_the_threshold(modifier, keeps_all):
+    # Die by die, as a histogram, in a batch and compiled, kh0 keeps no dice
+    # and dh0 drops none.
+    for seed in range(3):
+        plain = _paths("100d6", seed)
+        expected = plain if keeps_all else [0, 0, 0, 0]
+        assert _paths(f"100d6{modifier}", seed) == expected
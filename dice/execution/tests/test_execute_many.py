@@ -0,0 +1,138 @@
+from statistics import mean
+
+import pytest
+
+from dice.constants import BATCH_CHUNK_ROWS
+from dice.errors import DiceExecutionError
+from dice.execution import ExecutionConfig, compile_plan, execute_many
+from dice.grammar import parse
+from dice.rng import SeededRNG
+from dice.terms import DiceTerm, GroupTerm, NumericTerm, OperatorTerm, RollExpression
+
+
+def _many(expression, n, seed=1, **kwargs):
+    plan = compile_plan(parse(expression))
+    return execute_many(plan, n, rng=SeededRNG(seed), **kwargs)
+
+
+def test_totals_are_a_compact_column():
+    result = _many("3d6 + 2", 1000)
+    assert len(result) == 1000
+    assert result.totals.typecode == "q"
+    assert min(result.totals) >= 5 and max(result.totals) <= 20
+    assert 12 < mean(result.totals) < 13
+    assert result.columns is None
+    assert result.expression == "3d6 + 2"
+
+
+def test_accepts_an_ast():
+    result = execute_many(parse("1d20").ast, 100, rng=SeededRNG(1))
+    assert set(result.totals) <= set(range(1, 21))
+
+
+def test_seeded_batches_are_reproducible():
+    assert _many("4d6kh3 + 1d8!", 500, seed=3) == _many("4d6kh3 + 1d8!", 500, seed=3)
+
+
+def test_rows_span_several_chunks():
+    result = _many("1d6 * 2", BATCH_CHUNK_ROWS * 2 + 5)
+    assert len(result) == BATCH_CHUNK_ROWS * 2 + 5
+    assert set(result.totals) == {2, 4, 6, 8, 10, 12}
+
+
+def test_columns_add_up_to_the_totals():
+    result = _many("2d6 + floor((1d4 + 1) / 2) * 3 - 1dF", 300, columns=True)
+    cols = result.columns
+    assert set(cols) == {"0.0", "0.2", "0.2.0", "0.2.0.0", "0.6"}
+    for i, total in enumerate(result.totals):
+        assert cols["0.2.0"][i] == cols["0.2.0.0"][i] + 1
+        assert cols["0.2"][i] == cols["0.2.0"][i] // 2
+        assert total == cols["0.0"][i] + cols["0.2"][i] * 3 - cols["0.6"][i]
+    assert set(cols["0.6"]) <= {-3, -2, -1, 0, 1, 2, 3}
+
+
+def test_float_totals():
+    result = _many("1.5 * 2d6", 50)
+    assert result.totals.typecode == "d"
+    assert all(total * 2 % 3 == 0 for total in result.totals)
+
+
+@pytest.mark.parametrize(
+    "expression, low, high, expected_mean",
+    [
+        ("4d6kh3", 3, 18, 12.24),
+        ("4d6dl1", 3, 18, 12.24),
+        ("2d20kl1", 1, 20, 7.175),
+        ("1d6!", 1, None, 4.2),
+        ("1d6r<2", 2, 6, 4.0),
+        ("1d6ro<2", 1, 6, 3.9167),
+    ],
+)
+def test_modifiers(expression, low, high, expected_mean):
+    totals = _many(expression, 20000).totals
+    assert min(totals) >= low
+    if high is not None:
+        assert max(totals) <= high
+    assert abs(mean(totals) - expected_mean) < 0.1
+
+
+def test_groups_fall_back_to_term_evaluation():
+    group = GroupTerm(
+        children=[[DiceTerm(count=1, faces=6)], [NumericTerm(value=4)]],
+        modifier_strings=["kh1"],
+    )
+    ast = RollExpression(
+        expression="{1d6, 4}kh1 + 1",
+        children=[group, OperatorTerm(operator="+"), NumericTerm(value=1)],
+    )
+    totals = execute_many(ast, 500, rng=SeededRNG(1)).totals
+    assert set(totals) == {5, 6, 7}
+
+
+def test_explosion_limit_applies_per_row():
+    config = ExecutionConfig(max_explosions=3)
+    # ro<3 on a d2 rerolls every die exactly once.
+    result = _many("1d2ro<3 + 1d2ro<3 + 1d2ro<3", 1000, config=config)
+    assert len(result) == 1000
+    with pytest.raises(DiceExecutionError, match="MAX_EXPLOSIONS_EXCEEDED"):
+        _many("1d2ro<3 + 1d2ro<3 + 1d2ro<3 + 1d2ro<3", 10, config=config)
+
+
+def test_draw_limit_applies_per_row():
+    config = ExecutionConfig(max_rng_draws=4)
+    assert len(_many("2d6 + 2d6", 100, config=config)) == 100
+    with pytest.raises(DiceExecutionError, match="MAX_RNG_DRAWS_EXCEEDED"):
+        _many("2d6 + 3d6", 100, config=config)
+
+
+def test_static_limits():
+    with pytest.raises(DiceExecutionError, match="MAX_DICE_EXCEEDED"):
+        _many("3d6 + 3d6", 10, config=ExecutionConfig(max_dice=5))
+    with pytest.raises(DiceExecutionError, match="MAX_DEPTH_EXCEEDED"):
+        _many("((1d6))", 10, config=ExecutionConfig(max_depth=3))
+    with pytest.raises(DiceExecutionError, match="MAX_COST_EXCEEDED"):
+        _many("100d2!>1", 10, config=ExecutionConfig(max_cost=150))
+
+
+def test_histogram_pools():
+    config = ExecutionConfig(histogram_threshold=1000)
+    totals = _many("100000d6kh2", 20, config=config).totals
+    assert set(totals) == {12}
+
+
+def test_row_count_validation():
+    assert len(_many("1d6", 0)) == 0
+    with pytest.raises(ValueError):
+        _many("1d6", -1)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["5d6kh3", "5d6k2", "5d6kl2", "5d6dh1", "5d6dl2", "5d6dl1kh2", "4dFkh2"],
+)
+def test_keep_and_drop_match_the_modifier_functions(expression):
+    # A draw limit sends every row through the modifier functions, drawing
+    # in the same order as the sorted-slice fast path.
+    limited = ExecutionConfig(max_rng_draws=10**9)
+    expected = _many(expression, 500, config=limited).totals
+    assert _many(expression, 500).totals == expected
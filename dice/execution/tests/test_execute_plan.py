@@ -0,0 +1,102 @@
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dice.errors import DiceExecutionError, DiceParseError
+from dice.execution import ExecutionConfig, ExecutionPlan, compile_plan, execute
+from dice.grammar import parse
+from dice.rng import SeededRNG
+from dice.terms import DiceTerm, GroupTerm, NumericTerm, OperatorTerm, RollExpression
+
+
+class CountingRNG:
+    def __init__(self, value: int = 3) -> None:
+        self.value = value
+        self.calls = 0
+
+    def randint(self, a: int, b: int) -> int:
+        self.calls += 1
+        return min(max(self.value, a), b)
+
+
+def _plan(expr: str) -> ExecutionPlan:
+    return compile_plan(parse(expr))
+
+
+def test_plan_is_frozen():
+    plan = _plan("1d20+5")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        plan.expression = "1d6"  # type: ignore[misc]
+
+
+def test_plan_executes_repeatedly():
+    plan = _plan("4d6kh3+2")
+    before = repr(plan)
+    a = execute(plan, rng=SeededRNG(7))
+    b = execute(plan, rng=SeededRNG(7))
+    c = execute(plan, rng=SeededRNG(8))
+    assert a.total == b.total
+    assert a.tree == b.tree
+    assert c.tree["id"] == a.tree["id"]
+    assert repr(plan) == before
+
+
+def test_plan_matches_ast_execution():
+    for expr in ["1d20+7", "(2d6+3)*2", "floor(1d6/2)", "4dF", "3d6!"]:
+        parsed = parse(expr)
+        via_plan = execute(compile_plan(parsed), rng=SeededRNG(42))
+        via_ast = execute(parsed.ast, rng=SeededRNG(42))
+        assert via_plan.total == via_ast.total
+        assert via_plan.tree == via_ast.tree
+
+
+def test_plan_shared_across_threads():
+    plan = _plan("4d6kh3")
+
+    def run(seed: int) -> int:
+        tree = execute(plan, rng=SeededRNG(seed)).tree
+        assert tree is not None
+        dice = tree["children"][0]["dice"]
+        return sum(1 for d in dice if d["kept"])
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        kept = list(pool.map(run, range(200)))
+    assert set(kept) == {3}
+
+
+def test_compile_plan_rejects_parse_errors():
+    with pytest.raises(DiceParseError):
+        compile_plan(parse("1d"))
+
+
+def test_execute_plan_leaves_source_ast_untouched():
+    parsed = parse("2d6+1")
+    plan = compile_plan(parsed)
+    execute(plan, rng=SeededRNG(1))
+    assert parsed.ast.children[0].results == []
+
+
+def test_nested_dice_rolled_once():
+    rng = CountingRNG()
+    result = execute(_plan("(2d6+3)*2"), rng=rng)
+    assert rng.calls == 2
+    assert result.total == 18
+
+
+def test_hand_built_group_compiles():
+    group = GroupTerm(
+        children=[
+            [DiceTerm(count=2, faces=6)],
+            [NumericTerm(value=5), OperatorTerm(operator="+"), NumericTerm(value=1)],
+        ],
+        modifier_strings=["kh1"],
+    )
+    ast = RollExpression(expression="{2d6, 5+1}kh1", children=[group])
+    result = execute(compile_plan(ast), rng=CountingRNG(1))
+    assert result.total == 6
+
+
+def test_plan_enforces_limits():
+    with pytest.raises(DiceExecutionError, match="MAX_DICE_EXCEEDED"):
+        execute(_plan("3d6+3d6"), config=ExecutionConfig(max_dice=5))
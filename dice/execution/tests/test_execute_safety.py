@@ -1,7 +1,9 @@
+import time
+
 import pytest
 
 from dice.errors import DiceExecutionError
-from dice.execution import ExecutionConfig, execute
+from dice.execution import ExecutionConfig, compile_expression, compile_plan, execute
 from dice.grammar import parse
 from dice.rng import SeededRNG
 
@@ -44,3 +46,93 @@ def test_within_limits_succeeds():
     assert not parsed.errors
     result = execute(parsed.ast, rng=SeededRNG(42), config=config)
     assert result.total is not None
+
+
+def test_max_cost_rejects_before_rolling():
+    class NoRNG:
+        def randint(self, a, b):
+            raise AssertionError("rolled")
+
+    config = ExecutionConfig(max_cost=1500)
+    for source in (parse("1000d2!>1").ast, compile_plan(parse("1000d2!>1"))):
+        with pytest.raises(DiceExecutionError) as exc_info:
+            execute(source, rng=NoRNG(), config=config)
+        assert exc_info.value.code == "MAX_COST_EXCEEDED"
+        assert exc_info.value.message == "Estimated cost (2000) exceeds maximum (1500)"
+    with pytest.raises(DiceExecutionError, match="MAX_COST_EXCEEDED"):
+        compile_expression(parse("1000d2!>1")).roll(rng=NoRNG(), config=config)
+    with pytest.raises(DiceExecutionError, match="MAX_COST_EXCEEDED"):
+        execute(parse("1d1!").ast, rng=NoRNG(), config=config)
+
+
+def test_max_cost_is_estimated_with_the_configured_explosion_limit(monkeypatch):
+    import dice.execution.batch
+    import dice.execution.codegen
+    import dice.execution.executor
+
+    seen = []
+
+    def check_cost(estimate, config):
+        seen.append(estimate.max_dice)
+
+    modules = (dice.execution.executor, dice.execution.codegen, dice.execution.batch)
+    for module in modules:
+        monkeypatch.setattr(module, "check_cost", check_cost)
+    config = ExecutionConfig(max_cost=1500, max_explosions=7)
+    plan = compile_plan(parse("2d6!"))
+    execute(plan, rng=SeededRNG(1), config=config)
+    execute(plan.instantiate(), rng=SeededRNG(1), config=config)
+    compile_expression(plan).roll_total(rng=SeededRNG(1), config=config)
+    dice.execution.batch.execute_many(plan, 3, rng=SeededRNG(1), config=config)
+    assert seen == [2 + 7] * 4
+
+
+def test_max_cost_admits_cheap_expressions():
+    config = ExecutionConfig(max_cost=1500)
+    result = execute(compile_plan(parse("1000d6")), rng=SeededRNG(1), config=config)
+    assert 1000 <= result.total <= 6000
+
+
+@pytest.mark.parametrize("detail", ["full", "total"])
+def test_max_explosions_is_shared_across_terms(detail):
+    # ro<3 on a d2 rerolls every die exactly once.
+    config = ExecutionConfig(max_explosions=3, detail=detail)
+    plan = compile_plan(parse("1d2ro<3 + 1d2ro<3 + 1d2ro<3"))
+    execute(plan, rng=SeededRNG(1), config=config)
+    compile_expression(plan).roll(rng=SeededRNG(1), config=config)
+    plan = compile_plan(parse("1d2ro<3 + 1d2ro<3 + 1d2ro<3 + 1d2ro<3"))
+    with pytest.raises(DiceExecutionError, match="MAX_EXPLOSIONS_EXCEEDED"):
+        execute(plan, rng=SeededRNG(1), config=config)
+    with pytest.raises(DiceExecutionError, match="MAX_EXPLOSIONS_EXCEEDED"):
+        compile_expression(plan).roll(rng=SeededRNG(1), config=config)
+
+
+def test_endless_reroll_is_an_error():
+    with pytest.raises(DiceExecutionError, match="MAX_EXPLOSIONS_EXCEEDED"):
+        execute(parse("1d1r<2").ast, rng=SeededRNG(1))
+
+
+@pytest.mark.parametrize("detail", ["full", "total"])
+def test_max_rng_draws(detail):
+    config = ExecutionConfig(max_rng_draws=4, detail=detail)
+    plan = compile_plan(parse("2d6 + 2d6"))
+    execute(plan, rng=SeededRNG(1), config=config)
+    compile_expression(plan).roll_total(rng=SeededRNG(1), config=config)
+    plan = compile_plan(parse("2d6 + 3d6"))
+    with pytest.raises(DiceExecutionError) as exc_info:
+        execute(plan, rng=SeededRNG(1), config=config)
+    assert exc_info.value.code == "MAX_RNG_DRAWS_EXCEEDED"
+    with pytest.raises(DiceExecutionError, match="MAX_RNG_DRAWS_EXCEEDED"):
+        compile_expression(plan).roll_total(rng=SeededRNG(1), config=config)
+
+
+def test_timeout():
+    class SlowRNG:
+        def randint(self, a, b):
+            time.sleep(0.002)
+            return a
+
+    config = ExecutionConfig(timeout=0.01)
+    with pytest.raises(DiceExecutionError) as exc_info:
+        execute(parse("100d6").ast, rng=SlowRNG(), config=config)
+    assert exc_info.value.code == "DEADLINE_EXCEEDED"
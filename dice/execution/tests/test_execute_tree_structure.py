@@ -63,3 +63,24 @@ def test_tree_is_immutable_copy():
     # The modification is local — but the point is it's a deep copy
     # not a reference to the AST internals
     assert result.total == original_total
+
+
+def test_tree_shares_nothing_with_the_ast():
+    from dice.execution import execute
+    from dice.grammar import parse
+
+    ast = parse("floor((4d6kh3 + 2) / 2) + 1d4! [fire]").ast
+    result = execute(ast, rng=SeededRNG(42))
+    before = ast.to_dict()
+
+    def scramble(node):
+        for value in node.values() if isinstance(node, dict) else node:
+            if isinstance(value, (dict, list)):
+                scramble(value)
+        if isinstance(node, dict):
+            node["total"] = -1
+        else:
+            node.append("x")
+
+    scramble(result.tree)
+    assert ast.to_dict() == before
@@ -0,0 +1,70 @@
+import json
+import pickle
+
+from dice import roll
+from dice.execution import ExecutionResult, compile_plan, execute
+from dice.grammar import parse
+from dice.rng import SeededRNG
+from dice.terms import RollExpression
+
+
+def _plan(expression="4d6kh3 + (1d8 * 2) [fire]"):
+    return compile_plan(parse(expression))
+
+
+def test_tree_is_built_on_first_access_only(monkeypatch):
+    calls = []
+    original = RollExpression.to_dict
+
+    def counting(self):
+        calls.append(self)
+        return original(self)
+
+    monkeypatch.setattr(RollExpression, "to_dict", counting)
+    result = execute(_plan(), rng=SeededRNG(1))
+    assert isinstance(result.total, int)
+    assert calls == []
+
+    tree = result.tree
+    assert len(calls) == 1
+    assert result.tree is tree
+    assert len(calls) == 1
+
+
+def test_lazy_tree_matches_eager_tree():
+    plan = _plan()
+    lazy = execute(plan, rng=SeededRNG(7))
+    ast = plan.instantiate()
+    eager = execute(ast, rng=SeededRNG(7))
+    assert lazy.tree == eager.tree
+    assert lazy.tree["total"] == lazy.total
+    json.dumps(lazy.tree)
+
+
+def test_lazy_tree_unaffected_by_later_rolls():
+    plan = _plan("3d6")
+    first = execute(plan, rng=SeededRNG(1))
+    for seed in range(2, 10):
+        execute(plan, rng=SeededRNG(seed))
+    assert first.tree["total"] == first.total
+
+
+def test_tree_can_be_replaced():
+    result = roll("1d6", rng=SeededRNG(1))
+    result.execution.tree = {"total": 0}
+    assert result.tree == {"total": 0}
+
+
+def test_result_equality_and_repr():
+    a = execute(_plan(), rng=SeededRNG(3))
+    b = execute(_plan(), rng=SeededRNG(3))
+    assert a.total == b.total
+    assert a == ExecutionResult(a.tree, a.total, a.expression, a.syntax_version)
+    assert "tree=" in repr(a)
+
+
+def test_pickle_materializes_tree():
+    result = execute(_plan(), rng=SeededRNG(5))
+    restored = pickle.loads(pickle.dumps(result))
+    assert restored == result
+    assert restored._terms is None
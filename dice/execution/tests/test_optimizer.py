@@ -0,0 +1,132 @@
+import pytest
+
+from dice.execution import ExecutionConfig, compile_plan, execute, optimize
+from dice.grammar import parse
+from dice.rng import SeededRNG
+
+
+def _kinds(children):
+    return [c.kind for c in children]
+
+
+def _optimized(expr, **kwargs):
+    parsed = parse(expr)
+    assert not parsed.errors
+    return optimize(parsed.ast, **kwargs)
+
+
+def test_folds_character_sheet_constants():
+    ast = _optimized("1d20+2+3-1+(4*2)")
+    assert _kinds(ast.children) == ["dice_term", "operator_term", "numeric_term"]
+    assert ast.children[2].value == 12
+
+
+def test_constants_cancelling_out_are_dropped():
+    ast = _optimized("1d20+3-3")
+    assert _kinds(ast.children) == ["dice_term"]
+
+
+def test_negative_folded_constant_keeps_sign():
+    ast = _optimized("1d20+1-4")
+    assert ast.children[1].operator == "-"
+    assert ast.children[2].value == 3
+
+
+def test_pure_numeric_function_collapses():
+    ast = _optimized("floor(7/2)+1d4")
+    assert _kinds(ast.children) == ["numeric_term", "operator_term", "dice_term"]
+    assert ast.children[0].value == 3
+
+
+def test_fully_constant_expression():
+    ast = _optimized("2+3*4")
+    assert _kinds(ast.children) == ["numeric_term"]
+    assert ast.children[0].value == 14
+
+
+def test_mixed_chain_is_not_reordered():
+    ast = _optimized("2*1d6*3")
+    assert len(ast.children) == 5
+
+
+def test_division_by_zero_left_for_runtime():
+    ast = _optimized("1d6+(4/0)")
+    assert ast.children[2].kind == "parenthetical_term"
+
+
+def test_input_tree_unchanged():
+    parsed = parse("1d6+1d6+2+3")
+    optimize(parsed.ast, merge_dice=True)
+    assert len(parsed.ast.children) == 7
+
+
+def test_merge_dice_only_when_requested():
+    assert _kinds(_optimized("1d6+1d6+1d6").children) == [
+        "dice_term", "operator_term", "dice_term", "operator_term", "dice_term",
+    ]
+    merged = _optimized("1d6+1d6+1d6", merge_dice=True)
+    assert _kinds(merged.children) == ["dice_term"]
+    assert merged.children[0].count == 3
+
+
+def test_merge_respects_faces_sign_and_modifiers():
+    ast = _optimized("1d6+1d8-1d6-1d6+2d6kh1+1d6", merge_dice=True)
+    notations = [
+        getattr(c, "notation", getattr(c, "operator", None)) for c in ast.children
+    ]
+    assert notations == ["2d6", "+", "1d8", "-", "2d6", "+", "2d6kh1"]
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "1d20+2+3-1+(4*2)",
+        "1d20-5+2",
+        "(2d6+3)*2+4/2",
+        "floor((1d6+5)/2)+abs(3-10)",
+        "4dF+1+1",
+        "1d6+1d6+1d6",
+        "1d6-1d6-1d6+3",
+        "2.5+1d6+1.1",
+    ],
+)
+def test_totals_match_unoptimized(expr):
+    for seed in range(20):
+        plain = execute(parse(expr).ast, rng=SeededRNG(seed))
+        folded = execute(_optimized(expr), rng=SeededRNG(seed))
+        merged = execute(_optimized(expr, merge_dice=True), rng=SeededRNG(seed))
+        assert folded.total == plain.total
+        assert merged.total == plain.total
+
+
+def test_execute_total_detail_merges():
+    plan = compile_plan(parse("1d6+1d6+2+3"))
+    config = ExecutionConfig(detail="total", optimize=True)
+    result = execute(plan, rng=SeededRNG(1), config=config)
+    assert result.tree is None
+    assert result.total == execute(plan, rng=SeededRNG(1)).total
+    merged = plan.optimized(merge_dice=True)
+    assert [type(c).__name__ for c in merged.children] == [
+        "DiceNode", "OperatorNode", "NumericNode",
+    ]
+
+
+def test_execute_full_detail_preserves_structure_by_default():
+    config = ExecutionConfig(optimize=True)
+    result = execute(parse("1d6+2+3").ast, rng=SeededRNG(1), config=config)
+    assert len(result.tree["children"]) == 5
+
+
+def test_execute_full_detail_can_fold():
+    config = ExecutionConfig(optimize=True, preserve_structure=False)
+    plan = compile_plan(parse("1d6+1d6+2+3"))
+    result = execute(plan, rng=SeededRNG(1), config=config)
+    assert [c["kind"] for c in result.tree["children"]] == [
+        "dice_term", "operator_term", "dice_term", "operator_term", "numeric_term",
+    ]
+    assert plan.optimized() is plan.optimized()
+
+
+def test_invalid_detail_rejected():
+    with pytest.raises(ValueError, match="detail"):
+        ExecutionConfig(detail="summary")
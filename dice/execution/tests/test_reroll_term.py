@@ -0,0 +1,136 @@
+import pytest
+
+from dice.errors import DiceExecutionError
+from dice.execution import ExecutionConfig, compile_plan, execute, reroll_term
+from dice.grammar import parse
+from dice.rng import SeededRNG
+from dice.terms import assign_ids
+
+
+class CountingRNG:
+    def __init__(self, seed: int) -> None:
+        self._rng = SeededRNG(seed)
+        self.draws = 0
+
+    def randint(self, a: int, b: int) -> int:
+        self.draws += 1
+        return self._rng.randint(a, b)
+
+
+EXPRESSION = "1d20 + 5 + floor((2d6 + 1d4) / 2) * 2"
+
+
+def _result(seed: int = 1):
+    return execute(compile_plan(parse(EXPRESSION)), rng=SeededRNG(seed))
+
+
+def _walk(tree):
+    yield tree
+    for child in tree.get("children", []):
+        yield from _walk(child)
+
+
+def _find(tree, term_id):
+    return next(d for d in _walk(tree) if d["id"] == term_id)
+
+
+def test_only_the_subtree_is_rolled():
+    result = _result()
+    before = result.tree
+    rng = CountingRNG(2)
+    reroll_term(result, "0.4.0.0", rng=rng)
+    assert rng.draws == 2
+    after = result.tree
+    assert after is not before
+    # The untouched dice and the path totals are consistent.
+    assert _find(after, "0.0") == _find(before, "0.0")
+    two_d6 = sum(d["value"] for d in _find(after, "0.4.0.0")["dice"])
+    d4 = _find(before, "0.4.0.2")["total"]
+    d20 = _find(before, "0.0")["total"]
+    assert _find(after, "0.4.0")["total"] == two_d6 + d4
+    assert _find(after, "0.4")["total"] == (two_d6 + d4) // 2
+    assert result.total == after["total"] == d20 + 5 + (two_d6 + d4) // 2 * 2
+
+
+def test_tree_matches_a_fresh_serialization():
+    result = _result()
+    result.tree
+    reroll_term(result, "0.4.0.2", rng=SeededRNG(3))
+    assert result.tree == result.terms.to_dict()
+
+
+def test_earlier_trees_are_not_modified():
+    result = _result()
+    before = result.tree
+    snapshot = repr(before)
+    reroll_term(result, "0.0", rng=SeededRNG(4))
+    assert repr(before) == snapshot
+
+
+def test_unserialized_results_serialize_the_new_rolls():
+    result = _result()
+    reroll_term(result, "0.0", rng=SeededRNG(5))
+    d20 = SeededRNG(5).randint(1, 20)
+    assert result.tree["children"][0]["total"] == d20
+    assert result.total == result.tree["total"]
+
+
+def test_rerolling_the_root_rolls_everything():
+    result = _result()
+    rng = CountingRNG(6)
+    reroll_term(result, "0", rng=rng)
+    assert rng.draws == 4
+    expected = execute(compile_plan(parse(EXPRESSION)), rng=SeededRNG(6))
+    assert result.total == expected.total
+
+
+def test_ids_that_are_not_paths_are_searched():
+    parsed = parse(EXPRESSION)
+    assign_ids(parsed.ast, "uuid")
+    result = execute(compile_plan(parsed), rng=SeededRNG(1))
+    d4_id = result.terms.children[4].children[0].children[2].id
+    rng = CountingRNG(7)
+    reroll_term(result, d4_id, rng=rng)
+    assert rng.draws == 1
+    assert result.tree == result.terms.to_dict()
+
+
+def test_failed_reroll_leaves_the_result_unchanged():
+    result = execute(compile_plan(parse("1d6 + 3d6")), rng=SeededRNG(1))
+    tree, total = result.tree, result.total
+    with pytest.raises(DiceExecutionError, match="MAX_RNG_DRAWS_EXCEEDED"):
+        reroll_term(
+            result, "0.2", rng=SeededRNG(2), config=ExecutionConfig(max_rng_draws=2)
+        )
+    assert result.tree is tree
+    assert result.total == total
+    assert result.terms.to_dict() == tree
+
+
+def test_reroll_that_fails_to_resolve_leaves_the_result_unchanged():
+    result = execute(compile_plan(parse("1d6/(1d2-1)")), rng=SeededRNG(0))
+    terms, tree, total = result.terms, result.tree, result.total
+    d2 = terms.children[2].children[0]
+    assert d2.total == 2
+    seed = next(s for s in range(100) if SeededRNG(s).randint(1, 2) == 1)
+    with pytest.raises(ZeroDivisionError):
+        reroll_term(result, d2.id, rng=SeededRNG(seed))
+    assert result.terms is terms
+    assert result.tree is tree
+    assert result.total == total
+    assert terms.to_dict() == tree
+
+
+def test_unknown_ids_and_results_without_terms():
+    with pytest.raises(ValueError, match="No term"):
+        reroll_term(_result(), "0.9")
+    ast_result = execute(parse(EXPRESSION).ast, rng=SeededRNG(1))
+    with pytest.raises(ValueError, match="no terms"):
+        reroll_term(ast_result, "0.0")
+    total_only = execute(
+        compile_plan(parse(EXPRESSION)),
+        rng=SeededRNG(1),
+        config=ExecutionConfig(detail="total"),
+    )
+    with pytest.raises(ValueError, match="no terms"):
+        reroll_term(total_only, "0.0")
@@ -0,0 +1,106 @@
+"""Total-only execution of a plan, without building a term tree.
+
+Used by :func:`~dice.execution.executor.execute` when ``config.detail`` is
+``"total"``. The frozen plan nodes are walked directly: unmodified dice are
+summed straight from the RNG, and only modified dice allocate
+:class:`~dice.terms.die_result.DieResult` objects for their modifiers. No
+terms, ids or ``to_dict()`` trees are created.
+
+Dice are drawn in the same order as :func:`evaluate_tree`, and the depth and
+dice limits are checked at the same points with the same errors, so a seeded
+RNG gives the same total either way.
+"""
+
+from __future__ import annotations
+
+from dice.errors import DiceExecutionError
+from dice.execution.config import ExecutionConfig
+from dice.execution.evaluator import _EvalContext, evaluate_tree, rolls_histogram
+from dice.execution.plan import (
+    DiceNode,
+    ExecutionPlan,
+    FateDiceNode,
+    FunctionNode,
+    NumericNode,
+    OperatorNode,
+    ParentheticalNode,
+    PlanNode,
+)
+from dice.rng import roll_dice
+from dice.terms.die_histogram import (
+    DieHistogram,
+    apply_histogram_modifiers,
+    histogram_supports,
+)
+from dice.terms.die_result import DieResult
+from dice.terms.eval_helpers import compute_infix_value
+from dice.terms.function_term import FUNCTIONS
+
+
+def evaluate_total(plan: ExecutionPlan, ctx: _EvalContext) -> int | float:
+    """Roll *plan* and return its total, enforcing the limits in *ctx*."""
+    _check_depth(1, ctx.config)
+    return _sequence(plan.children, 2, ctx)
+
+
+def _sequence(
+    nodes: tuple[PlanNode, ...], depth: int, ctx: _EvalContext
+) -> int | float:
+    return compute_infix_value([_node(node, depth, ctx) for node in nodes])
+
+
+def _node(node: PlanNode, depth: int, ctx: _EvalContext) -> int | float | str:
+    _check_depth(depth, ctx.config)
+    if type(node) is OperatorNode:
+        return node.operator
+    if type(node) is NumericNode:
+        return node.value
+    if type(node) is DiceNode:
+        return _dice(node, node.faces, 0, ctx)
+    if type(node) is FateDiceNode:
+        return _dice(node, 3, -2, ctx)
+    if type(node) is ParentheticalNode:
+        return _sequence(node.children, depth + 1, ctx)
+    if type(node) is FunctionNode:
+        return FUNCTIONS[node.function](_sequence(node.children, depth + 1, ctx))
+
+    # Groups and third-party terms: evaluate a real term in place.
+    term = node.instantiate()
+    ctx.current_depth = depth - 1
+    evaluate_tree(term, ctx)
+    return term.total
+
+
+def _dice(
+    node: DiceNode | FateDiceNode, faces: int, shift: int, ctx: _EvalContext
+) -> int:
+    steps = node.modifier_plan
+    supported = histogram_supports(steps)
+    if rolls_histogram(node.count, faces, supported, ctx.config):
+        ctx.count_histogram_dice(node.count)
+        histogram = DieHistogram.roll(node.count, faces, ctx.rng, low=1 + shift)
+        apply_histogram_modifiers(histogram, steps)
+        return histogram.kept_total()
+
+    ctx.count_dice(node.count)
+
+    rng = ctx.rng
+    values = roll_dice(node.count, faces, rng)
+    if not node.modifier_plan:
+        return sum(values) + shift * node.count
+
+    results = [DieResult(value=v + shift) for v in values]
+    for step in node.modifier_plan:
+        results = step.fn(results, step.spec, rng, faces)
+    return sum([d.value for d in results if d.kept])
+
+
+def _check_depth(depth: int, config: ExecutionConfig) -> None:
+    if depth > config.max_depth:
+        raise DiceExecutionError(
+            code="MAX_DEPTH_EXCEEDED",
+            message=(
+                f"Expression depth ({depth}) "
+                f"exceeds maximum ({config.max_depth})"
+            ),
+        )
@@ -1,8 +1,12 @@
+from dice.grammar.incremental import ParseState, parse_state, reparse
 from dice.grammar.parse_result import ParseResult
 from dice.grammar.parser import parse, validate
 
 __all__ = [
     "ParseResult",
+    "ParseState",
     "parse",
+    "parse_state",
+    "reparse",
     "validate",
 ]
@@ -0,0 +1,270 @@
+"""Hand-written recursive-descent backend for dice notation.
+
+Consumes the token stream from :mod:`dice.grammar.lexer` and produces the
+same RollTerm AST as the pyparsing grammar in :mod:`dice.grammar.notation`,
+without importing pyparsing.
+
+Grammar::
+
+    top        := expression [FLAVOR] END
+    expression := factor (OPERATOR factor)*
+    factor     := dice | FUNCTION '(' expression ')' | '(' expression ')'
+                | INT | FLOAT
+    dice       := [INT] DICE SIDES MODIFIER{0,4}
+
+Operator precedence does not shape the AST (each level is a flat infix
+sequence), so a single loop over ``factor (OPERATOR factor)*`` suffices.
+
+:func:`check_notation` runs the same grammar as a pure recognizer that
+builds no terms, for :func:`dice.grammar.validate`; :func:`check_factor`
+recognizes a single top-level factor, for incremental re-validation.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Generic, TypeVar
+
+from dice.errors import DiceParseError
+from dice.grammar.lexer import (
+    DICE,
+    END,
+    FLAVOR,
+    FLOAT,
+    FUNCTION,
+    INT,
+    LPAREN,
+    MODIFIER,
+    OPERATOR,
+    RPAREN,
+    SIDES,
+    Token,
+    tokenize,
+)
+from dice.grammar.parse_actions import (
+    build_dice_term,
+    build_function,
+    build_parenthetical,
+    compile_dice_modifiers,
+    sides_to_faces,
+)
+from dice.terms import NumericTerm, OperatorTerm, RollTerm
+
+MAX_MODIFIERS = 4
+
+_DESCRIPTIONS = {
+    END: "end of text",
+    FLAVOR: "flavor text",
+    RPAREN: "')'",
+    LPAREN: "'('",
+}
+
+
+# What the term hooks build: RollTerms, or nothing when only recognizing.
+_T = TypeVar("_T")
+
+
+class _Grammar(ABC, Generic[_T]):
+    """The recursive-descent grammar, building terms through the hooks."""
+
+    def __init__(self, text: str, tokens: list[Token]) -> None:
+        self._text = text
+        self._tokens = tokens
+        self._pos = 0
+
+    def parse(self) -> tuple[list[_T], str | None]:
+        terms = self._expression()
+        flavor: str | None = None
+        tok = self._tokens[self._pos]
+        if tok.kind == FLAVOR:
+            flavor = tok.text.strip() or None
+            self._pos += 1
+        self._expect(END, "end of text")
+        return terms, flavor
+
+    def _expression(self) -> list[_T]:
+        terms = [self._factor()]
+        tokens = self._tokens
+        while tokens[self._pos].kind == OPERATOR:
+            terms.append(self._operator(tokens[self._pos].text))
+            self._pos += 1
+            terms.append(self._factor())
+        return terms
+
+    def _factor(self) -> _T:
+        tok = self._tokens[self._pos]
+        kind = tok.kind
+
+        if kind == INT:
+            if self._tokens[self._pos + 1].kind == DICE:
+                self._pos += 1
+                return self._dice(int(tok.text), tok.start)
+            self._pos += 1
+            return self._number(int(tok.text))
+
+        if kind == DICE:
+            return self._dice(1, tok.start)
+
+        if kind == FLOAT:
+            self._pos += 1
+            return self._number(float(tok.text))
+
+        if kind == FUNCTION:
+            self._pos += 1
+            self._expect(LPAREN, "'('")
+            children = self._expression()
+            self._expect(RPAREN, "')'")
+            return self._function(tok.text, children)
+
+        if kind == LPAREN:
+            self._pos += 1
+            children = self._expression()
+            self._expect(RPAREN, "')'")
+            return self._parenthetical(children)
+
+        raise self._error(tok, "factor")
+
+    def _dice(self, count: int, start: int) -> _T:
+        self._pos += 1  # the 'd'
+        sides = self._tokens[self._pos]
+        if sides.kind != SIDES:
+            raise self._error(sides, "dice sides")
+        self._pos += 1
+
+        modifiers: list[str] = []
+        tokens = self._tokens
+        while tokens[self._pos].kind == MODIFIER and len(modifiers) < MAX_MODIFIERS:
+            modifiers.append(tokens[self._pos].text)
+            self._pos += 1
+        return self._dice_term(count, sides.text, modifiers, start)
+
+    # Term hooks, implemented by _Parser and _Recognizer.
+
+    @abstractmethod
+    def _number(self, value: int | float) -> _T:
+        """Build a numeric literal."""
+        ...
+
+    @abstractmethod
+    def _operator(self, operator: str) -> _T:
+        """Build an operator between two factors."""
+        ...
+
+    @abstractmethod
+    def _function(self, name: str, children: list[_T]) -> _T:
+        """Build a function call over a parsed expression."""
+        ...
+
+    @abstractmethod
+    def _parenthetical(self, children: list[_T]) -> _T:
+        """Build a parenthesized expression."""
+        ...
+
+    @abstractmethod
+    def _dice_term(
+        self, count: int, sides: str, modifiers: list[str], start: int
+    ) -> _T:
+        """Build a dice term starting at offset *start* of the text."""
+        ...
+
+    def _expect(self, kind: str, description: str) -> Token:
+        tok = self._tokens[self._pos]
+        if tok.kind != kind:
+            raise self._error(tok, description)
+        self._pos += 1
+        return tok
+
+    def _error(self, tok: Token, expected: str) -> DiceParseError:
+        found = _DESCRIPTIONS.get(tok.kind, repr(self._text[tok.start : tok.end]))
+        return DiceParseError(
+            code="PARSE_ERROR",
+            message=f"Expected {expected}, found {found} (at char {tok.start})",
+            position=tok.start,
+            expression=self._text,
+        )
+
+
+class _Parser(_Grammar[RollTerm]):
+    """Builds the RollTerm AST."""
+
+    def _number(self, value: int | float) -> RollTerm:
+        return NumericTerm(value=value)
+
+    def _operator(self, operator: str) -> RollTerm:
+        return OperatorTerm(operator=operator)
+
+    def _function(self, name: str, children: list[RollTerm]) -> RollTerm:
+        return build_function(name, children)
+
+    def _parenthetical(self, children: list[RollTerm]) -> RollTerm:
+        return build_parenthetical(children)
+
+    def _dice_term(
+        self, count: int, sides: str, modifiers: list[str], start: int
+    ) -> RollTerm:
+        return build_dice_term(count, sides, modifiers, start)
+
+
+class _Recognizer(_Grammar[None]):
+    """Accepts exactly what _Parser accepts without building any terms."""
+
+    def _number(self, value: int | float) -> None:
+        return None
+
+    def _operator(self, operator: str) -> None:
+        return None
+
+    def _function(self, name: str, children: list[None]) -> None:
+        return None
+
+    def _parenthetical(self, children: list[None]) -> None:
+        return None
+
+    def _dice_term(
+        self, count: int, sides: str, modifiers: list[str], start: int
+    ) -> None:
+        if modifiers:
+            compile_dice_modifiers(modifiers, sides_to_faces(sides), start)
+        return None
+
+
+def parse_notation(text: str) -> tuple[list[RollTerm], str | None]:
+    """Parse *text* and return ``(term_list, flavor_or_none)``.
+
+    Drop-in replacement for :func:`dice.grammar.notation.parse_notation`.
+
+    Raises:
+        DiceParseError: With code ``PARSE_ERROR`` and ``position`` set to the
+            offending character when *text* is not valid notation.
+    """
+    return _Parser(text, tokenize(text)).parse()
+
+
+def check_notation(text: str) -> None:
+    """Check that *text* is valid notation without building an AST.
+
+    Raises:
+        DiceParseError: Exactly as :func:`parse_notation` would.
+    """
+    _Recognizer(text, tokenize(text)).parse()
+
+
+def check_factor(text: str, tokens: list[Token]) -> None:
+    """Check that *tokens* hold exactly one top-level factor.
+
+    *tokens* is a slice of ``tokenize(text)`` running up to and including
+    the operator or ``END`` that follows the factor at the top level; the
+    flavor text, if any, belongs to the last factor.
+
+    Raises:
+        DiceParseError: Exactly as :func:`check_notation` would for the
+            first error within the factor.
+    """
+    recognizer = _Recognizer(text, tokens)
+    recognizer._factor()
+    tok = tokens[recognizer._pos]
+    if tok.kind == FLAVOR:
+        recognizer._pos += 1
+        recognizer._expect(END, "end of text")
+    elif recognizer._pos != len(tokens) - 1:
+        raise recognizer._error(tok, "end of text")
@@ -0,0 +1,227 @@
+"""Incremental validation for editors that re-check on every keystroke.
+
+:func:`parse_state` validates an expression once and keeps what it learned:
+the token stream and which top-level factors were found valid.
+:func:`reparse` (or :meth:`ParseState.edit`) applies an edit to that state
+and re-validates only what the edit can have changed:
+
+* The lexer restarts at the last token that ends before the edit and stops
+  as soon as it produces a token that lines up with the old stream again;
+  the rest of the old tokens are reused, shifted by the edit's length.
+* The token stream is split into top-level factors at depth-0 operators.
+  A factor whose tokens lie entirely outside the re-lexed span and was
+  valid before is not checked again.
+
+The reported errors are the ones :func:`dice.grammar.validate` reports for
+the edited text with the ``descent`` backend, positions included. The cheap
+:func:`~dice.grammar.prescan.prescan` limits always run on the whole text.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+from dice.errors import DiceParseError
+from dice.grammar.descent import check_factor
+from dice.grammar.lexer import (
+    END,
+    LPAREN,
+    MODAL_KINDS,
+    OPERATOR,
+    RPAREN,
+    Token,
+    iter_tokens,
+    tokenize,
+)
+from dice.grammar.parser import _locate
+from dice.grammar.prescan import prescan
+
+# A top-level factor as (first token index, terminator token index).
+_Span = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class ParseState:
+    """The validation result for one version of an expression.
+
+    Only ``expression`` and ``errors`` are public; the rest is what
+    :func:`reparse` reuses, in coordinates of the stripped expression.
+    """
+
+    expression: str
+    errors: list[DiceParseError]
+    _offset: int = field(default=0, repr=False, compare=False)
+    _tokens: list[Token] | None = field(default=None, repr=False, compare=False)
+    _starts: list[int] = field(default_factory=list, repr=False, compare=False)
+    _valid: frozenset[_Span] = field(
+        default_factory=frozenset, repr=False, compare=False
+    )
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    def edit(self, offset: int, deleted: int, inserted: str) -> ParseState:
+        """Return the state after replacing *deleted* characters at *offset*."""
+        return reparse(self, offset, deleted, inserted)
+
+
+def parse_state(expression: str) -> ParseState:
+    """Validate *expression* from scratch, keeping state for :func:`reparse`."""
+    return _validate(expression)
+
+
+def reparse(
+    state: ParseState, offset: int, deleted: int, inserted: str
+) -> ParseState:
+    """Apply an edit to *state* and re-validate the affected span.
+
+    Args:
+        state: The state of the expression before the edit.
+        offset: Index in ``state.expression`` where the edit starts.
+        deleted: Number of characters removed at *offset*.
+        inserted: Text inserted at *offset* in their place.
+
+    Raises:
+        ValueError: If the edit does not lie within ``state.expression``.
+    """
+    old = state.expression
+    if offset < 0 or deleted < 0 or offset + deleted > len(old):
+        raise ValueError(
+            f"Edit at {offset} deleting {deleted} character(s) is out of range "
+            f"for an expression of length {len(old)}"
+        )
+    expression = old[:offset] + inserted + old[offset + deleted :]
+
+    tokens = state._tokens
+    if tokens is None:
+        return _validate(expression)
+    start = offset - state._offset
+    if (
+        start < 0
+        or start + deleted > tokens[-1].end
+        or len(expression) - len(expression.lstrip()) != state._offset
+    ):
+        # The edit reaches into leading or trailing whitespace.
+        return _validate(expression)
+    return _validate(expression, state, (start, deleted, len(inserted)))
+
+
+def _validate(
+    expression: str,
+    previous: ParseState | None = None,
+    edit: tuple[int, int, int] | None = None,
+) -> ParseState:
+    if not expression.strip():
+        error = DiceParseError(
+            code="EMPTY_EXPRESSION",
+            message="Expression is empty",
+            position=0,
+            expression=expression,
+        )
+        return ParseState(expression, [error])
+
+    text = expression.strip()
+    offset = len(expression) - len(expression.lstrip())
+    try:
+        prescan(text)
+        if previous is None or edit is None:
+            tokens = tokenize(text)
+            keep, tail, shift = 0, len(tokens), 0
+        else:
+            tokens, keep, tail, shift = _relex(previous, text, *edit)
+    except Exception as exc:
+        return ParseState(expression, [_locate(exc, expression, offset)])
+
+    old_valid = previous._valid if previous is not None else frozenset()
+    valid: set[_Span] = set()
+    errors: list[DiceParseError] = []
+    for first, last in _factors(tokens):
+        if last < keep:
+            reused = (first, last) in old_valid
+        elif first >= tail:
+            reused = (first - shift, last - shift) in old_valid
+        else:
+            reused = False
+        if not reused:
+            try:
+                check_factor(text, tokens[first : last + 1])
+            except Exception as exc:
+                errors.append(_locate(exc, expression, offset))
+                break
+        valid.add((first, last))
+
+    return ParseState(
+        expression,
+        errors,
+        _offset=offset,
+        _tokens=tokens,
+        _starts=[tok.start for tok in tokens],
+        _valid=frozenset(valid),
+    )
+
+
+def _relex(
+    previous: ParseState, text: str, start: int, deleted: int, inserted: int
+) -> tuple[list[Token], int, int, int]:
+    """Re-tokenize *text* around an edit, reusing tokens of *previous*.
+
+    Returns ``(tokens, keep, tail, shift)``: ``tokens[:keep]`` are unchanged
+    old tokens and ``tokens[tail:]`` are old tokens ``tail - shift`` onwards,
+    moved by the edit.
+    """
+    old = previous._tokens
+    starts = previous._starts
+    assert old is not None
+    delta = inserted - deleted
+
+    # Restart after the last token that ends before the edit and leaves the
+    # lexer in its default mode.
+    keep = bisect_left(starts, start)
+    while keep and (old[keep - 1].end >= start or old[keep - 1].kind in MODAL_KINDS):
+        keep -= 1
+    tokens = old[:keep]
+    pos = tokens[-1].end if tokens else 0
+
+    edit_end = start + inserted
+    for tok in iter_tokens(text, pos):
+        if tok.start >= edit_end and tok.kind != END and tok.kind not in MODAL_KINDS:
+            # Past the edit, a token equal to a moved old token means the
+            # lexer is back in step with the old stream.
+            j = bisect_left(starts, tok.start - delta)
+            if j < len(old) and old[j] == (
+                tok.kind,
+                tok.text,
+                tok.start - delta,
+                tok.end - delta,
+            ):
+                tail = len(tokens)
+                if delta:
+                    tokens.extend(
+                        Token(t.kind, t.text, t.start + delta, t.end + delta)
+                        for t in old[j:]
+                    )
+                else:
+                    tokens.extend(old[j:])
+                return tokens, keep, tail, tail - j
+        tokens.append(tok)
+    return tokens, keep, len(tokens), 0
+
+
+def _factors(tokens: list[Token]) -> list[_Span]:
+    """Split *tokens* at ``END`` and at the operators outside parentheses."""
+    spans: list[_Span] = []
+    depth = 0
+    first = 0
+    for i, tok in enumerate(tokens):
+        kind = tok.kind
+        if kind == LPAREN:
+            depth += 1
+        elif kind == RPAREN:
+            if depth:
+                depth -= 1
+        elif kind == END or (kind == OPERATOR and depth == 0):
+            spans.append((first, i))
+            first = i + 1
+    return spans
@@ -0,0 +1,166 @@
+"""Single-pass tokenizer for dice notation.
+
+The lexer is mode-aware: after a ``d`` it reads dice sides, and after the
+sides it reads modifier suffixes as whole tokens (``kh3``, ``!>=5``,
+``ro<2``), mirroring the ``Combine`` tokens of the pyparsing grammar.
+Whitespace may separate tokens but never appears inside one.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from typing import NamedTuple
+
+from dice.errors import DiceParseError
+
+# Token kinds
+INT = "INT"
+FLOAT = "FLOAT"
+DICE = "DICE"
+SIDES = "SIDES"
+MODIFIER = "MODIFIER"
+FUNCTION = "FUNCTION"
+OPERATOR = "OPERATOR"
+LPAREN = "LPAREN"
+RPAREN = "RPAREN"
+FLAVOR = "FLAVOR"
+END = "END"
+
+_WHITESPACE = " \t\r\n"
+
+_NUMBER_RE = re.compile(r"(\d+\.\d+)|(\d+)", re.ASCII)
+_FUNCTION_RE = re.compile(
+    r"(floor|ceil|round|abs)(?![A-Za-z0-9_$])", re.IGNORECASE | re.ASCII
+)
+_SIDES_RE = re.compile(r"fate|f|%|\d+", re.IGNORECASE | re.ASCII)
+_COMPARE = r"(?:>=|<=|>|<|=)\d+"
+_MODIFIER_RE = re.compile(
+    rf"(kh|kl|k)(\d*)"  # keep
+    rf"|(dh|dl)(\d*)"  # drop
+    rf"|((?-i:!!|!p|!))({_COMPARE})?"  # explode / compound / penetrate
+    rf"|(ro|r)({_COMPARE})?",  # reroll
+    re.IGNORECASE | re.ASCII,
+)
+_SINGLE = {
+    "+": OPERATOR,
+    "-": OPERATOR,
+    "*": OPERATOR,
+    "/": OPERATOR,
+    "(": LPAREN,
+    ")": RPAREN,
+}
+
+
+class Token(NamedTuple):
+    kind: str
+    text: str
+    start: int
+    end: int
+
+
+# Token kinds after which the lexer is no longer in its default mode.
+MODAL_KINDS = frozenset({DICE, SIDES, MODIFIER})
+
+
+def tokenize(text: str) -> list[Token]:
+    """Split *text* into tokens, always ending with an ``END`` token.
+
+    Raises:
+        DiceParseError: With code ``PARSE_ERROR`` on an unexpected character.
+    """
+    return list(iter_tokens(text))
+
+
+def iter_tokens(text: str, pos: int = 0) -> Iterator[Token]:
+    """Lazily tokenize *text* from *pos*, which must be a default-mode position.
+
+    A position is in default mode at the start of the text or after any token
+    whose kind is not in :data:`MODAL_KINDS`.
+
+    Raises:
+        DiceParseError: With code ``PARSE_ERROR`` on an unexpected character.
+    """
+    length = len(text)
+    after_dice = False  # the previous token was 'd'
+    in_modifiers = False  # the previous token was sides or a modifier
+
+    while True:
+        while pos < length and text[pos] in _WHITESPACE:
+            pos += 1
+        if pos >= length:
+            yield Token(END, "", length, length)
+            return
+
+        if after_dice:
+            after_dice = False
+            m = _SIDES_RE.match(text, pos)
+            if m is not None:
+                yield Token(SIDES, m.group(), pos, m.end())
+                pos = m.end()
+                in_modifiers = True
+                continue
+
+        if in_modifiers:
+            m = _MODIFIER_RE.match(text, pos)
+            if m is not None:
+                yield Token(MODIFIER, _normalize_modifier(m), pos, m.end())
+                pos = m.end()
+                continue
+            in_modifiers = False
+
+        ch = text[pos]
+        kind = _SINGLE.get(ch)
+        if kind is not None:
+            yield Token(kind, ch, pos, pos + 1)
+            pos += 1
+            continue
+
+        if "0" <= ch <= "9":
+            m = _NUMBER_RE.match(text, pos)
+            assert m is not None
+            kind = FLOAT if m.group(1) else INT
+            yield Token(kind, m.group(), pos, m.end())
+            pos = m.end()
+            continue
+
+        if ch == "[":
+            close = text.find("]", pos + 1)
+            if close == -1:
+                raise _error(text, pos, "Unterminated flavor text")
+            yield Token(FLAVOR, text[pos + 1 : close], pos, close + 1)
+            pos = close + 1
+            continue
+
+        m = _FUNCTION_RE.match(text, pos)
+        if m is not None:
+            yield Token(FUNCTION, m.group().lower(), pos, m.end())
+            pos = m.end()
+            continue
+
+        if ch in "dD":
+            yield Token(DICE, "d", pos, pos + 1)
+            pos += 1
+            after_dice = True
+            continue
+
+        raise _error(text, pos, f"Unexpected character {ch!r}")
+
+
+def _normalize_modifier(m: re.Match[str]) -> str:
+    """Lower-case the modifier key, keeping its argument or compare point."""
+    groups = m.groups()
+    for i in range(0, len(groups), 2):
+        key = groups[i]
+        if key is not None:
+            return key.lower() + (groups[i + 1] or "")
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def _error(text: str, pos: int, message: str) -> DiceParseError:
+    return DiceParseError(
+        code="PARSE_ERROR",
+        message=f"{message} (at char {pos})",
+        position=pos,
+        expression=text,
+    )
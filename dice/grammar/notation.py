@@ -80,8 +80,8 @@ _modifier = (_keep_mod | _drop_mod | _explode_mod | _reroll_mod).setName("modifi
 
 _dice_count = Word(nums).setResultsName("count").setName("dice_count")
 _dice_sides = (
-    CaselessLiteral("F")
-    | CaselessLiteral("fate")
+    CaselessLiteral("fate")
+    | CaselessLiteral("F")
     | Literal("%")
     | Word(nums)
 ).setResultsName("sides").setName("dice_sides")
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from dice.errors import DiceParseError
+from dice.modifiers.registry import ModifierPlan, compile_modifier_plan
 from dice.terms import (
     DiceTerm,
     FateDiceTerm,
@@ -12,6 +14,107 @@ from dice.terms import (
     RollTerm,
 )
 
+# ---------------------------------------------------------------------------
+# Backend-neutral term builders (shared by every parser backend)
+# ---------------------------------------------------------------------------
+
+
+def build_dice_term(
+    count: int,
+    sides: str,
+    modifier_strings: list[str],
+    position: int | None = None,
+) -> DiceTerm | FateDiceTerm:
+    """Build a dice term from its count, raw sides token and modifiers.
+
+    The modifier suffixes are resolved into a modifier plan here, so bad
+    modifier notation is reported at parse time.
+
+    Raises:
+        DiceParseError: With code ``INVALID_MODIFIER`` if the modifiers
+            cannot be resolved.
+    """
+    faces = sides_to_faces(sides)
+    plan = compile_dice_modifiers(modifier_strings, faces, position)
+
+    if sides.upper() in ("F", "FATE"):
+        return FateDiceTerm(
+            count=count, modifier_strings=modifier_strings, modifier_plan=plan
+        )
+    return DiceTerm(
+        count=count,
+        faces=faces,
+        modifier_strings=modifier_strings,
+        modifier_plan=plan,
+    )
+
+
+def sides_to_faces(sides: str) -> int:
+    """Return the face count for a raw sides token (``6``, ``%``, ``F``)."""
+    if sides.upper() in ("F", "FATE"):
+        return 3
+    return 100 if sides == "%" else int(sides)
+
+
+def compile_dice_modifiers(
+    modifier_strings: list[str], faces: int, position: int | None = None
+) -> ModifierPlan:
+    """Resolve modifier suffixes, reporting bad notation as a parse error.
+
+    Raises:
+        DiceParseError: With code ``INVALID_MODIFIER``.
+    """
+    try:
+        return compile_modifier_plan(modifier_strings, faces)
+    except ValueError as exc:
+        raise DiceParseError(
+            code="INVALID_MODIFIER", message=str(exc), position=position
+        ) from None
+
+
+def build_parenthetical(children: list[RollTerm]) -> ParentheticalTerm:
+    return ParentheticalTerm(
+        expression="(" + render_infix(children) + ")", children=children
+    )
+
+
+def build_function(name: str, children: list[RollTerm]) -> FunctionTerm:
+    return FunctionTerm(function=name.lower(), children=children)
+
+
+def render_infix(children: list[RollTerm]) -> str:
+    """Render an infix term sequence back to canonical notation."""
+    return "".join(_render(term) for term in children)
+
+
+def render_number(value: int | float) -> str:
+    """Render a number as notation that parses back to it.
+
+    The grammar has no unary minus, so negative values are written as a
+    subtraction from zero: ``(0-3)``.
+    """
+    text = str(value)
+    return f"(0-{text[1:]})" if text.startswith("-") else text
+
+
+def _render(term: RollTerm) -> str:
+    if isinstance(term, NumericTerm):
+        return render_number(term.value)
+    if isinstance(term, OperatorTerm):
+        return term.operator
+    if isinstance(term, DiceTerm):
+        return term.notation
+    if isinstance(term, ParentheticalTerm):
+        return term.expression
+    if isinstance(term, FunctionTerm):
+        return f"{term.function}({render_infix(term.children)})"
+    return term.kind
+
+
+# ---------------------------------------------------------------------------
+# pyparsing parse actions
+# ---------------------------------------------------------------------------
+
 
 def make_integer(string: str, location: int, tokens: Any) -> NumericTerm:
     return NumericTerm(value=int(tokens[0]))
@@ -24,57 +127,44 @@ def make_float(string: str, location: int, tokens: Any) -> NumericTerm:
 def make_dice_term(string: str, location: int, tokens: Any) -> DiceTerm | FateDiceTerm:
     tok = tokens[0]
     count = int(tok.get("count", 1))
-    sides_raw = tok["sides"]
+    sides_raw = str(tok["sides"])
 
     # Collect modifier strings
     modifier_strings: list[str] = list(tok.get("modifiers", []))
 
-    if isinstance(sides_raw, str) and sides_raw.upper() in ("F", "FATE"):
-        return FateDiceTerm(count=count, modifier_strings=modifier_strings)
-
-    if isinstance(sides_raw, str) and sides_raw == "%":
-        faces = 100
-    else:
-        faces = int(sides_raw)
-
-    return DiceTerm(count=count, faces=faces, modifier_strings=modifier_strings)
+    return build_dice_term(count, sides_raw, modifier_strings, location)
 
 
 def make_parenthetical(string: str, location: int, tokens: Any) -> ParentheticalTerm:
-    inner_items = tokens[0]
-    children: list[RollTerm] = []
-    for item in inner_items:
-        if isinstance(item, RollTerm):
-            children.append(item)
-        elif isinstance(item, list):
-            children.extend(item)
-    # Reconstruct expression text from the matched portion
-    expr_text = "(" + "+".join("..." for _ in children) + ")"
-    return ParentheticalTerm(expression=expr_text, children=children)
+    return build_parenthetical(_flatten(tokens[0]))
 
 
 def make_function(string: str, location: int, tokens: Any) -> FunctionTerm:
     tok = tokens[0]
-    fn_name = tok[0].lower()
-    inner_terms: list[RollTerm] = list(tok[1:])
-    return FunctionTerm(function=fn_name, children=inner_terms)
+    return build_function(tok[0], _flatten(tok[1:]))
+
 
+def _flatten(items: Any) -> list[RollTerm]:
+    """Flatten nested token groups into a single [term, op, term, ...] list.
 
-def _flatten_infix(tokens: Any) -> list[RollTerm]:
-    """Flatten pyparsing infixNotation result into [term, op, term, ...] list."""
-    items = tokens[0]
+    Higher-precedence operations come back from ``infixNotation`` as nested
+    groups; the AST keeps one flat infix sequence per level and leaves
+    precedence to :func:`compute_infix_total`.
+    """
     result: list[RollTerm] = []
     for item in items:
-        if isinstance(item, str):
-            result.append(OperatorTerm(operator=item))
-        elif isinstance(item, RollTerm):
+        if isinstance(item, RollTerm):
             result.append(item)
+        elif isinstance(item, str):
+            result.append(OperatorTerm(operator=item))
+        else:
+            result.extend(_flatten(item))
     return result
 
 
 def make_add_sub(string: str, location: int, tokens: Any) -> Any:
-    return _flatten_infix(tokens)
+    return [_flatten(tokens[0])]
 
 
 def make_mul_div(string: str, location: int, tokens: Any) -> Any:
-    return _flatten_infix(tokens)
+    return [_flatten(tokens[0])]
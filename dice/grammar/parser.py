@@ -1,15 +1,91 @@
 from __future__ import annotations
 
+import importlib
+from collections.abc import Callable
+from dataclasses import replace
+from types import ModuleType
+from typing import Any
+
 from dice.constants import SYNTAX_VERSION
 from dice.errors import DiceParseError
 from dice.grammar.parse_result import ParseResult
-from dice.terms import RollExpression
+from dice.grammar.prescan import prescan
+from dice.terms import ID_STRATEGIES, RollExpression, RollTerm, assign_ids
+
+NotationParser = Callable[[str], tuple[list[RollTerm], str | None]]
+
+# Parser backends, imported on first use so that the pyparsing grammar is
+# only built when it is actually selected. A backend module provides
+# ``parse_notation`` and may provide ``check_notation``, a recognizer used
+# by validate() that raises the same errors without building terms.
+BACKENDS: dict[str, str] = {
+    "descent": "dice.grammar.descent",
+    "pyparsing": "dice.grammar.notation",
+}
+DEFAULT_BACKEND = "descent"
+
+# How parse() names the terms it builds; see dice.terms.ids.
+DEFAULT_ID_STRATEGY = "path"
+
+
+def _load_backend(backend: str) -> ModuleType:
+    try:
+        module_name = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown parser backend: {backend!r}. "
+            f"Must be one of {sorted(BACKENDS)}"
+        ) from None
+    return importlib.import_module(module_name)
+
+
+def parse(
+    expression: str, *, backend: str | None = None, ids: str | None = None
+) -> ParseResult:
+    """Parse a dice expression string into a typed AST of RollTerm objects.
+
+    Input longer than ``MAX_EXPRESSION_LENGTH``, nested deeper than
+    ``MAX_EXPRESSION_DEPTH`` or containing characters that are never valid
+    is rejected by :func:`~dice.grammar.prescan.prescan` before the grammar
+    runs.
+
+    Args:
+        expression: The dice expression to parse.
+        backend: Parser backend name (``"descent"`` or ``"pyparsing"``).
+            Defaults to :data:`DEFAULT_BACKEND`. Both produce the same AST
+            and error codes.
+        ids: Term id strategy (``"path"`` or ``"uuid"``, see
+            :mod:`dice.terms.ids`). Defaults to :data:`DEFAULT_ID_STRATEGY`.
+    """
+    ids = ids or DEFAULT_ID_STRATEGY
+    if ids not in ID_STRATEGIES:
+        raise ValueError(
+            f"Unknown id strategy: {ids!r}. Must be one of {ID_STRATEGIES}"
+        )
+    parse_notation: NotationParser = _load_backend(
+        backend or DEFAULT_BACKEND
+    ).parse_notation
+    parsed, error = _run(expression, parse_notation)
+    if error is not None:
+        return _failed(expression, error)
+
+    terms, flavor = parsed
+    ast = RollExpression(expression=expression.strip(), children=terms, label=flavor)
+    assign_ids(ast, ids)
+    return ParseResult(
+        ast=ast,
+        expression=expression,
+        syntax_version=SYNTAX_VERSION,
+    )
 
 
-def parse(expression: str) -> ParseResult:
-    """Parse a dice expression string into a typed AST of RollTerm objects."""
-    from dice.grammar.notation import parse_notation
+def _run(
+    expression: str, notation_fn: Callable[[str], Any]
+) -> tuple[Any, DiceParseError | None]:
+    """Apply *notation_fn* to the stripped expression, capturing the error.
 
+    Error positions are reported relative to the unstripped *expression*.
+    """
     if not expression or not expression.strip():
         error = DiceParseError(
             code="EMPTY_EXPRESSION",
@@ -17,40 +93,52 @@ def parse(expression: str) -> ParseResult:
             position=0,
             expression=expression,
         )
-        dummy = RollExpression(expression=expression, children=[], label=None)
-        return ParseResult(
-            ast=dummy,
-            expression=expression,
-            syntax_version=SYNTAX_VERSION,
-            errors=[error],
-        )
+        return None, error
 
     text = expression.strip()
+    offset = len(expression) - len(expression.lstrip())
     try:
-        terms, flavor = parse_notation(text)
+        prescan(text)
+        return notation_fn(text), None
     except Exception as exc:
-        error = DiceParseError(
-            code="PARSE_ERROR",
-            message=str(exc),
-            expression=expression,
-        )
-        dummy = RollExpression(expression=expression, children=[], label=None)
-        return ParseResult(
-            ast=dummy,
-            expression=expression,
-            syntax_version=SYNTAX_VERSION,
-            errors=[error],
-        )
+        return None, _locate(exc, expression, offset)
+
+
+def _locate(exc: Exception, expression: str, offset: int) -> DiceParseError:
+    """Convert an error raised on the stripped text into one on *expression*."""
+    if isinstance(exc, DiceParseError):
+        position = None if exc.position is None else exc.position + offset
+        return replace(exc, position=position, expression=expression)
+    loc = getattr(exc, "loc", None)
+    return DiceParseError(
+        code="PARSE_ERROR",
+        message=str(exc),
+        position=None if loc is None else loc + offset,
+        expression=expression,
+    )
+
 
-    ast = RollExpression(expression=text, children=terms, label=flavor)
+def _failed(expression: str, error: DiceParseError) -> ParseResult:
+    dummy = RollExpression(expression=expression, children=[], label=None)
     return ParseResult(
-        ast=ast,
+        ast=dummy,
         expression=expression,
         syntax_version=SYNTAX_VERSION,
+        errors=[error],
     )
 
 
-def validate(expression: str) -> list[DiceParseError]:
-    """Validate an expression without executing. Returns errors (empty = valid)."""
-    result = parse(expression)
-    return result.errors
+def validate(
+    expression: str, *, backend: str | None = None
+) -> list[DiceParseError]:
+    """Validate an expression without executing. Returns errors (empty = valid).
+
+    Backends with a recognizer check the notation without allocating any AST
+    objects; the errors are the same ones :func:`parse` would report.
+    """
+    module = _load_backend(backend or DEFAULT_BACKEND)
+    check = getattr(module, "check_notation", None)
+    if check is None:
+        return parse(expression, backend=backend).errors
+    _, error = _run(expression, check)
+    return [] if error is None else [error]
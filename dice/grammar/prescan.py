@@ -0,0 +1,76 @@
+"""Linear-time pre-lexer checks run before any grammar backend.
+
+Rejects input that is too long, nested too deeply, or contains characters
+that can never appear in dice notation, so that hostile input (e.g. a 50KB
+run of ``(``) is turned away before tokenizing, recursive descent or
+pyparsing backtracking start. Flavor text (``[...]``) is not inspected.
+"""
+
+from __future__ import annotations
+
+import re
+
+from dice.constants import MAX_EXPRESSION_DEPTH, MAX_EXPRESSION_LENGTH
+from dice.errors import DiceParseError
+
+# Every character the notation itself can contain: numbers, operators,
+# parentheses, modifier punctuation, whitespace and the letters used by
+# dice, fate sides, modifiers and function names.
+_INVALID_RE = re.compile(
+    r"[^0-9+\-*/().%!<>= \t\r\nabcdefhiklnoprstuABCDEFHIKLNOPRSTU]"
+)
+_PAREN_RE = re.compile(r"[()]")
+
+
+def prescan(
+    text: str,
+    *,
+    max_length: int = MAX_EXPRESSION_LENGTH,
+    max_depth: int = MAX_EXPRESSION_DEPTH,
+) -> None:
+    """Check *text* against the cheap structural limits.
+
+    Raises:
+        DiceParseError: ``EXPRESSION_TOO_LONG`` if *text* is longer than
+            *max_length*, ``EXPRESSION_TOO_DEEP`` if parentheses nest deeper
+            than *max_depth*, or ``PARSE_ERROR`` on a character that is
+            never valid outside flavor text.
+    """
+    if len(text) > max_length:
+        raise DiceParseError(
+            code="EXPRESSION_TOO_LONG",
+            message=(
+                f"Expression length ({len(text)}) exceeds maximum ({max_length})"
+            ),
+            position=max_length,
+            expression=text,
+        )
+
+    flavor = text.find("[")
+    notation = text if flavor == -1 else text[:flavor]
+
+    m = _INVALID_RE.search(notation)
+    if m is not None:
+        raise DiceParseError(
+            code="PARSE_ERROR",
+            message=f"Unexpected character {m.group()!r} (at char {m.start()})",
+            position=m.start(),
+            expression=text,
+        )
+
+    depth = 0
+    for m in _PAREN_RE.finditer(notation):
+        if m.group() == "(":
+            depth += 1
+            if depth > max_depth:
+                raise DiceParseError(
+                    code="EXPRESSION_TOO_DEEP",
+                    message=(
+                        f"Parentheses nest deeper than the maximum ({max_depth}) "
+                        f"(at char {m.start()})"
+                    ),
+                    position=m.start(),
+                    expression=text,
+                )
+        elif depth:
+            depth -= 1
@@ -0,0 +1,10 @@
+import pytest
+
+from dice.grammar import parser
+
+
+@pytest.fixture(autouse=True, params=sorted(parser.BACKENDS))
+def backend(request, monkeypatch):
+    """Run every grammar test once per parser backend."""
+    monkeypatch.setattr(parser, "DEFAULT_BACKEND", request.param)
+    return request.param
@@ -0,0 +1,70 @@
+import pytest
+
+from dice.grammar import parse
+from dice.grammar.parser import BACKENDS
+
+EXPRESSIONS = [
+    "1d6", "d12", "2d20kh1+7", "4d6dl1+2d4+5", "1d20+3*2", "(1d8+3)*2-1d4",
+    "floor(1d6+3)", "FLOOR (2*3+1)", "round(1.5/2)", "abs(1d6-4)",
+    "((1+2)*3)", "1*2+3*4", "4dF", "dF+3", "4dfate", "d%", "1d%kh1",
+    "2 d 6", "2d6 kh3", "2d6KH3", "2d6K3", "2d6R<2", "2d6!>=5", "2d6!>5kh1",
+    "2d6!!", "2d6!p>3", "2d6ro=1", "2d6r", "2d6dh", "4d6r=1kh3",
+    "2d6kh3kh3kh3kh3", "01d06", "0d6", "42", "1.5", "1d20+5 [attack roll]",
+    "1d6 []", "1d6\t+\n2",
+    # Invalid input
+    "xyz", "2d6kh 3", "2d6kh3kh3kh3kh3kh3", "floorx(1)", "1.5d6", "2d6! >5",
+    "1d6 [a] [b]", "[a]", "()", "1+", "d", "2d", "1 2", "2d6d1", "2d6!P",
+    "abs(1)abs(1)", "1d6]", "1d6 [oops", "-3",
+]
+
+
+def _shape(term):
+    """Structural fingerprint of a term, ignoring generated ids."""
+    attrs = {
+        name: getattr(term, name)
+        for name in (
+            "count", "faces", "modifier_strings", "value", "operator",
+            "function", "expression", "label",
+        )
+        if hasattr(term, name)
+    }
+    if isinstance(attrs.get("value"), float):
+        attrs["value_type"] = "float"
+    children = [_shape(c) for c in getattr(term, "children", [])]
+    return (type(term).__name__, attrs, children)
+
+
+@pytest.mark.parametrize("expression", EXPRESSIONS)
+def test_backends_agree(expression):
+    results = {name: parse(expression, backend=name) for name in BACKENDS}
+    reference = results.pop("pyparsing")
+    for name, result in results.items():
+        assert [e.code for e in result.errors] == [
+            e.code for e in reference.errors
+        ], name
+        if not reference.errors:
+            assert _shape(result.ast) == _shape(reference.ast), name
+
+
+def test_descent_reports_position():
+    r = parse("1d6 + xyz", backend="descent")
+    assert r.errors[0].code == "PARSE_ERROR"
+    assert r.errors[0].position == 6
+
+
+def test_position_accounts_for_leading_whitespace():
+    r = parse("  1+", backend="descent")
+    assert r.errors[0].position == 4
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(ValueError, match="Unknown parser backend"):
+        parse("1d6", backend="nope")
+
+
+def test_precedence_total():
+    from dice.execution import execute
+    from dice.rng import SeededRNG
+
+    r = parse("2+3*4-10/3")
+    assert execute(r.ast, rng=SeededRNG(0)).total == 2 + 12 - 3
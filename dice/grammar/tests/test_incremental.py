@@ -0,0 +1,113 @@
+import random
+
+import pytest
+
+from dice.grammar import ParseState, parse_state, reparse, validate
+
+MACRO = (
+    "4d6kh3 + 2d8! + (1d4 * 3) - floor(2d6 / 2) + 3d6r<2 + ceil(1.5 * 2d6) "
+    "+ round(3d4 / 2) - abs(1d6 - 4) + 4dF + (2d6 + 3) * 2 [fire]"
+)
+
+
+def _expected(expression):
+    return validate(expression, backend="descent")
+
+
+def test_parse_state_matches_validate():
+    for expression in ["1d20+5", "2d6+", "(1d6", "", "   ", MACRO]:
+        assert parse_state(expression).errors == _expected(expression)
+
+
+def test_valid_property():
+    assert parse_state("1d20").valid
+    assert not parse_state("1d20+").valid
+
+
+def test_edit_fixes_error():
+    state = parse_state("1d20+")
+    state = state.edit(5, 0, "5")
+    assert state.expression == "1d20+5"
+    assert state.errors == []
+
+
+def test_edit_introduces_error_with_position():
+    state = parse_state("1d20 + 5 + 2d6")
+    state = reparse(state, 7, 1, "*")
+    assert state.expression == "1d20 + * + 2d6"
+    [error] = state.errors
+    assert error.code == "PARSE_ERROR"
+    assert error.position == 7
+    assert error.expression == state.expression
+
+
+def test_positions_include_leading_whitespace():
+    state = parse_state("  1d20 + 5")
+    state = state.edit(9, 1, "")
+    [error] = state.errors
+    assert error.position == 8
+    assert error == _expected("  1d20 + ")[0]
+
+
+def test_edit_inside_modifier():
+    state = parse_state("4d6kh3 + 2")
+    state = state.edit(4, 1, "l")
+    assert state.expression == "4d6kl3 + 2"
+    assert state.errors == []
+    state = state.edit(3, 1, "x")
+    assert state.errors == _expected("4d6xl3 + 2")
+    assert state.errors[0].position == 3
+
+
+def test_edit_inside_flavor_text():
+    state = parse_state("1d6 [fire]")
+    state = state.edit(5, 4, "ice")
+    assert state.expression == "1d6 [ice]"
+    assert state.errors == []
+
+
+def test_edit_to_empty():
+    state = parse_state("1d6")
+    state = state.edit(0, 3, "")
+    [error] = state.errors
+    assert error.code == "EMPTY_EXPRESSION"
+    assert state.edit(0, 0, "2d8").errors == []
+
+
+def test_prescan_limits_apply_to_edits():
+    state = parse_state("1d6")
+    state = state.edit(0, 0, "(" * 100)
+    assert state.errors[0].code == "EXPRESSION_TOO_DEEP"
+
+
+@pytest.mark.parametrize("edit", [(-1, 0, "x"), (0, 4, ""), (2, 2, "")])
+def test_edit_out_of_range(edit):
+    with pytest.raises(ValueError):
+        parse_state("1d6").edit(*edit)
+
+
+def test_state_is_immutable():
+    state = parse_state("1d6")
+    assert isinstance(state, ParseState)
+    state.edit(0, 1, "2")
+    assert state.expression == "1d6"
+
+
+def test_random_edits_match_validate():
+    rng = random.Random(12)
+    alphabet = "0123456789d+-*/() []khlrow!<>=F.ceilfloorabs"
+    for _ in range(300):
+        expression = MACRO
+        state = parse_state(expression)
+        for _ in range(10):
+            offset = rng.randint(0, len(expression))
+            deleted = rng.randint(0, min(3, len(expression) - offset))
+            inserted = "".join(
+                rng.choice(alphabet) for _ in range(rng.randint(0, 3))
+            )
+            expression = (
+                expression[:offset] + inserted + expression[offset + deleted :]
+            )
+            state = state.edit(offset, deleted, inserted)
+            assert state.expression == expression
+            assert state.errors == _expected(expression)
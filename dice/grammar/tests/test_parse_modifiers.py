@@ -80,3 +80,28 @@ def test_parse_modifier_with_arithmetic():
     assert children[0].modifier_strings == ["kh1"]
     assert children[1].kind == "operator_term"
     assert children[2].kind == "numeric_term"
+
+
+def test_parse_resolves_modifier_plan():
+    r = parse("4d6kh3r=1")
+    assert len(r.errors) == 0
+    dt = r.ast.children[0]
+    # Plan is pre-ordered: reroll runs before keep
+    assert [step.spec.key for step in dt.modifier_plan] == ["r", "kh"]
+    assert dt.modifier_plan[0].spec.predicate(1) is True
+    assert dt.modifier_plan[0].spec.predicate(2) is False
+
+
+def test_parse_unmodified_dice_has_empty_plan():
+    r = parse("2d6")
+    assert r.ast.children[0].modifier_plan == ()
+
+
+def test_parse_unregistered_modifier_fails_at_parse_time(monkeypatch):
+    from dice.modifiers import registry
+
+    monkeypatch.delitem(registry._MODIFIER_REGISTRY, "!")
+    r = parse("1d20+2d6!")
+    assert len(r.errors) == 1
+    assert r.errors[0].code == "INVALID_MODIFIER"
+    assert r.errors[0].position == 5
@@ -0,0 +1,78 @@
+import time
+
+import pytest
+
+from dice.constants import MAX_EXPRESSION_DEPTH, MAX_EXPRESSION_LENGTH
+from dice.errors import DiceParseError
+from dice.grammar import parse, validate
+from dice.grammar.prescan import prescan
+from dice.terms import RollTerm
+
+CORPUS = [
+    "1d20+7",
+    "4d6kh3+(2d4*3)",
+    "floor((1d6+5)/2)",
+    "3d6!>=5",
+    "1d20+5 [attack roll]",
+    "  2d6 ",
+    "1d6k",
+    "3d6kh",
+    "1d20+",
+    "(1d6",
+    "1d6)",
+    "2d",
+    "1d20 + x",
+    "1d6 [unterminated",
+    "",
+]
+
+
+def test_too_long_rejected():
+    errors = validate("1+" * MAX_EXPRESSION_LENGTH + "1")
+    assert [e.code for e in errors] == ["EXPRESSION_TOO_LONG"]
+
+
+def test_hostile_nesting_rejected_quickly():
+    hostile = "(" * 50_000
+    start = time.perf_counter()
+    result = parse(hostile)
+    assert time.perf_counter() - start < 0.1
+    assert result.errors[0].code == "EXPRESSION_TOO_LONG"
+    with pytest.raises(DiceParseError, match="EXPRESSION_TOO_DEEP"):
+        prescan(hostile, max_length=len(hostile))
+
+
+def test_depth_limit():
+    ok = "(" * MAX_EXPRESSION_DEPTH + "1" + ")" * MAX_EXPRESSION_DEPTH
+    assert validate(ok) == []
+    deep = "(" + ok + ")"
+    errors = validate(" " + deep)
+    assert errors[0].code == "EXPRESSION_TOO_DEEP"
+    assert errors[0].position == MAX_EXPRESSION_DEPTH + 1
+
+
+def test_invalid_character_position():
+    errors = parse("  1d20 + x").errors
+    assert errors[0].code == "PARSE_ERROR"
+    assert errors[0].position == 9
+
+
+def test_flavor_text_not_scanned():
+    assert validate("1d20 [zzz: {x}]") == []
+
+
+@pytest.mark.parametrize("expr", CORPUS)
+def test_validate_matches_parse(expr):
+    assert validate(expr) == parse(expr).errors
+
+
+def test_validate_builds_no_terms(monkeypatch, backend):
+    if backend != "descent":
+        pytest.skip("only the descent backend provides a recognizer")
+
+    def boom(self, **kwargs):
+        raise AssertionError("term constructed during validate()")
+
+    monkeypatch.setattr(RollTerm, "__init__", boom)
+    for expr in CORPUS:
+        validate(expr)
@@ -1,19 +1,37 @@
-from dice.modifiers.base import ModifierFn, ModifierSpec, matches_compare_point
+from dice.modifiers.base import (
+    ComparePoint,
+    ModifierFn,
+    ModifierSpec,
+    compile_compare_point,
+    matches_compare_point,
+)
 from dice.modifiers.parser import parse_modifier_string
 from dice.modifiers.registry import (
     MODIFIER_ORDER,
+    ModifierPlan,
+    ModifierStep,
     apply_modifiers,
+    apply_plan,
+    compile_modifier_plan,
     get_modifier,
     register_modifier,
+    resolve_modifiers,
 )
 
 __all__ = [
     "MODIFIER_ORDER",
+    "ComparePoint",
     "ModifierFn",
+    "ModifierPlan",
     "ModifierSpec",
+    "ModifierStep",
     "apply_modifiers",
+    "apply_plan",
+    "compile_compare_point",
+    "compile_modifier_plan",
     "get_modifier",
     "matches_compare_point",
     "parse_modifier_string",
     "register_modifier",
+    "resolve_modifiers",
 ]
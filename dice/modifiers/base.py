@@ -1,20 +1,46 @@
 from __future__ import annotations
 
+import operator
 import re
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from dice.rng import RNG
 from dice.terms.die_result import DieResult
 
 
-@dataclass
+@dataclass(frozen=True)
+class ComparePoint:
+    """A compiled compare point such as ``>=5``; call it with a die value."""
+
+    op: str
+    threshold: int
+    _test: Callable[[int, int], bool] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        try:
+            test = _COMPARE_OPS[self.op]
+        except KeyError:
+            raise ValueError(f"Invalid compare operator: {self.op!r}") from None
+        object.__setattr__(self, "_test", test)
+
+    def __call__(self, value: int) -> bool:
+        return self._test(value, self.threshold)
+
+
+@dataclass(frozen=True)
 class ModifierSpec:
     """A parsed modifier with its key and arguments."""
 
     key: str  # e.g. "kh", "dl", "!", "r"
     argument: int | None = None  # e.g. 3 in "kh3"
     compare_point: str | None = None  # e.g. "<2" in "r<2"
+    # Pre-compiled compare point, filled in when a modifier plan is built
+    predicate: ComparePoint | None = field(
+        default=None, repr=False, compare=False
+    )
 
 
 # Type alias for modifier functions.
@@ -24,6 +50,35 @@ ModifierFn = Callable[[list[DieResult], ModifierSpec, RNG, int], list[DieResult]
 
 _COMPARE_RE = re.compile(r"^(>=|<=|>|<|=)(\d+)$")
 
+_COMPARE_OPS: dict[str, Callable[[int, int], bool]] = {
+    "=": operator.eq,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
+
+
+def compile_compare_point(compare_point: str | None, faces: int) -> ComparePoint:
+    """Compile a compare point expression into a reusable predicate.
+
+    If *compare_point* is ``None``, the predicate is ``value == faces``
+    (used by explode).
+    """
+    if compare_point is None:
+        return ComparePoint("=", faces)
+    m = _COMPARE_RE.match(compare_point)
+    if m is None:
+        raise ValueError(f"Invalid compare point: {compare_point!r}")
+    return ComparePoint(m.group(1), int(m.group(2)))
+
+
+def spec_predicate(spec: ModifierSpec, faces: int) -> ComparePoint:
+    """Return the compiled compare point for *spec*, compiling it if needed."""
+    if spec.predicate is not None:
+        return spec.predicate
+    return compile_compare_point(spec.compare_point, faces)
+
 
 def matches_compare_point(
     value: int, compare_point: str | None, faces: int
@@ -33,20 +88,4 @@ def matches_compare_point(
     If *compare_point* is ``None``, defaults to ``value == faces``
     (used by explode).
     """
-    if compare_point is None:
-        return value == faces
-    m = _COMPARE_RE.match(compare_point)
-    if m is None:
-        raise ValueError(f"Invalid compare point: {compare_point!r}")
-    op, threshold_str = m.group(1), int(m.group(2))
-    if op == "=":
-        return value == threshold_str
-    if op == ">":
-        return value > threshold_str
-    if op == "<":
-        return value < threshold_str
-    if op == ">=":
-        return value >= threshold_str
-    if op == "<=":
-        return value <= threshold_str
-    return False  # pragma: no cover
+    return compile_compare_point(compare_point, faces)(value)
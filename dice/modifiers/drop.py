@@ -12,7 +12,8 @@ def drop_highest(
     n = spec.argument if spec.argument is not None else 1
     active = [(i, r) for i, r in enumerate(results) if not r.rerolled]
     ranked = sorted(active, key=lambda pair: pair[1].value)
-    drop_indices = {i for i, _ in ranked[-n:]}
+    # Not ranked[-n:], which drops every die when n is 0.
+    drop_indices = {i for i, _ in ranked[max(len(ranked) - n, 0) :]}
     for i, r in active:
         r.kept = i not in drop_indices
     return results
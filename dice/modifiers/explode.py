@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-from dice.constants import MAX_EXPLOSIONS
-from dice.errors import DiceExecutionError
-from dice.modifiers.base import ModifierFn, ModifierSpec, matches_compare_point
-from dice.rng import RNG, roll_die
+from dice.modifiers.base import ModifierFn, ModifierSpec, spec_predicate
+from dice.rng import RNG, roll_dice
+from dice.rng.budget import budget_of
 from dice.terms.die_result import DieResult
 
 
@@ -12,27 +11,21 @@ def explode(
 ) -> list[DieResult]:
     """Exploding dice: reroll any die meeting the compare point and add it.
 
-    Repeats until no new die meets the condition or MAX_EXPLOSIONS is hit.
+    Repeats until no new die meets the condition. Each explosion is charged
+    to the execution budget of *rng*, which raises once it is exhausted.
     Default compare point: ``= faces`` (i.e. max value).
     """
-    explosions = 0
-    new_dice = [
-        r for r in results
-        if matches_compare_point(r.value, spec.compare_point, faces)
-    ]
+    matches = spec_predicate(spec, faces)
+    budget = budget_of(rng)
+    new_dice = [r for r in results if matches(r.value)]
     while new_dice:
+        # Each round's explosions are drawn in bulk.
+        budget.spend_iterations(len(new_dice))
         next_round: list[DieResult] = []
-        for _ in new_dice:
-            explosions += 1
-            if explosions > MAX_EXPLOSIONS:
-                raise DiceExecutionError(
-                    code="MAX_EXPLOSIONS_EXCEEDED",
-                    message=f"Exceeded maximum explosion count ({MAX_EXPLOSIONS})",
-                )
-            value = roll_die(faces, rng)
+        for value in roll_dice(len(new_dice), faces, rng):
             dr = DieResult(value=value, exploded=True)
             results.append(dr)
-            if matches_compare_point(value, spec.compare_point, faces):
+            if matches(value):
                 next_round.append(dr)
         new_dice = next_round
     return results
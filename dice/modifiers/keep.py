@@ -12,7 +12,8 @@ def keep_highest(
     n = spec.argument if spec.argument is not None else 1
     active = [(i, r) for i, r in enumerate(results) if not r.rerolled]
     ranked = sorted(active, key=lambda pair: pair[1].value)
-    keep_indices = {i for i, _ in ranked[-n:]}
+    # Not ranked[-n:], which keeps every die when n is 0.
+    keep_indices = {i for i, _ in ranked[max(len(ranked) - n, 0) :]}
     for i, r in active:
         r.kept = i in keep_indices
     return results
@@ -34,4 +35,5 @@ def keep_lowest(
 KEEP_MODIFIERS: dict[str, ModifierFn] = {
     "kh": keep_highest,
     "kl": keep_lowest,
+    "k": keep_highest,  # Roll20 shorthand for kh
 }
@@ -10,7 +10,7 @@ _MODIFIER_KEYS = [
     "min", "max",
     "!!", "!p", "!",
     "ro", "r",
-    "kh", "kl",
+    "kh", "kl", "k",
     "dh", "dl",
     ">=", "<=", ">", "<", "=",
     "cs", "cf",
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
-from dice.modifiers.base import ModifierFn, ModifierSpec
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
+
+from dice.errors import DiceValidationError
+from dice.modifiers.base import ModifierFn, ModifierSpec, compile_compare_point
+from dice.modifiers.parser import parse_modifier_string
 from dice.rng import RNG
 from dice.terms.die_result import DieResult
 
+if TYPE_CHECKING:
+    from dice.terms.dice_term import DiceTerm
+
 # Fixed execution order — modifiers are applied in this order regardless
 # of the order they appear in the notation.
 MODIFIER_ORDER: list[str] = [
     "min", "max",           # 1-2: clamp
     "!", "!!", "!p",        # 3: explode/compound/penetrate
     "r", "ro",              # 4: reroll
-    "kh", "kl",             # 5: keep
+    "kh", "kl", "k",        # 5: keep
     "dh", "dl",             # 6: drop
     ">", "<", "=",          # 7: target/success
     "f",                    # 8: failure
@@ -21,6 +29,18 @@ MODIFIER_ORDER: list[str] = [
 _MODIFIER_REGISTRY: dict[str, ModifierFn] = {}
 
 
+@dataclass(frozen=True)
+class ModifierStep:
+    """One resolved modifier: the function to run and its compiled spec."""
+
+    fn: ModifierFn
+    spec: ModifierSpec
+
+
+# A pre-validated, pre-ordered sequence of modifier steps for one dice term.
+ModifierPlan = tuple[ModifierStep, ...]
+
+
 def register_modifier(key: str, fn: ModifierFn) -> None:
     """Register a modifier function for a given key."""
     _MODIFIER_REGISTRY[key] = fn
@@ -40,6 +60,62 @@ def _order_key(spec: ModifierSpec) -> int:
         return len(MODIFIER_ORDER)
 
 
+def resolve_modifiers(
+    modifier_specs: list[ModifierSpec], faces: int
+) -> ModifierPlan:
+    """Resolve specs into a plan: sorted, bound to functions, predicates compiled.
+
+    The *modifier_specs* are sorted by ``MODIFIER_ORDER`` position, so
+    ``4d6r1kh3`` and ``4d6kh3r1`` produce identical plans.
+
+    Raises:
+        ValueError: If a key has no registered modifier or a compare point
+            is malformed.
+    """
+    steps: list[ModifierStep] = []
+    for spec in sorted(modifier_specs, key=_order_key):
+        fn = _MODIFIER_REGISTRY.get(spec.key)
+        if fn is None:
+            raise ValueError(f"No modifier registered for key: {spec.key!r}")
+        predicate = compile_compare_point(spec.compare_point, faces)
+        steps.append(ModifierStep(fn=fn, spec=replace(spec, predicate=predicate)))
+    return tuple(steps)
+
+
+def compile_modifier_plan(modifier_strings: list[str], faces: int) -> ModifierPlan:
+    """Parse and resolve a dice term's modifier suffixes into a plan.
+
+    Raises:
+        ValueError: If the notation is unrecognized or cannot be resolved.
+    """
+    if not modifier_strings:
+        return ()
+    return resolve_modifiers(parse_modifier_string("".join(modifier_strings)), faces)
+
+
+def modifier_plan_for(term: DiceTerm) -> ModifierPlan:
+    """Return a dice term's resolved modifier plan, compiling it if needed.
+
+    Raises:
+        DiceValidationError: If the term's modifiers cannot be resolved.
+    """
+    if term.modifier_plan is not None:
+        return term.modifier_plan
+    try:
+        return compile_modifier_plan(term.modifier_strings, term.faces)
+    except ValueError as exc:
+        raise DiceValidationError(code="INVALID_MODIFIER", message=str(exc)) from None
+
+
+def apply_plan(
+    results: list[DieResult], plan: ModifierPlan, rng: RNG, faces: int
+) -> list[DieResult]:
+    """Run an already-resolved modifier plan over *results*."""
+    for step in plan:
+        results = step.fn(results, step.spec, rng, faces)
+    return results
+
+
 def apply_modifiers(
     results: list[DieResult],
     modifier_specs: list[ModifierSpec],
@@ -51,13 +127,7 @@ def apply_modifiers(
     The *modifier_specs* are sorted by ``MODIFIER_ORDER`` position before
     execution, so ``4d6r1kh3`` and ``4d6kh3r1`` produce identical results.
     """
-    sorted_specs = sorted(modifier_specs, key=_order_key)
-    for spec in sorted_specs:
-        fn = _MODIFIER_REGISTRY.get(spec.key)
-        if fn is None:
-            raise ValueError(f"No modifier registered for key: {spec.key!r}")
-        results = fn(results, spec, rng, faces)
-    return results
+    return apply_plan(results, resolve_modifiers(modifier_specs, faces), rng, faces)
 
 
 def _register_all_builtins() -> None:
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from dice.constants import MAX_EXPLOSIONS
-from dice.modifiers.base import ModifierFn, ModifierSpec, matches_compare_point
-from dice.rng import RNG, roll_die
+from dice.modifiers.base import ModifierFn, ModifierSpec, spec_predicate
+from dice.rng import RNG, roll_dice
+from dice.rng.budget import budget_of
 from dice.terms.die_result import DieResult
 
 
@@ -14,30 +14,27 @@ def _reroll(
     *,
     once: bool,
 ) -> list[DieResult]:
-    """Shared implementation for reroll and reroll-once."""
-    iterations = 0
-    to_check = [
-        r for r in results
-        if matches_compare_point(r.value, spec.compare_point, faces)
-    ]
+    """Shared implementation for reroll and reroll-once.
+
+    Each reroll is charged to the execution budget of *rng*, which raises
+    once it is exhausted.
+    """
+    matches = spec_predicate(spec, faces)
+    budget = budget_of(rng)
+    to_check = [r for r in results if matches(r.value)]
     while to_check:
+        # Each round's rerolls are drawn in bulk.
+        budget.spend_iterations(len(to_check))
         next_round: list[DieResult] = []
-        for die in to_check:
-            iterations += 1
-            if iterations > MAX_EXPLOSIONS:
-                # Safety valve — prevent infinite reroll loops
-                break
+        values = roll_dice(len(to_check), faces, rng)
+        for die, value in zip(to_check, values):
             die.rerolled = True
             die.kept = False
-            replacement = DieResult(value=roll_die(faces, rng))
-            results.append(replacement)
-            if (
-                not once
-                and matches_compare_point(replacement.value, spec.compare_point, faces)
-            ):
+            results.append(DieResult(value=value))
+            # Re-read it: packed results store a copy of what is appended.
+            replacement = results[-1]
+            if not once and matches(replacement.value):
                 next_round.append(replacement)
-        if iterations > MAX_EXPLOSIONS:
-            break
         to_check = next_round
     return results
 
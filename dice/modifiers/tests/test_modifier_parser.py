@@ -103,3 +103,21 @@ def test_parse_empty_string():
 def test_parse_invalid_raises():
     with pytest.raises(ValueError, match="Unrecognized modifier"):
         parse_modifier_string("zz")
+
+
+def test_parse_keep_shorthand():
+    specs = parse_modifier_string("k3")
+    assert len(specs) == 1
+    assert specs[0].key == "k"
+    assert specs[0].argument == 3
+
+
+def test_compile_compare_point():
+    from dice.modifiers.base import compile_compare_point
+
+    assert compile_compare_point(">=5", faces=6)(5) is True
+    assert compile_compare_point(">=5", faces=6)(4) is False
+    # No compare point means "equals max face"
+    assert compile_compare_point(None, faces=6)(6) is True
+    with pytest.raises(ValueError, match="Invalid compare point"):
+        compile_compare_point("~3", faces=6)
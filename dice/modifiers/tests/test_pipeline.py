@@ -57,3 +57,46 @@ def test_explode_then_keep():
     # The kept die should be the highest among all (including exploded)
     all_values = [r.value for r in results]
     assert kept[0].value == max(all_values)
+
+
+def test_resolve_modifiers_orders_and_binds():
+    from dice.modifiers.keep import keep_highest
+    from dice.modifiers.registry import resolve_modifiers
+    from dice.modifiers.reroll import reroll
+
+    plan = resolve_modifiers(parse_modifier_string("kh3r<2"), faces=6)
+    assert [step.fn for step in plan] == [reroll, keep_highest]
+    assert plan[1].spec.argument == 3
+    assert plan[0].spec.predicate(1) is True
+    assert plan[0].spec.predicate(2) is False
+
+
+def test_compile_modifier_plan_rejects_bad_notation():
+    import pytest
+
+    from dice.modifiers.registry import compile_modifier_plan
+
+    with pytest.raises(ValueError, match="Unrecognized modifier"):
+        compile_modifier_plan(["zz"], faces=6)
+
+
+def test_grammar_terms_do_not_reparse_modifiers(monkeypatch):
+    from dice.grammar import parse
+    from dice.modifiers import registry
+
+    dt = parse("4d6r=1kh3").ast.children[0]
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("modifier notation re-parsed during evaluation")
+
+    monkeypatch.setattr(registry, "parse_modifier_string", _fail)
+    dt.evaluate(SeededRNG(42))
+    assert len([r for r in dt.results if r.kept]) == 3
+
+
+def test_keep_shorthand_is_keep_highest():
+    dt1 = DiceTerm(count=4, faces=6, modifier_strings=["k3"])
+    dt2 = DiceTerm(count=4, faces=6, modifier_strings=["kh3"])
+    dt1.evaluate(SeededRNG(7))
+    dt2.evaluate(SeededRNG(7))
+    assert [r.kept for r in dt1.results] == [r.kept for r in dt2.results]
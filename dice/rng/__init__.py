@@ -1,11 +1,16 @@
 from dice.rng.base import RNG
+from dice.rng.budget import ExecutionBudget
+from dice.rng.buffered import BufferedSystemRNG
 from dice.rng.default import DefaultRNG
-from dice.rng.roll import roll_die
+from dice.rng.roll import roll_dice, roll_die
 from dice.rng.seeded import SeededRNG
 
 __all__ = [
+    "BufferedSystemRNG",
     "DefaultRNG",
+    "ExecutionBudget",
     "RNG",
     "SeededRNG",
+    "roll_dice",
     "roll_die",
 ]
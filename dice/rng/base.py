@@ -2,6 +2,14 @@ from typing import Protocol
 
 
 class RNG(Protocol):
+    """Source of randomness for rolling dice.
+
+    Implementations may also provide ``randints(n, a, b) -> list[int]``,
+    returning *n* integers in ``[a, b]`` in one call. It is optional: bulk
+    draws go through :func:`~dice.rng.roll.randints`, which falls back to
+    calling ``randint`` *n* times.
+    """
+
     def randint(self, a: int, b: int) -> int:
         """Return a random integer N such that a <= N <= b."""
         ...
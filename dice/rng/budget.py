@@ -0,0 +1,118 @@
+"""Per-execution resource budget, carried alongside the RNG.
+
+An :class:`ExecutionBudget` wraps the RNG of one execution and is passed
+wherever that RNG goes, so every term and modifier draws from, and charges,
+the same budget. It caps, across the whole expression:
+
+* RNG draws (``max_draws``), raising ``MAX_RNG_DRAWS_EXCEEDED``;
+* explosion and reroll iterations (``max_iterations``), raising
+  ``MAX_EXPLOSIONS_EXCEEDED``;
+* wall-clock time (``timeout`` seconds), raising ``DEADLINE_EXCEEDED``.
+
+Draws are only counted, and the clock only read, when a draw limit or a
+timeout is set; otherwise ``randint`` is the wrapped RNG's own method.
+Bulk draws (``randints``) are charged one draw per value.
+"""
+
+from __future__ import annotations
+
+import time
+
+from dice.constants import MAX_EXPLOSIONS
+from dice.errors import DiceExecutionError
+from dice.rng.base import RNG
+from dice.rng.roll import randints
+
+
+class ExecutionBudget:
+    """An :class:`RNG` that enforces the resource limits of one execution."""
+
+    __slots__ = (
+        "rng",
+        "randint",
+        "counted",
+        "max_draws",
+        "max_iterations",
+        "timeout",
+        "deadline",
+        "draws",
+        "iterations",
+    )
+
+    def __init__(
+        self,
+        rng: RNG,
+        *,
+        max_draws: int | None = None,
+        max_iterations: int = MAX_EXPLOSIONS,
+        timeout: float | None = None,
+    ) -> None:
+        self.rng = rng
+        self.max_draws = max_draws
+        self.max_iterations = max_iterations
+        self.timeout = timeout
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.draws = 0
+        self.iterations = 0
+        self.counted = max_draws is not None or timeout is not None
+        if self.counted:
+            self.randint = self._counted_randint
+        else:
+            self.randint = rng.randint
+
+    def _charge_draws(self, n: int) -> None:
+        self.draws += n
+        if self.max_draws is not None and self.draws > self.max_draws:
+            raise DiceExecutionError(
+                code="MAX_RNG_DRAWS_EXCEEDED",
+                message=f"Exceeded maximum RNG draw count ({self.max_draws})",
+            )
+        self.check_deadline()
+
+    def _counted_randint(self, a: int, b: int) -> int:
+        self._charge_draws(1)
+        return self.rng.randint(a, b)
+
+    def randints(self, n: int, a: int, b: int) -> list[int]:
+        """Draw *n* integers in ``[a, b]``, charging *n* draws.
+
+        Without a bulk method on the wrapped RNG, each draw is charged (and
+        the deadline checked) one at a time, as slow RNGs need.
+        """
+        if self.counted:
+            if not hasattr(self.rng, "randints"):
+                randint = self._counted_randint
+                return [randint(a, b) for _ in range(n)]
+            self._charge_draws(n)
+        return randints(self.rng, n, a, b)
+
+    def spend_iterations(self, count: int = 1) -> None:
+        """Charge *count* explosions or rerolls against the budget."""
+        self.iterations += count
+        if self.iterations > self.max_iterations:
+            raise DiceExecutionError(
+                code="MAX_EXPLOSIONS_EXCEEDED",
+                message=(
+                    f"Exceeded maximum explosion count ({self.max_iterations})"
+                ),
+            )
+        self.check_deadline()
+
+    def check_deadline(self) -> None:
+        """Raise if the execution has run past its timeout."""
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise DiceExecutionError(
+                code="DEADLINE_EXCEEDED",
+                message=f"Execution exceeded its time limit ({self.timeout:g}s)",
+            )
+
+
+def budget_of(rng: RNG) -> ExecutionBudget:
+    """Return the budget *rng* draws from.
+
+    Outside an execution, *rng* is a plain RNG: it gets a fresh budget with
+    the default limits, scoped to the caller.
+    """
+    if isinstance(rng, ExecutionBudget):
+        return rng
+    return ExecutionBudget(rng)
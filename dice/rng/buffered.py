@@ -0,0 +1,106 @@
+"""OS entropy read in blocks, for rolling many dice cheaply.
+
+:class:`BufferedSystemRNG` draws from the same source as
+:class:`~dice.rng.default.DefaultRNG` (``os.urandom``), but reads it a
+block at a time and decodes bounded integers from the buffer by rejection
+sampling, so most rolls make no system call. After ``fork()`` the child
+discards the buffer it inherited: parent and child never share bytes.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import weakref
+
+from dice.constants import ENTROPY_BLOCK_SIZE
+from dice.rng.default import read_bounded_ints
+
+# Every live BufferedSystemRNG, so that a forked child can empty them all.
+_instances: weakref.WeakSet[BufferedSystemRNG] = weakref.WeakSet()
+
+
+class BufferedSystemRNG:
+    """RNG backed by the system's cryptographic random source, read in blocks.
+
+    Each value takes the fewest whole bytes that hold ``b - a`` (one byte
+    for any die up to 256 faces). Bytes in the partial last multiple of the
+    range are rejected before reducing modulo the range, so there is no
+    modulo bias. Draws are thread-safe.
+
+    :param block_size: Bytes read from the OS per refill.
+    """
+
+    def __init__(self, block_size: int = ENTROPY_BLOCK_SIZE) -> None:
+        if block_size < 1:
+            raise ValueError(f"block_size must be positive, got {block_size}")
+        self._block_size = block_size
+        self._buffer = b""
+        self._pos = 0
+        self._lock = threading.Lock()
+        _instances.add(self)
+
+    def randint(self, a: int, b: int) -> int:
+        width = b - a + 1
+        if width <= 0:
+            raise ValueError(f"empty range for randint({a}, {b})")
+        if width == 1:
+            return a
+        if width <= 256:
+            limit = 256 - 256 % width
+            with self._lock:
+                while True:
+                    if self._pos >= len(self._buffer):
+                        self._buffer = os.urandom(self._block_size)
+                        self._pos = 0
+                    x = self._buffer[self._pos]
+                    self._pos += 1
+                    if x < limit:
+                        return a + x % width
+        size = ((width - 1).bit_length() + 7) // 8
+        limit = (1 << 8 * size) // width * width
+        with self._lock:
+            while True:
+                x = int.from_bytes(self._take(size), "little")
+                if x < limit:
+                    return a + x % width
+
+    def randints(self, n: int, a: int, b: int) -> list[int]:
+        # Surplus values are dropped, never handed out again.
+        with self._lock:
+            return read_bounded_ints(self._take, n, a, b)
+
+    def _take(self, size: int) -> bytes:
+        """Remove and return the next *size* bytes, refilling as needed.
+
+        The caller holds the lock.
+        """
+        pos = self._pos
+        end = pos + size
+        if end <= len(self._buffer):
+            self._pos = end
+            return self._buffer[pos:end]
+        data = self._buffer[pos:]
+        missing = size - len(data)
+        if missing >= self._block_size:
+            self._buffer = b""
+            self._pos = 0
+            return data + os.urandom(missing)
+        self._buffer = os.urandom(self._block_size)
+        self._pos = missing
+        return data + self._buffer[:missing]
+
+    def _discard(self) -> None:
+        self._buffer = b""
+        self._pos = 0
+        # A thread of the parent may have held the lock when it forked.
+        self._lock = threading.Lock()
+
+
+def _discard_buffers() -> None:
+    for rng in list(_instances):
+        rng._discard()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_discard_buffers)
@@ -1,4 +1,6 @@
+import os
 import random
+from typing import Callable
 
 
 class DefaultRNG:
@@ -9,3 +11,55 @@ class DefaultRNG:
 
     def randint(self, a: int, b: int) -> int:
         return self._rng.randint(a, b)
+
+    def randints(self, n: int, a: int, b: int) -> list[int]:
+        """Return *n* integers in ``[a, b]``, read from ``os.urandom`` at once.
+
+        See :func:`read_bounded_ints`.
+        """
+        return read_bounded_ints(os.urandom, n, a, b)
+
+
+def read_bounded_ints(
+    read: Callable[[int], bytes], n: int, a: int, b: int
+) -> list[int]:
+    """Return *n* integers in ``[a, b]`` decoded from bytes returned by *read*.
+
+    *read* is called with a byte count, sized for the values expected to
+    survive :func:`bounded_ints`; a batch left short by rejected values is
+    topped up with another call. Surplus values are dropped.
+    """
+    width = b - a + 1
+    if width <= 0:
+        raise ValueError(f"empty range for randints({n}, {a}, {b})")
+    if width == 1:
+        return [a] * n
+    size = ((width - 1).bit_length() + 7) // 8
+    span = 1 << 8 * size
+    limit = span // width * width
+    values: list[int] = []
+    while len(values) < n:
+        missing = n - len(values)
+        # Enough for the expected rejections, and a little more.
+        count = missing * span // limit + (missing >> 4) + 1
+        values.extend(bounded_ints(read(size * count), a, width, size))
+    del values[n:]
+    return values
+
+
+def bounded_ints(data: bytes, a: int, width: int, size: int) -> list[int]:
+    """Decode *data* into integers in ``[a, a + width)``, without bias.
+
+    Every *size* bytes make one little-endian value. Values in the partial
+    last multiple of *width* are rejected, and the rest reduced modulo
+    *width*; at least half the values are kept.
+    """
+    limit = (1 << 8 * size) // width * width
+    if size == 1:
+        return [a + x % width for x in data if x < limit]
+    from_bytes = int.from_bytes
+    drawn = [
+        from_bytes(data[i : i + size], "little")
+        for i in range(0, len(data) - size + 1, size)
+    ]
+    return [a + x % width for x in drawn if x < limit]
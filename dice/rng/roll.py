@@ -8,7 +8,8 @@ def roll_die(sides: int, rng: RNG | None = None) -> int:
     """Roll a single die with the given number of sides.
 
     This is the single point of randomness for the entire library.
-    All die-rolling code should delegate to this function.
+    All die-rolling code should delegate to this function, or to
+    :func:`roll_dice` when it rolls more than one die.
 
     :param sides: Number of sides on the die.
     :param rng: Optional RNG instance. Uses DefaultRNG if not provided.
@@ -17,3 +18,31 @@ def roll_die(sides: int, rng: RNG | None = None) -> int:
     if rng is None:
         rng = _default_rng
     return rng.randint(1, sides)
+
+
+def randints(rng: RNG, n: int, a: int, b: int) -> list[int]:
+    """Draw *n* random integers in ``[a, b]`` from *rng*.
+
+    Uses the RNG's optional ``randints`` bulk method when it has one, and
+    calls ``randint`` *n* times otherwise.
+    """
+    bulk = getattr(rng, "randints", None)
+    if bulk is not None:
+        return bulk(n, a, b)
+    randint = rng.randint
+    return [randint(a, b) for _ in range(n)]
+
+
+def roll_dice(count: int, sides: int, rng: RNG | None = None) -> list[int]:
+    """Roll *count* dice with the given number of sides, in one bulk draw.
+
+    :param count: Number of dice.
+    :param sides: Number of sides on each die.
+    :param rng: Optional RNG instance. Uses DefaultRNG if not provided.
+    :return: *count* random integers between 1 and sides (inclusive).
+    """
+    if rng is None:
+        rng = _default_rng
+    if count == 1:
+        return [rng.randint(1, sides)]
+    return randints(rng, count, 1, sides)
@@ -0,0 +1,96 @@
+"""Distribution sampling on top of the integer-only :class:`RNG` protocol.
+
+Used to roll very large dice pools as face counts: one multinomial draw
+over the faces replaces one ``randint`` per die, so the cost depends on the
+number of faces rather than the number of dice.
+"""
+
+from __future__ import annotations
+
+import math
+
+from dice.rng.base import RNG
+
+_FLOAT_BITS = 53
+_FLOAT_SCALE = 2.0**-_FLOAT_BITS
+
+
+def uniform(rng: RNG) -> float:
+    """Return a float drawn uniformly from the open interval (0, 1)."""
+    return (rng.randint(0, (1 << _FLOAT_BITS) - 1) + 0.5) * _FLOAT_SCALE
+
+
+def binomial(rng: RNG, n: int, p: float) -> int:
+    """Return the number of successes in *n* trials with probability *p*.
+
+    Uses Devroye's geometric method when ``n * p < 10`` and Hörmann's BTRS
+    transformed rejection otherwise, so the expected number of draws is
+    bounded independently of *n*.
+
+    Raises:
+        ValueError: If *n* is negative or *p* is outside ``[0, 1]``.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if not 0.0 <= p <= 1.0:
+        raise ValueError("p must be in the range 0.0 <= p <= 1.0")
+    if p == 0.0 or n == 0:
+        return 0
+    if p == 1.0:
+        return n
+    if p > 0.5:
+        return n - binomial(rng, n, 1.0 - p)
+
+    if n * p < 10.0:
+        # Count the trials skipped between successes.
+        x = y = 0
+        c = math.log2(1.0 - p)
+        if not c:
+            return x
+        while True:
+            y += math.floor(math.log2(uniform(rng)) / c) + 1
+            if y > n:
+                return x
+            x += 1
+
+    spq = math.sqrt(n * p * (1.0 - p))
+    b = 1.15 + 2.53 * spq
+    a = -0.0873 + 0.0248 * b + 0.01 * p
+    c = n * p + 0.5
+    vr = 0.92 - 4.2 / b
+    setup = False
+    while True:
+        u = uniform(rng) - 0.5
+        us = 0.5 - abs(u)
+        k = math.floor((2.0 * a / us + b) * u + c)
+        if k < 0 or k > n:
+            continue
+        v = uniform(rng)
+        if us >= 0.07 and v <= vr:
+            return k
+        if not setup:
+            alpha = (2.83 + 5.1 / b) * spq
+            lpq = math.log(p / (1.0 - p))
+            m = math.floor((n + 1) * p)
+            h = math.lgamma(m + 1) + math.lgamma(n - m + 1)
+            setup = True
+        v *= alpha / (a / (us * us) + b)
+        bound = h - math.lgamma(k + 1) - math.lgamma(n - k + 1) + (k - m) * lpq
+        if math.log(v) <= bound:
+            return k
+
+
+def multinomial_uniform(rng: RNG, n: int, k: int) -> list[int]:
+    """Split *n* trials over *k* equally likely outcomes; return the counts.
+
+    Draws one binomial per outcome but the last, each conditioned on the
+    trials left over.
+    """
+    counts = []
+    remaining = n
+    for i in range(k - 1):
+        drawn = binomial(rng, remaining, 1.0 / (k - i)) if remaining else 0
+        counts.append(drawn)
+        remaining -= drawn
+    counts.append(remaining)
+    return counts
@@ -2,10 +2,31 @@ import random
 
 
 class SeededRNG:
-    """Deterministic RNG for testing. Seeded with a fixed value."""
+    """Deterministic RNG for testing. Seeded with a fixed value.
+
+    ``randints(n, a, b)`` returns exactly what *n* calls to ``randint(a, b)``
+    would, and leaves the generator in the same state, so a seeded roll does
+    not depend on whether its dice are drawn one at a time or in bulk.
+    """
 
     def __init__(self, seed: int) -> None:
         self._rng = random.Random(seed)
 
     def randint(self, a: int, b: int) -> int:
         return self._rng.randint(a, b)
+
+    def randints(self, n: int, a: int, b: int) -> list[int]:
+        width = b - a + 1
+        if width <= 0:
+            raise ValueError(f"empty range for randints({n}, {a}, {b})")
+        # The rejection sampling of random.Random.randint, without its two
+        # Python-level calls per value.
+        getrandbits = self._rng.getrandbits
+        k = width.bit_length()
+        values = []
+        for _ in range(n):
+            r = getrandbits(k)
+            while r >= width:
+                r = getrandbits(k)
+            values.append(a + r)
+        return values
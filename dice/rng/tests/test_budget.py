@@ -0,0 +1,57 @@
+import pytest
+
+from dice.errors import DiceExecutionError
+from dice.rng import ExecutionBudget, SeededRNG
+from dice.rng.budget import budget_of
+
+
+def test_unlimited_budget_draws_straight_from_the_rng():
+    rng = SeededRNG(1)
+    budget = ExecutionBudget(rng)
+    assert budget.randint == rng.randint
+    assert budget.draws == 0
+
+
+def test_draw_limit():
+    budget = ExecutionBudget(SeededRNG(1), max_draws=3)
+    expected = SeededRNG(1)
+    assert [budget.randint(1, 6) for _ in range(3)] == [
+        expected.randint(1, 6) for _ in range(3)
+    ]
+    assert budget.draws == 3
+    with pytest.raises(DiceExecutionError) as exc_info:
+        budget.randint(1, 6)
+    assert exc_info.value.code == "MAX_RNG_DRAWS_EXCEEDED"
+
+
+def test_iteration_limit():
+    budget = ExecutionBudget(SeededRNG(1), max_iterations=2)
+    budget.spend_iterations()
+    budget.spend_iterations()
+    with pytest.raises(DiceExecutionError) as exc_info:
+        budget.spend_iterations()
+    assert exc_info.value.code == "MAX_EXPLOSIONS_EXCEEDED"
+
+
+def test_deadline():
+    budget = ExecutionBudget(SeededRNG(1), timeout=-1.0)
+    with pytest.raises(DiceExecutionError) as exc_info:
+        budget.randint(1, 6)
+    assert exc_info.value.code == "DEADLINE_EXCEEDED"
+
+
+def test_budget_of_reuses_an_execution_budget():
+    budget = ExecutionBudget(SeededRNG(1))
+    assert budget_of(budget) is budget
+    fresh = budget_of(SeededRNG(1))
+    assert isinstance(fresh, ExecutionBudget)
+    assert fresh is not budget_of(fresh.rng)
+
+
+def test_bulk_draws_are_charged_per_value():
+    budget = ExecutionBudget(SeededRNG(1), max_draws=5)
+    assert budget.randints(3, 1, 6) == SeededRNG(1).randints(3, 1, 6)
+    assert budget.draws == 3
+    with pytest.raises(DiceExecutionError) as exc_info:
+        budget.randints(3, 1, 6)
+    assert exc_info.value.code == "MAX_RNG_DRAWS_EXCEEDED"
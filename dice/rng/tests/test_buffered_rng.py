@@ -0,0 +1,77 @@
+import os
+from collections import Counter
+
+import pytest
+
+from dice import roll
+from dice.rng import BufferedSystemRNG
+
+
+def test_randint_within_bounds():
+    rng = BufferedSystemRNG()
+    for a, b in [(1, 6), (1, 20), (1, 100), (1, 256), (1, 257), (-2, 0), (0, 2**70)]:
+        for _ in range(200):
+            assert a <= rng.randint(a, b) <= b
+
+
+def test_randints_within_bounds():
+    rng = BufferedSystemRNG()
+    for a, b in [(1, 6), (1, 20), (1, 257), (0, 2**70)]:
+        values = rng.randints(500, a, b)
+        assert len(values) == 500
+        assert all(a <= v <= b for v in values)
+
+
+def test_single_value_and_empty_range():
+    rng = BufferedSystemRNG()
+    assert rng.randint(5, 5) == 5
+    assert rng.randints(3, 5, 5) == [5, 5, 5]
+    assert rng.randints(0, 1, 6) == []
+    with pytest.raises(ValueError):
+        rng.randint(6, 1)
+    with pytest.raises(ValueError):
+        rng.randints(2, 6, 1)
+
+
+def test_refills_across_small_blocks():
+    # Draws that straddle and exceed the block keep refilling it.
+    rng = BufferedSystemRNG(block_size=7)
+    counts = Counter(rng.randint(1, 6) for _ in range(3000))
+    counts.update(rng.randints(3000, 1, 6))
+    counts.update(rng.randint(1, 1000) for _ in range(100))
+    assert set(range(1, 7)) <= set(counts)
+    assert all(1 <= v <= 1000 for v in counts)
+
+
+def test_faces_are_roughly_uniform():
+    counts = Counter(BufferedSystemRNG().randints(60_000, 1, 6))
+    assert all(9_000 < counts[face] < 11_000 for face in range(1, 7))
+
+
+def test_block_size_must_be_positive():
+    with pytest.raises(ValueError):
+        BufferedSystemRNG(block_size=0)
+
+
+def test_drop_in_rng():
+    result = roll("4d6kh3+1d20!", rng=BufferedSystemRNG())
+    assert result.total >= 4
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_child_discards_inherited_buffer():
+    rng = BufferedSystemRNG()
+    rng.randint(1, 6)  # fill the buffer before forking
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.write(write_fd, bytes(rng.randints(32, 0, 255)))
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    child = os.read(read_fd, 32)
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+    assert len(child) == 32
+    assert bytes(rng.randints(32, 0, 255)) != child
@@ -1,4 +1,5 @@
 from dice.rng import DefaultRNG
+from dice.rng.default import read_bounded_ints
 
 
 def test_default_rng_returns_int():
@@ -18,3 +19,34 @@ def test_default_rng_single_value():
     rng = DefaultRNG()
     result = rng.randint(5, 5)
     assert result == 5
+
+
+def test_default_randints_within_bounds():
+    rng = DefaultRNG()
+    for a, b in [(1, 6), (1, 20), (1, 256), (1, 257), (-2, 0), (0, 2**70)]:
+        values = rng.randints(500, a, b)
+        assert len(values) == 500
+        assert all(a <= v <= b for v in values)
+
+
+def test_default_randints_covers_every_face():
+    assert set(DefaultRNG().randints(2000, 1, 6)) == {1, 2, 3, 4, 5, 6}
+
+
+def test_default_randints_single_value_and_empty():
+    rng = DefaultRNG()
+    assert rng.randints(4, 5, 5) == [5, 5, 5, 5]
+    assert rng.randints(0, 1, 6) == []
+
+
+def test_read_bounded_ints_tops_up_rejected_values():
+    # For a d200, bytes 200-255 are rejected: the first read yields nothing.
+    reads = [bytes([255] * 64), bytes(range(64))]
+    sizes = []
+
+    def read(size):
+        sizes.append(size)
+        return reads.pop(0)[:size]
+
+    assert read_bounded_ints(read, 3, 1, 200) == [1, 2, 3]
+    assert len(sizes) == 2
@@ -1,4 +1,4 @@
-from dice.rng import SeededRNG, roll_die
+from dice.rng import SeededRNG, roll_dice, roll_die
 
 
 def test_roll_die_within_bounds():
@@ -25,3 +25,23 @@ def test_roll_die_single_sided():
     rng = SeededRNG(0)
     result = roll_die(1, rng=rng)
     assert result == 1
+
+
+def test_roll_dice_matches_roll_die_with_seeded_rng():
+    rng1 = SeededRNG(5)
+    rng2 = SeededRNG(5)
+    assert roll_dice(30, 8, rng=rng1) == [roll_die(8, rng=rng2) for _ in range(30)]
+
+
+def test_roll_dice_falls_back_to_randint():
+    class CountingRNG:
+        calls = 0
+
+        def randint(self, a, b):
+            self.calls += 1
+            return b
+
+    rng = CountingRNG()
+    assert roll_dice(4, 6, rng=rng) == [6, 6, 6, 6]
+    assert rng.calls == 4
+    assert roll_dice(0, 6, rng=rng) == []
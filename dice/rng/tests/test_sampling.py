@@ -0,0 +1,48 @@
+import pytest
+
+from dice.rng import SeededRNG
+from dice.rng.sampling import binomial, multinomial_uniform, uniform
+
+
+def test_uniform_is_in_open_unit_interval():
+    rng = SeededRNG(1)
+    for _ in range(1000):
+        assert 0.0 < uniform(rng) < 1.0
+
+
+@pytest.mark.parametrize("n, p, expected", [(0, 0.5, 0), (10, 0.0, 0), (10, 1.0, 10)])
+def test_binomial_degenerate_cases(n, p, expected):
+    assert binomial(SeededRNG(1), n, p) == expected
+
+
+@pytest.mark.parametrize("n, p", [(-1, 0.5), (10, -0.1), (10, 1.5)])
+def test_binomial_rejects_invalid_arguments(n, p):
+    with pytest.raises(ValueError):
+        binomial(SeededRNG(1), n, p)
+
+
+@pytest.mark.parametrize("n, p", [(20, 0.1), (1000, 0.3), (100000, 1 / 6), (50, 0.9)])
+def test_binomial_mean_and_variance(n, p):
+    rng = SeededRNG(7)
+    draws = [binomial(rng, n, p) for _ in range(2000)]
+    assert all(0 <= k <= n for k in draws)
+    mean = sum(draws) / len(draws)
+    variance = sum((k - mean) ** 2 for k in draws) / len(draws)
+    expected_variance = n * p * (1 - p)
+    assert abs(mean - n * p) < 4 * (expected_variance / len(draws)) ** 0.5
+    assert 0.85 < variance / expected_variance < 1.15
+
+
+def test_multinomial_uniform_counts_sum_to_n():
+    rng = SeededRNG(3)
+    for n in (0, 1, 5, 1000, 1_000_000):
+        counts = multinomial_uniform(rng, n, 6)
+        assert len(counts) == 6
+        assert sum(counts) == n
+        assert all(c >= 0 for c in counts)
+
+
+def test_multinomial_uniform_is_deterministic_when_seeded():
+    assert multinomial_uniform(SeededRNG(9), 10**6, 20) == multinomial_uniform(
+        SeededRNG(9), 10**6, 20
+    )
@@ -1,3 +1,5 @@
+import pytest
+
 from dice.rng import SeededRNG
 
 
@@ -22,3 +24,17 @@ def test_different_seeds_produce_different_results():
     results1 = [rng1.randint(1, 100) for _ in range(20)]
     results2 = [rng2.randint(1, 100) for _ in range(20)]
     assert results1 != results2
+
+
+def test_seeded_randints_matches_sequential_randint():
+    for a, b in [(1, 6), (1, 1), (1, 20), (-2, 0), (0, 2**64)]:
+        bulk = SeededRNG(7)
+        single = SeededRNG(7)
+        assert bulk.randints(50, a, b) == [single.randint(a, b) for _ in range(50)]
+        # Both generators are left in the same state.
+        assert bulk.randint(1, 100) == single.randint(1, 100)
+
+
+def test_seeded_randints_empty_range():
+    with pytest.raises(ValueError):
+        SeededRNG(1).randints(3, 6, 1)
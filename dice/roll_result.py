@@ -18,7 +18,7 @@ class RollResult:
         return self.execution.total
 
     @property
-    def tree(self) -> dict[str, Any]:
+    def tree(self) -> dict[str, Any] | None:
         return self.execution.tree
 
     @property
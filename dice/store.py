@@ -0,0 +1,136 @@
+"""Persistent on-disk store of compiled execution plans.
+
+A :class:`PlanStore` is a single SQLite file mapping normalized expression
+text to a pickled :class:`~dice.execution.plan.ExecutionPlan`. Rows are
+keyed by :data:`~dice.constants.SYNTAX_VERSION` as well, so plans written
+by another syntax version are never returned, and a writable store deletes
+them when opened.
+
+One process (e.g. a warm-up job) opens the store writable; any number of
+workers can open the same file with ``readonly=True`` and share it. Attach
+a store to an :class:`~dice.cache.ExpressionCache` to have cache misses
+served from disk instead of the grammar.
+
+Plans are stored with :mod:`pickle`; only open store files you wrote.
+"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import pickle
+import sqlite3
+import threading
+from collections.abc import Iterable
+
+from dice.cache import normalize_expression
+from dice.constants import SYNTAX_VERSION
+from dice.execution.plan import ExecutionPlan, compile_plan
+from dice.grammar import parse
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    expression TEXT NOT NULL,
+    syntax_version TEXT NOT NULL,
+    plan BLOB NOT NULL,
+    PRIMARY KEY (expression, syntax_version)
+) WITHOUT ROWID
+"""
+
+
+class PlanStore:
+    """A SQLite-backed map from expression text to compiled plans.
+
+    Args:
+        path: The store file. Created if missing, unless *readonly*.
+        readonly: Open without write access, for sharing between workers.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, readonly: bool = False) -> None:
+        self.path = os.fspath(path)
+        self.readonly = readonly
+        self._lock = threading.Lock()
+        if readonly:
+            uri = pathlib.Path(self.path).resolve().as_uri() + "?mode=ro"
+            self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            with self._conn:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(_SCHEMA)
+                self._conn.execute(
+                    "DELETE FROM plans WHERE syntax_version != ?", (SYNTAX_VERSION,)
+                )
+
+    def get(self, expression: str) -> ExecutionPlan | None:
+        """Return the stored plan for *expression*, or ``None``."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT plan FROM plans WHERE expression = ? AND syntax_version = ?",
+                (normalize_expression(expression), SYNTAX_VERSION),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return pickle.loads(row[0])
+        except Exception:
+            # Written by an incompatible library build; treat as a miss.
+            return None
+
+    def put(self, expression: str, plan: ExecutionPlan) -> None:
+        """Store *plan* under the normalized *expression*."""
+        self.put_many([(expression, plan)])
+
+    def put_many(self, items: Iterable[tuple[str, ExecutionPlan]]) -> None:
+        """Store several plans in a single transaction."""
+        rows = [
+            (normalize_expression(expression), SYNTAX_VERSION, pickle.dumps(plan))
+            for expression, plan in items
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO plans VALUES (?, ?, ?)", rows
+            )
+
+    def warm(self, expressions: Iterable[str]) -> int:
+        """Parse, compile and store *expressions*; return how many were stored.
+
+        Expressions that are already stored or fail to parse are skipped.
+        """
+        items = []
+        for expression in dict.fromkeys(map(normalize_expression, expressions)):
+            if expression in self:
+                continue
+            parsed = parse(expression)
+            if not parsed.errors:
+                items.append((expression, compile_plan(parsed)))
+        self.put_many(items)
+        return len(items)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> PlanStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM plans WHERE syntax_version = ?",
+                (SYNTAX_VERSION,),
+            ).fetchone()
+        return count
+
+    def __contains__(self, expression: object) -> bool:
+        if not isinstance(expression, str):
+            return False
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM plans WHERE expression = ? AND syntax_version = ?",
+                (normalize_expression(expression), SYNTAX_VERSION),
+            ).fetchone()
+        return row is not None
@@ -0,0 +1,302 @@
+"""Parameterized expression templates.
+
+A template is dice notation with named numeric placeholders::
+
+    attack = dice.compile_template("1d20+{str}+{prof}")
+    attack.roll(str=3, prof=2)
+
+A placeholder is ``{name}`` or ``{name:type}`` with type ``int`` (the
+default) or ``float``, and may appear wherever a number literal may. The
+template is parsed and compiled once; binding values swaps the slot nodes
+of the compiled plan and never touches the grammar.
+
+Placeholders are masked with same-length integer literals before parsing,
+so every backend accepts the template unchanged and error positions refer
+to the template text.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+
+from dice.errors import DiceParseError, DiceValidationError
+from dice.execution.config import ExecutionConfig
+from dice.execution.executor import execute
+from dice.execution.plan import (
+    ExecutionPlan,
+    FunctionNode,
+    NumericNode,
+    ParentheticalNode,
+    PlanNode,
+    compile_plan,
+)
+from dice.execution.result import ExecutionResult
+from dice.grammar import parse
+from dice.grammar.lexer import DICE, FLOAT, INT, tokenize
+from dice.grammar.parse_actions import render_infix, render_number
+from dice.rng import RNG
+
+PLACEHOLDER_TYPES = ("int", "float")
+
+# Keyword arguments of Template.roll() that cannot double as placeholders.
+RESERVED_NAMES = frozenset({"rng", "config"})
+
+_PLACEHOLDER_RE = re.compile(r"\{([^{}]*)\}")
+_SPEC_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)(?::(\w+))?")
+
+
+@dataclass(frozen=True)
+class Placeholder:
+    """A named, typed slot in a template."""
+
+    name: str
+    type: str
+    position: int
+
+
+class Template:
+    """A template compiled once into a plan with typed placeholder slots."""
+
+    def __init__(
+        self,
+        text: str,
+        plan: ExecutionPlan,
+        slots: dict[str, Placeholder],
+        slot_nodes: dict[str, str],
+        pieces: list[str],
+        names: list[str],
+    ) -> None:
+        self.text = text
+        self.plan = plan
+        self._placeholders = MappingProxyType(
+            {slot.name: slot for slot in slots.values()}
+        )
+        # plan node id -> placeholder name
+        self._slot_nodes = slot_nodes
+        self._containers = _slot_containers(plan.children, set(slot_nodes))
+        # The text around the placeholders, and their names in text order.
+        self._pieces = pieces
+        self._names = names
+
+    @property
+    def placeholders(self) -> MappingProxyType[str, Placeholder]:
+        return self._placeholders
+
+    def bind(self, **values: int | float) -> ExecutionPlan:
+        """Return the plan with every placeholder bound to a value.
+
+        Raises:
+            DiceValidationError: If a placeholder is missing, unknown, or
+                given a value of the wrong type.
+        """
+        checked = self._check(values)
+        numbers = {
+            node_id: checked[name] for node_id, name in self._slot_nodes.items()
+        }
+        return replace(
+            self.plan,
+            expression=self.render(**checked),
+            children=tuple(self._bind(c, numbers) for c in self.plan.children),
+        )
+
+    def roll(
+        self,
+        *,
+        rng: RNG | None = None,
+        config: ExecutionConfig | None = None,
+        **values: int | float,
+    ) -> ExecutionResult:
+        """Bind *values* and execute the resulting plan."""
+        return execute(self.bind(**values), rng=rng, config=config)
+
+    def render(self, **values: int | float) -> str:
+        """Return the template text with placeholders replaced by *values*.
+
+        Negative values are written as ``(0-n)``, so the text parses back
+        to the bound plan.
+        """
+        parts = [self._pieces[0]]
+        for name, piece in zip(self._names, self._pieces[1:]):
+            parts.append(render_number(values[name]))
+            parts.append(piece)
+        return "".join(parts)
+
+    def _check(self, values: dict[str, int | float]) -> dict[str, int | float]:
+        unknown = sorted(set(values) - set(self._placeholders))
+        if unknown:
+            raise DiceValidationError(
+                code="UNKNOWN_PLACEHOLDER",
+                message=f"Unknown placeholder(s): {', '.join(unknown)}",
+                expression=self.text,
+            )
+        missing = sorted(set(self._placeholders) - set(values))
+        if missing:
+            raise DiceValidationError(
+                code="MISSING_PLACEHOLDER",
+                message=f"Missing value(s) for: {', '.join(missing)}",
+                expression=self.text,
+            )
+        for name, value in values.items():
+            slot = self._placeholders[name]
+            if not _accepts(slot.type, value):
+                raise DiceValidationError(
+                    code="INVALID_PLACEHOLDER_VALUE",
+                    message=(
+                        f"Placeholder {name!r} expects {slot.type}, "
+                        f"got {type(value).__name__}"
+                    ),
+                    position=slot.position,
+                    expression=self.text,
+                )
+        return values
+
+    def _bind(self, node: PlanNode, numbers: dict[str, int | float]) -> PlanNode:
+        if node.id in numbers:
+            return NumericNode(id=node.id, value=numbers[node.id])
+        if node.id not in self._containers or not isinstance(
+            node, (ParentheticalNode, FunctionNode)
+        ):
+            return node
+        children = tuple(self._bind(c, numbers) for c in node.children)
+        if isinstance(node, ParentheticalNode):
+            rendered = render_infix([c.instantiate() for c in children])
+            return replace(node, children=children, expression=f"({rendered})")
+        return replace(node, children=children)
+
+    def __repr__(self) -> str:
+        return f"Template({self.text!r})"
+
+
+def compile_template(text: str) -> Template:
+    """Parse and compile a template with ``{name}`` / ``{name:type}`` slots.
+
+    Raises:
+        DiceParseError: With code ``INVALID_PLACEHOLDER`` for a malformed,
+            reserved, re-typed or misplaced placeholder, or any error
+            :func:`dice.grammar.parse` reports for the template.
+    """
+    offset = len(text) - len(text.lstrip())
+    notation, flavor = _split_flavor(text.strip())
+
+    placeholders: list[Placeholder] = []
+    spans: list[tuple[int, int]] = []
+    types: dict[str, str] = {}
+    for m in _PLACEHOLDER_RE.finditer(notation):
+        position = m.start() + offset
+        spec = _SPEC_RE.fullmatch(m.group(1))
+        if spec is None:
+            raise _invalid(text, position, f"Malformed placeholder {m.group()!r}")
+        name, kind = spec.group(1), spec.group(2) or "int"
+        if name in RESERVED_NAMES:
+            raise _invalid(text, position, f"Placeholder name {name!r} is reserved")
+        if kind not in PLACEHOLDER_TYPES:
+            raise _invalid(
+                text,
+                position,
+                f"Unknown placeholder type {kind!r}; "
+                f"must be one of {sorted(PLACEHOLDER_TYPES)}",
+            )
+        if types.setdefault(name, kind) != kind:
+            raise _invalid(
+                text, position, f"Placeholder {name!r} used with conflicting types"
+            )
+        placeholders.append(Placeholder(name, kind, position))
+        spans.append(m.span())
+
+    masked = list(text.strip())
+    for start, end in spans:
+        masked[start:end] = "0" * (end - start)
+    masked_text = "".join(masked)
+
+    parsed = parse(" " * offset + masked_text)
+    if parsed.errors:
+        raise replace(parsed.errors[0], expression=text)
+    plan = compile_plan(parsed)
+
+    # The k-th number literal in the text is the k-th NumericNode in the plan.
+    literals = _number_literals(masked_text)
+    numeric_ids = [n.id for n in _numeric_nodes(plan.children)]
+    slot_nodes: dict[str, str] = {}
+    slots: dict[str, Placeholder] = {}
+    for placeholder, (start, end) in zip(placeholders, spans):
+        index = literals.get((start, end))
+        if index is None:
+            raise _invalid(
+                text,
+                placeholder.position,
+                f"Placeholder {placeholder.name!r} must stand alone as a number",
+            )
+        slot_nodes[numeric_ids[index]] = placeholder.name
+        slots.setdefault(placeholder.name, placeholder)
+
+    pieces = [notation[start:end] for start, end in _gaps(spans, len(notation))]
+    pieces[-1] += flavor
+    names = [placeholder.name for placeholder in placeholders]
+    return Template(text, plan, slots, slot_nodes, pieces, names)
+
+
+def _split_flavor(text: str) -> tuple[str, str]:
+    flavor = text.find("[")
+    return (text, "") if flavor == -1 else (text[:flavor], text[flavor:])
+
+
+def _gaps(spans: list[tuple[int, int]], length: int) -> list[tuple[int, int]]:
+    """Return the spans of text before, between and after *spans*."""
+    starts = [0] + [end for _, end in spans]
+    ends = [start for start, _ in spans] + [length]
+    return list(zip(starts, ends))
+
+
+def _number_literals(text: str) -> dict[tuple[int, int], int]:
+    """Map the span of each standalone number literal to its index."""
+    tokens = tokenize(text)
+    literals: dict[tuple[int, int], int] = {}
+    for tok, following in zip(tokens, tokens[1:]):
+        if tok.kind in (INT, FLOAT) and following.kind != DICE:
+            literals[(tok.start, tok.end)] = len(literals)
+    return literals
+
+
+def _numeric_nodes(nodes: tuple[PlanNode, ...]) -> list[NumericNode]:
+    found: list[NumericNode] = []
+    for node in nodes:
+        if isinstance(node, NumericNode):
+            found.append(node)
+        elif isinstance(node, (ParentheticalNode, FunctionNode)):
+            found.extend(_numeric_nodes(node.children))
+    return found
+
+
+def _slot_containers(nodes: tuple[PlanNode, ...], slot_ids: set[str]) -> set[str]:
+    """Return the ids of container nodes with a slot somewhere below them."""
+    containers: set[str] = set()
+
+    def visit(node: PlanNode) -> bool:
+        if isinstance(node, (ParentheticalNode, FunctionNode)):
+            found = [visit(c) for c in node.children]
+            if any(found):
+                containers.add(node.id)
+                return True
+            return False
+        return node.id in slot_ids
+
+    for node in nodes:
+        visit(node)
+    return containers
+
+
+def _accepts(kind: str, value: object) -> bool:
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) if kind == "int" else isinstance(value, (int, float))
+
+
+def _invalid(text: str, position: int, message: str) -> DiceParseError:
+    return DiceParseError(
+        code="INVALID_PLACEHOLDER",
+        message=f"{message} (at char {position})",
+        position=position,
+        expression=text,
+    )
@@ -1,9 +1,12 @@
 from dice.terms.base import RollTerm
 from dice.terms.dice_term import DiceTerm
+from dice.terms.die_histogram import DieHistogram
 from dice.terms.die_result import DieResult
+from dice.terms.die_results import DieResults
 from dice.terms.fate_dice_term import FateDiceTerm
 from dice.terms.function_term import FunctionTerm
 from dice.terms.group_term import GroupTerm
+from dice.terms.ids import ID_STRATEGIES, assign_ids
 from dice.terms.numeric_term import NumericTerm
 from dice.terms.operator_term import OperatorTerm
 from dice.terms.parenthetical_term import ParentheticalTerm
@@ -11,13 +14,17 @@ from dice.terms.roll_expression import RollExpression
 
 __all__ = [
     "DiceTerm",
+    "DieHistogram",
     "DieResult",
+    "DieResults",
     "FateDiceTerm",
     "FunctionTerm",
     "GroupTerm",
+    "ID_STRATEGIES",
     "NumericTerm",
     "OperatorTerm",
     "ParentheticalTerm",
     "RollExpression",
     "RollTerm",
+    "assign_ids",
 ]
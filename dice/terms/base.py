@@ -1,15 +1,20 @@
 from __future__ import annotations
 
-import uuid
+import itertools
 from abc import ABC, abstractmethod
 from typing import Any
 
 from dice.rng import RNG
 
+# Source of ids for terms constructed without one (see dice.terms.ids).
+_unnamed = itertools.count(1)
+
 
 class RollTerm(ABC):
     """Base class for all roll terms in the AST and execution tree."""
 
+    __slots__ = ("id", "_evaluated")
+
     kind: str  # overridden by each subclass as a class variable
 
     def __init__(self, *, id: str | None = None) -> None:
@@ -21,9 +26,25 @@ class RollTerm(ABC):
         """Evaluate this term, populating result data. Returns self."""
         ...
 
+    def child_terms(self) -> list[RollTerm]:
+        """Return the direct child terms, in evaluation order."""
+        return []
+
+    def resolve(self, rng: RNG) -> RollTerm:
+        """Evaluate this term, assuming its child terms are already evaluated.
+
+        Leaf terms simply evaluate. Container terms override this to combine
+        their children's totals without evaluating the children again.
+        """
+        return self.evaluate(rng)
+
     @abstractmethod
     def to_dict(self) -> dict[str, Any]:
-        """Serialize to execution tree dict."""
+        """Serialize to execution tree dict.
+
+        Every dict and list in the result must be newly built: callers own
+        the tree and may mutate it without affecting this term.
+        """
         ...
 
     @property
@@ -34,4 +55,4 @@ class RollTerm(ABC):
 
     @staticmethod
     def _generate_id() -> str:
-        return uuid.uuid4().hex[:8]
+        return f"t{next(_unnamed)}"
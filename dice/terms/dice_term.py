@@ -1,16 +1,29 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any, cast
 
-from dice.rng import RNG, roll_die
+from dice.rng import RNG, roll_dice
 from dice.terms.base import RollTerm
+from dice.terms.die_histogram import (
+    DieHistogram,
+    apply_histogram_modifiers,
+    histogram_supports,
+)
 from dice.terms.die_result import DieResult
+from dice.terms.die_results import DieResults, new_results
+
+if TYPE_CHECKING:
+    from dice.modifiers.registry import ModifierPlan
 
 
 class DiceTerm(RollTerm):
     """A term representing one or more dice of the same type to be rolled."""
 
+    __slots__ = ("count", "faces", "modifier_strings", "modifier_plan", "results")
+
     kind: str = "dice_term"
+    # Value of the lowest face; faces are consecutive from here.
+    lowest_face: int = 1
 
     def __init__(
         self,
@@ -18,13 +31,19 @@ class DiceTerm(RollTerm):
         count: int,
         faces: int,
         modifier_strings: list[str] | None = None,
+        modifier_plan: ModifierPlan | None = None,
         id: str | None = None,
     ) -> None:
         super().__init__(id=id)
         self.count = count
         self.faces = faces
         self.modifier_strings: list[str] = modifier_strings or []
-        self.results: list[DieResult] = []
+        # Resolved at parse time by the grammar; compiled on first
+        # evaluation for terms constructed by hand.
+        self.modifier_plan = modifier_plan
+        # Pools above PACKED_RESULTS_THRESHOLD dice are stored packed, and
+        # pools rolled by evaluate_histogram() as face counts.
+        self.results: list[DieResult] | DieResults | DieHistogram = []
 
     @property
     def notation(self) -> str:
@@ -33,27 +52,62 @@ class DiceTerm(RollTerm):
 
     @property
     def total(self) -> int:
-        return sum(r.value for r in self.results if r.kept)
+        results = self.results
+        if isinstance(results, (DieResults, DieHistogram)):
+            return results.kept_total()
+        return sum(r.value for r in results if r.kept)
+
+    @property
+    def supports_histogram(self) -> bool:
+        """Whether every modifier of this term can run on a face histogram."""
+        return histogram_supports(self._plan())
 
     def evaluate(self, rng: RNG) -> DiceTerm:
-        self.results = [
-            DieResult(value=roll_die(self.faces, rng))
-            for _ in range(self.count)
-        ]
-        if self.modifier_strings:
-            from dice.modifiers.parser import parse_modifier_string
-            from dice.modifiers.registry import apply_modifiers
-
-            specs = parse_modifier_string("".join(self.modifier_strings))
-            self.results = apply_modifiers(self.results, specs, rng, self.faces)
+        self.results = new_results(roll_dice(self.count, self.faces, rng), self.faces)
+        self._apply_modifiers(rng)
+        self._evaluated = True
+        return self
+
+    def evaluate_histogram(self, rng: RNG) -> DiceTerm:
+        """Roll the pool as per-face counts instead of individual dice.
+
+        Only valid when :attr:`supports_histogram` is true.
+        """
+        histogram = DieHistogram.roll(self.count, self.faces, rng, low=self.lowest_face)
+        apply_histogram_modifiers(histogram, self._plan())
+        self.results = histogram
         self._evaluated = True
         return self
 
+    def _plan(self) -> ModifierPlan:
+        plan = self.modifier_plan
+        if plan is None:
+            if not self.modifier_strings:
+                return ()
+            from dice.modifiers.registry import compile_modifier_plan
+
+            plan = compile_modifier_plan(self.modifier_strings, self.faces)
+            self.modifier_plan = plan
+        return plan
+
+    def _apply_modifiers(self, rng: RNG) -> None:
+        # Packed DieResults stand in for the list modifiers expect.
+        results = cast("list[DieResult]", self.results)
+        for step in self._plan():
+            results = step.fn(results, step.spec, rng, self.faces)
+        self.results = results
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
             "kind": self.kind,
             "notation": self.notation,
-            "dice": [r.to_dict() for r in self.results],
+            **self._dice_dict(),
             "total": self.total,
         }
+
+    def _dice_dict(self) -> dict[str, Any]:
+        results = self.results
+        if isinstance(results, DieHistogram):
+            return {"histogram": results.to_list()}
+        return {"dice": [r.to_dict() for r in results]}
@@ -0,0 +1,118 @@
+"""Face-count representation of very large dice pools.
+
+A :class:`DieHistogram` records how many dice landed on each face, and how
+many of those are kept, instead of one result per die. It is rolled with a
+single multinomial draw (see :mod:`dice.rng.sampling`), so rolling and
+storing ``100000d6`` costs O(faces). Only modifiers that depend on the
+ranking of values alone (keep and drop) can be applied to it; see
+:data:`HISTOGRAM_MODIFIERS`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from dice.rng import RNG
+from dice.rng.sampling import multinomial_uniform
+
+if TYPE_CHECKING:
+    from dice.modifiers.registry import ModifierStep
+
+
+class DieHistogram:
+    """Per-face counts of a rolled pool, lowest face first."""
+
+    __slots__ = ("low", "counts", "kept")
+
+    def __init__(self, low: int, counts: list[int]) -> None:
+        self.low = low
+        self.counts = counts
+        self.kept = list(counts)
+
+    @classmethod
+    def roll(cls, count: int, faces: int, rng: RNG, *, low: int = 1) -> DieHistogram:
+        """Roll *count* dice with *faces* faces numbered from *low*."""
+        return cls(low, multinomial_uniform(rng, count, faces))
+
+    def __len__(self) -> int:
+        return sum(self.counts)
+
+    def kept_total(self) -> int:
+        """Sum of the values of the kept dice."""
+        return sum(n * (self.low + i) for i, n in enumerate(self.kept))
+
+    def keep(self, n: int, *, highest: bool) -> None:
+        """Keep only the *n* highest (or lowest) dice."""
+        faces = range(len(self.counts))
+        order = reversed(faces) if highest else iter(faces)
+        kept = [0] * len(self.counts)
+        for i in order:
+            if n <= 0:
+                break
+            kept[i] = min(self.counts[i], n)
+            n -= kept[i]
+        self.kept = kept
+
+    def to_list(self) -> list[dict[str, Any]]:
+        """Serialize the faces rolled at least once, lowest first."""
+        return [
+            {"value": self.low + i, "count": count, "kept": kept}
+            for i, (count, kept) in enumerate(zip(self.counts, self.kept))
+            if count
+        ]
+
+    def __repr__(self) -> str:
+        return f"DieHistogram(low={self.low}, counts={self.counts}, kept={self.kept})"
+
+
+def _keep_highest(histogram: DieHistogram, n: int) -> None:
+    histogram.keep(n, highest=True)
+
+
+def _keep_lowest(histogram: DieHistogram, n: int) -> None:
+    histogram.keep(n, highest=False)
+
+
+def _drop_highest(histogram: DieHistogram, n: int) -> None:
+    histogram.keep(max(len(histogram) - n, 0), highest=False)
+
+
+def _drop_lowest(histogram: DieHistogram, n: int) -> None:
+    histogram.keep(max(len(histogram) - n, 0), highest=True)
+
+
+# Modifier key -> histogram implementation, called with the modifier's
+# argument (default 1). Mirrors KEEP_MODIFIERS and DROP_MODIFIERS.
+HISTOGRAM_MODIFIERS = {
+    "kh": _keep_highest,
+    "kl": _keep_lowest,
+    "k": _keep_highest,
+    "dh": _drop_highest,
+    "dl": _drop_lowest,
+}
+
+
+def histogram_supports(steps: Iterable[ModifierStep]) -> bool:
+    """Whether every step of a modifier plan can run on a histogram."""
+    return all(step.spec.key in HISTOGRAM_MODIFIERS for step in steps)
+
+
+def histogram_applies(count: int, faces: int, threshold: int | None) -> bool:
+    """Whether a pool of *count* dice is rolled as a histogram at *threshold*.
+
+    Rolling a histogram draws one binomial per face, so pools with more
+    faces than dice are always rolled die by die.
+    """
+    return threshold is not None and count >= threshold and faces <= count
+
+
+def apply_histogram_modifiers(
+    histogram: DieHistogram, steps: Iterable[ModifierStep]
+) -> None:
+    """Apply a modifier plan accepted by :func:`histogram_supports`."""
+    for step in steps:
+        argument = step.spec.argument
+        HISTOGRAM_MODIFIERS[step.spec.key](
+            histogram, argument if argument is not None else 1
+        )
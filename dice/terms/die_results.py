@@ -0,0 +1,206 @@
+"""Array-backed storage for the dice of a large pool.
+
+A :class:`DieResults` keeps die values in an ``array('q')`` and the boolean
+and critical fields of :class:`~dice.terms.die_result.DieResult` packed into
+one byte per die, instead of one object per die. It behaves like the
+``list[DieResult]`` it replaces: indexing and iteration yield
+:class:`DieView` objects that read and write the packed fields, and
+``append`` accepts any die-like object, so modifier functions work on
+either representation. ``append`` stores a copy: a modifier that goes on
+changing an appended die must re-read it as ``results[-1]``.
+
+:class:`~dice.terms.dice_term.DiceTerm` switches to it for pools larger
+than :data:`~dice.constants.PACKED_RESULTS_THRESHOLD`, unless the faces are
+too large to pack.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any, overload
+
+from dice.constants import PACKED_RESULTS_THRESHOLD
+from dice.terms.die_result import DieResult
+
+KEPT = 0x01
+EXPLODED = 0x02
+REROLLED = 0x04
+MATCHED = 0x08
+CRITICAL_SUCCESS = 0x10
+CRITICAL_FAILURE = 0x20
+
+_CRITICAL_FLAGS = {None: 0, "success": CRITICAL_SUCCESS, "failure": CRITICAL_FAILURE}
+
+# Largest die packed: every value it rolls fits in an array('q').
+_MAX_PACKED_FACES = 2**63 - 1
+
+
+def new_results(values: list[int], faces: int) -> list[DieResult] | DieResults:
+    """Wrap freshly rolled *values* of a *faces*-sided die.
+
+    Pools above the threshold are packed, unless a value or the faces do
+    not fit in the packed array.
+    """
+    if len(values) > PACKED_RESULTS_THRESHOLD and faces <= _MAX_PACKED_FACES:
+        try:
+            return DieResults(values)
+        except OverflowError:
+            pass
+    return [DieResult(value=v) for v in values]
+
+
+class DieResults:
+    """A compact, list-like sequence of die results."""
+
+    __slots__ = ("values", "flags")
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        self.values = array("q", values)
+        self.flags = array("B", bytes([KEPT]) * len(self.values))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @overload
+    def __getitem__(self, index: int) -> DieView: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[DieView]: ...
+
+    def __getitem__(self, index: int | slice) -> DieView | list[DieView]:
+        if isinstance(index, slice):
+            return [DieView(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self.values)
+        if not 0 <= index < len(self.values):
+            raise IndexError("die index out of range")
+        return DieView(self, index)
+
+    def __iter__(self) -> Iterator[DieView]:
+        for i in range(len(self.values)):
+            yield DieView(self, i)
+
+    def append(self, die: DieResult | DieView) -> None:
+        self.values.append(die.value)
+        self.flags.append(
+            (KEPT if die.kept else 0)
+            | (EXPLODED if die.exploded else 0)
+            | (REROLLED if die.rerolled else 0)
+            | (MATCHED if die.matched else 0)
+            | _CRITICAL_FLAGS[die.critical]
+        )
+
+    def extend(self, dice: Iterable[DieResult | DieView]) -> None:
+        for die in dice:
+            self.append(die)
+
+    def kept_total(self) -> int:
+        """Sum of the values of the kept dice."""
+        if self.flags.count(KEPT) == len(self.flags):
+            return sum(self.values)
+        return sum(v for v, f in zip(self.values, self.flags) if f & KEPT)
+
+    def __eq__(self, other: object) -> bool:
+        try:
+            return len(self) == len(other) and all(  # type: ignore[arg-type]
+                a == b for a, b in zip(self, other)  # type: ignore[call-overload]
+            )
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"DieResults({list(self)!r})"
+
+
+def _flag(mask: int) -> property:
+    def get(self: DieView) -> bool:
+        return bool(self._results.flags[self._index] & mask)
+
+    def set(self: DieView, value: bool) -> None:
+        flags = self._results.flags
+        if value:
+            flags[self._index] |= mask
+        else:
+            flags[self._index] &= ~mask
+
+    return property(get, set)
+
+
+class DieView:
+    """A :class:`DieResult`-like view of one die in a :class:`DieResults`."""
+
+    __slots__ = ("_results", "_index")
+
+    def __init__(self, results: DieResults, index: int) -> None:
+        self._results = results
+        self._index = index
+
+    @property
+    def value(self) -> int:
+        return self._results.values[self._index]
+
+    @value.setter
+    def value(self, value: int) -> None:
+        self._results.values[self._index] = value
+
+    kept = _flag(KEPT)
+    exploded = _flag(EXPLODED)
+    rerolled = _flag(REROLLED)
+    matched = _flag(MATCHED)
+
+    @property
+    def critical(self) -> str | None:
+        flags = self._results.flags[self._index]
+        if flags & CRITICAL_SUCCESS:
+            return "success"
+        if flags & CRITICAL_FAILURE:
+            return "failure"
+        return None
+
+    @critical.setter
+    def critical(self, critical: str | None) -> None:
+        flags = self._results.flags
+        cleared = flags[self._index] & ~(CRITICAL_SUCCESS | CRITICAL_FAILURE)
+        flags[self._index] = cleared | _CRITICAL_FLAGS[critical]
+
+    def to_dict(self) -> dict[str, Any]:
+        flags = self._results.flags[self._index]
+        d: dict[str, Any] = {
+            "value": self._results.values[self._index],
+            "kept": bool(flags & KEPT),
+        }
+        if flags & EXPLODED:
+            d["exploded"] = True
+        if flags & REROLLED:
+            d["rerolled"] = True
+        if flags & (CRITICAL_SUCCESS | CRITICAL_FAILURE):
+            d["critical"] = self.critical
+        if flags & MATCHED:
+            d["matched"] = True
+        return d
+
+    def to_result(self) -> DieResult:
+        """Return a standalone copy of this die."""
+        return DieResult(
+            value=self.value,
+            kept=self.kept,
+            exploded=self.exploded,
+            rerolled=self.rerolled,
+            critical=self.critical,
+            matched=self.matched,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DieView):
+            other = other.to_result()
+        if isinstance(other, DieResult):
+            return self.to_result() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self.to_result()).replace("DieResult", "DieView", 1)
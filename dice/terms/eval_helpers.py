@@ -1,30 +1,54 @@
 from __future__ import annotations
 
+from typing import cast
+
 from dice.terms.base import RollTerm
 from dice.terms.operator_term import OperatorTerm
 
 
 def compute_infix_total(children: list[RollTerm]) -> int | float:
-    """Compute total from an infix sequence [term, op, term, op, term, ...]."""
+    """Compute total from an infix sequence [term, op, term, op, term, ...].
+
+    ``*`` and ``/`` bind tighter than ``+`` and ``-``; operators of equal
+    precedence associate left to right.
+    """
     if not children:
         return 0
-    result = children[0].total
-    i = 1
-    while i < len(children) - 1:
+    items: list[int | float | str] = [children[0].total]
+    for i in range(1, len(children) - 1, 2):
         op = children[i]
         if not isinstance(op, OperatorTerm):
             raise TypeError(
                 f"Expected OperatorTerm at index {i}, "
                 f"got {type(op).__name__}"
             )
-        right = children[i + 1]
-        if op.operator == "+":
-            result = result + right.total
-        elif op.operator == "-":
-            result = result - right.total
-        elif op.operator == "*":
-            result = result * right.total
-        elif op.operator == "/":
-            result = result // right.total
+        items.append(op.operator)
+        items.append(children[i + 1].total)
+    return compute_infix_value(items)
+
+
+def compute_infix_value(items: list[int | float | str]) -> int | float:
+    """Compute the value of [number, operator, number, ...] by precedence.
+
+    The same arithmetic as :func:`compute_infix_total`, on plain numbers and
+    operator strings: numbers at even indices, operators at odd ones.
+    """
+    if not items:
+        return 0
+    result: int | float = 0
+    pending = "+"  # additive operator waiting for the current product
+    product = cast("int | float", items[0])
+    i = 1
+    while i < len(items) - 1:
+        op = cast(str, items[i])
+        right = cast("int | float", items[i + 1])
+        if op == "*":
+            product = product * right
+        elif op == "/":
+            product = product // right
+        else:
+            result = result + product if pending == "+" else result - product
+            pending = op
+            product = right
         i += 2
-    return result
+    return result + product if pending == "+" else result - product
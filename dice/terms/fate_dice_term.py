@@ -1,24 +1,38 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from dice.rng import RNG, roll_die
+from dice.rng import RNG, roll_dice
 from dice.terms.dice_term import DiceTerm
-from dice.terms.die_result import DieResult
+from dice.terms.die_results import new_results
+
+if TYPE_CHECKING:
+    from dice.modifiers.registry import ModifierPlan
 
 
 class FateDiceTerm(DiceTerm):
     """A dice term for Fate/Fudge dice producing values in {-1, 0, 1}."""
 
+    __slots__ = ()
+
+    lowest_face: int = -1
+
     def __init__(
         self,
         *,
         count: int,
         modifier_strings: list[str] | None = None,
+        modifier_plan: ModifierPlan | None = None,
         id: str | None = None,
     ) -> None:
-        # faces is fixed at 3 internally for the roll_die call
-        super().__init__(count=count, faces=3, modifier_strings=modifier_strings, id=id)
+        # faces is fixed at 3 internally for the roll_dice call
+        super().__init__(
+            count=count,
+            faces=3,
+            modifier_strings=modifier_strings,
+            modifier_plan=modifier_plan,
+            id=id,
+        )
 
     @property
     def notation(self) -> str:
@@ -26,16 +40,8 @@ class FateDiceTerm(DiceTerm):
         return base + "".join(self.modifier_strings)
 
     def evaluate(self, rng: RNG) -> FateDiceTerm:
-        self.results = [
-            DieResult(value=roll_die(3, rng) - 2)
-            for _ in range(self.count)
-        ]
-        if self.modifier_strings:
-            from dice.modifiers.parser import parse_modifier_string
-            from dice.modifiers.registry import apply_modifiers
-
-            specs = parse_modifier_string("".join(self.modifier_strings))
-            self.results = apply_modifiers(self.results, specs, rng, 3)
+        self.results = new_results([v - 2 for v in roll_dice(self.count, 3, rng)], 3)
+        self._apply_modifiers(rng)
         self._evaluated = True
         return self
 
@@ -44,6 +50,6 @@ class FateDiceTerm(DiceTerm):
             "id": self.id,
             "kind": self.kind,
             "notation": self.notation,
-            "dice": [r.to_dict() for r in self.results],
+            **self._dice_dict(),
             "total": self.total,
         }
@@ -7,7 +7,8 @@ from dice.rng import RNG
 from dice.terms.base import RollTerm
 from dice.terms.eval_helpers import compute_infix_total
 
-_FUNCTIONS: dict[str, Any] = {
+# Function name -> implementation, shared with the plan executors.
+FUNCTIONS: dict[str, Any] = {
     "floor": math.floor,
     "ceil": math.ceil,
     "round": round,
@@ -18,6 +19,8 @@ _FUNCTIONS: dict[str, Any] = {
 class FunctionTerm(RollTerm):
     """A term applying a math function (floor, ceil, round, abs) to children."""
 
+    __slots__ = ("function", "children", "_total")
+
     kind: str = "function_term"
 
     def __init__(
@@ -27,10 +30,10 @@ class FunctionTerm(RollTerm):
         children: list[RollTerm],
         id: str | None = None,
     ) -> None:
-        if function not in _FUNCTIONS:
+        if function not in FUNCTIONS:
             raise ValueError(
                 f"Unsupported function: {function!r}. "
-                f"Must be one of {sorted(_FUNCTIONS)}"
+                f"Must be one of {sorted(FUNCTIONS)}"
             )
         super().__init__(id=id)
         self.function = function
@@ -41,11 +44,17 @@ class FunctionTerm(RollTerm):
     def total(self) -> int | float:
         return self._total
 
+    def child_terms(self) -> list[RollTerm]:
+        return self.children
+
     def evaluate(self, rng: RNG) -> FunctionTerm:
         for child in self.children:
             child.evaluate(rng)
+        return self.resolve(rng)
+
+    def resolve(self, rng: RNG) -> FunctionTerm:
         child_total = compute_infix_total(self.children)
-        self._total = _FUNCTIONS[self.function](child_total)
+        self._total = FUNCTIONS[self.function](child_total)
         self._evaluated = True
         return self
 
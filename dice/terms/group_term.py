@@ -13,6 +13,8 @@ _GROUP_MODIFIER_RE = re.compile(r"^(kh|kl|dh|dl)(\d+)$")
 class GroupTerm(RollTerm):
     """A term representing a group of sub-expressions, e.g. {2d6, 3d8}kh1."""
 
+    __slots__ = ("children", "modifier_strings", "_kept", "_child_totals")
+
     kind: str = "group_term"
 
     def __init__(
@@ -34,12 +36,18 @@ class GroupTerm(RollTerm):
             t for t, k in zip(self._child_totals, self._kept) if k
         )
 
+    def child_terms(self) -> list[RollTerm]:
+        return [term for child_expr in self.children for term in child_expr]
+
     def evaluate(self, rng: RNG) -> GroupTerm:
-        self._child_totals = []
-        for child_expr in self.children:
-            for term in child_expr:
-                term.evaluate(rng)
-            self._child_totals.append(compute_infix_total(child_expr))
+        for term in self.child_terms():
+            term.evaluate(rng)
+        return self.resolve(rng)
+
+    def resolve(self, rng: RNG) -> GroupTerm:
+        self._child_totals = [
+            compute_infix_total(child_expr) for child_expr in self.children
+        ]
 
         self._kept = [True] * len(self._child_totals)
         self._apply_group_modifiers()
@@ -0,0 +1,52 @@
+"""Identifier strategies for the terms of a parsed expression.
+
+``"path"`` ids (the default) encode where a term sits in its expression:
+the root is ``"0"`` and the i-th child term of a term with id ``p`` is
+``"p.i"``, so the third child of the root is ``"0.2"`` and its second child
+``"0.2.1"``. They cost a string concatenation, are reproducible across
+parses, processes and seeded executions, but are only unique within one
+expression.
+
+``"uuid"`` ids are random (8 hex digits of a ``uuid4``) for callers that
+need ids to be unique across expressions.
+
+Terms built by hand without an id get a process-unique ``"t<n>"`` id,
+which never collides with a path id.
+"""
+
+from __future__ import annotations
+
+import uuid
+
+from dice.terms.base import RollTerm
+
+ID_STRATEGIES = ("path", "uuid")
+
+
+def assign_ids(root: RollTerm, strategy: str = "path") -> None:
+    """Give *root* and every term below it an id using *strategy*.
+
+    Raises:
+        ValueError: If *strategy* is not one of :data:`ID_STRATEGIES`.
+    """
+    if strategy == "path":
+        _assign_paths(root, "0")
+    elif strategy == "uuid":
+        _assign_uuids(root)
+    else:
+        raise ValueError(
+            f"Unknown id strategy: {strategy!r}. Must be one of {ID_STRATEGIES}"
+        )
+
+
+def _assign_paths(term: RollTerm, path: str) -> None:
+    term.id = path
+    prefix = path + "."
+    for i, child in enumerate(term.child_terms()):
+        _assign_paths(child, prefix + str(i))
+
+
+def _assign_uuids(term: RollTerm) -> None:
+    term.id = uuid.uuid4().hex[:8]
+    for child in term.child_terms():
+        _assign_uuids(child)
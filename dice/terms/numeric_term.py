@@ -9,6 +9,8 @@ from dice.terms.base import RollTerm
 class NumericTerm(RollTerm):
     """A term representing a literal numeric value."""
 
+    __slots__ = ("value",)
+
     kind: str = "numeric_term"
 
     def __init__(self, *, value: int | float, id: str | None = None) -> None:
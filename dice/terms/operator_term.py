@@ -9,6 +9,8 @@ from dice.terms.base import RollTerm
 class OperatorTerm(RollTerm):
     """A term representing an infix arithmetic operator."""
 
+    __slots__ = ("operator",)
+
     kind: str = "operator_term"
 
     VALID_OPERATORS = frozenset({"+", "-", "*", "/"})
@@ -10,6 +10,8 @@ from dice.terms.eval_helpers import compute_infix_total
 class ParentheticalTerm(RollTerm):
     """A term representing a parenthesized sub-expression."""
 
+    __slots__ = ("expression", "children", "_total")
+
     kind: str = "parenthetical_term"
 
     def __init__(
@@ -28,9 +30,15 @@ class ParentheticalTerm(RollTerm):
     def total(self) -> int | float:
         return self._total
 
+    def child_terms(self) -> list[RollTerm]:
+        return self.children
+
     def evaluate(self, rng: RNG) -> ParentheticalTerm:
         for child in self.children:
             child.evaluate(rng)
+        return self.resolve(rng)
+
+    def resolve(self, rng: RNG) -> ParentheticalTerm:
         self._total = compute_infix_total(self.children)
         self._evaluated = True
         return self
@@ -10,6 +10,8 @@ from dice.terms.eval_helpers import compute_infix_total
 class RollExpression(RollTerm):
     """Root node representing a complete dice roll expression."""
 
+    __slots__ = ("expression", "children", "label", "_total")
+
     kind: str = "roll_expression"
 
     def __init__(
@@ -30,9 +32,15 @@ class RollExpression(RollTerm):
     def total(self) -> int | float:
         return self._total
 
+    def child_terms(self) -> list[RollTerm]:
+        return self.children
+
     def evaluate(self, rng: RNG) -> RollExpression:
         for child in self.children:
             child.evaluate(rng)
+        return self.resolve(rng)
+
+    def resolve(self, rng: RNG) -> RollExpression:
         self._total = compute_infix_total(self.children)
         self._evaluated = True
         return self
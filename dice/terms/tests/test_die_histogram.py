@@ -0,0 +1,45 @@
+import pytest
+
+from dice.rng import SeededRNG
+from dice.terms import DieHistogram
+from dice.terms.die_histogram import HISTOGRAM_MODIFIERS
+
+
+def test_roll_counts_every_die():
+    histogram = DieHistogram.roll(10_000, 6, SeededRNG(1))
+    assert len(histogram.counts) == 6
+    assert len(histogram) == 10_000
+    assert histogram.kept == histogram.counts
+
+
+def test_kept_total_sums_face_values():
+    histogram = DieHistogram(1, [1, 0, 2, 0, 0, 3])
+    assert histogram.kept_total() == 1 + 3 + 3 + 6 + 6 + 6
+
+
+@pytest.mark.parametrize(
+    "key, n, kept, total",
+    [
+        ("kh", 4, [0, 0, 1, 0, 0, 3], 21),
+        ("k", 1, [0, 0, 0, 0, 0, 1], 6),
+        ("kl", 2, [1, 0, 1, 0, 0, 0], 4),
+        ("dh", 2, [1, 0, 2, 0, 0, 1], 13),
+        ("dl", 2, [0, 0, 1, 0, 0, 3], 21),
+        ("kh", 10, [1, 0, 2, 0, 0, 3], 25),
+        ("dl", 10, [0, 0, 0, 0, 0, 0], 0),
+    ],
+)
+def test_keep_and_drop(key, n, kept, total):
+    histogram = DieHistogram(1, [1, 0, 2, 0, 0, 3])
+    HISTOGRAM_MODIFIERS[key](histogram, n)
+    assert histogram.kept == kept
+    assert histogram.kept_total() == total
+
+
+def test_to_list_skips_faces_never_rolled():
+    histogram = DieHistogram(-1, [2, 0, 1])
+    HISTOGRAM_MODIFIERS["kh"](histogram, 2)
+    assert histogram.to_list() == [
+        {"value": -1, "count": 2, "kept": 1},
+        {"value": 1, "count": 1, "kept": 1},
+    ]
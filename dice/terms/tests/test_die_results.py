@@ -0,0 +1,114 @@
+import pickle
+
+import pytest
+
+from dice.execution import compile_plan, execute
+from dice.grammar import parse
+from dice.rng import SeededRNG
+from dice.terms import (
+    DiceTerm,
+    DieResult,
+    FateDiceTerm,
+    FunctionTerm,
+    GroupTerm,
+    NumericTerm,
+    OperatorTerm,
+    ParentheticalTerm,
+    RollExpression,
+    die_results,
+)
+from dice.terms.die_results import DieResults, DieView, new_results
+
+
+def test_terms_and_die_results_have_no_instance_dict():
+    instances = [
+        DieResult(value=1),
+        NumericTerm(value=1),
+        OperatorTerm(operator="+"),
+        DiceTerm(count=1, faces=6),
+        FateDiceTerm(count=1),
+        ParentheticalTerm(expression="1", children=[]),
+        FunctionTerm(function="abs", children=[]),
+        GroupTerm(children=[]),
+        RollExpression(expression="", children=[]),
+        DieResults([1]),
+        DieResults([1])[0],
+    ]
+    for obj in instances:
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
+
+
+def test_views_read_and_write_packed_fields():
+    results = DieResults([3, 6])
+    die = results[1]
+    assert isinstance(die, DieView)
+    assert (die.value, die.kept, die.exploded, die.critical) == (6, True, False, None)
+    die.kept = False
+    die.rerolled = True
+    die.critical = "failure"
+    assert results[-1] == DieResult(
+        value=6, kept=False, rerolled=True, critical="failure"
+    )
+    assert die.to_dict() == {
+        "value": 6, "kept": False, "rerolled": True, "critical": "failure",
+    }
+    die.critical = None
+    assert die.critical is None
+    with pytest.raises(IndexError):
+        results[2]
+
+
+def test_append_and_totals():
+    results = DieResults([1, 2, 3])
+    results.append(DieResult(value=6, exploded=True))
+    assert len(results) == 4
+    assert results.kept_total() == 12
+    results[0].kept = False
+    assert results.kept_total() == 11
+    assert [d.value for d in results[1:3]] == [2, 3]
+    assert results == [
+        DieResult(value=1, kept=False), DieResult(value=2), DieResult(value=3),
+        DieResult(value=6, exploded=True),
+    ]
+
+
+def test_large_pools_are_packed():
+    term = DiceTerm(count=200, faces=6).evaluate(SeededRNG(1))
+    assert isinstance(term.results, DieResults)
+    assert term.total == sum(d.value for d in term.results)
+    small = DiceTerm(count=3, faces=6).evaluate(SeededRNG(1))
+    assert isinstance(small.results, list)
+
+
+@pytest.mark.parametrize("faces, packed", [(3_000_000_000, True), (2**70, False)])
+def test_pools_with_large_faces(faces, packed):
+    term = DiceTerm(count=65, faces=faces, modifier_strings=["kh3"])
+    term.evaluate(SeededRNG(1))
+    assert isinstance(term.results, DieResults) == packed
+    assert max(d.value for d in term.results) > 2**31
+    assert term.total == sum(sorted(d.value for d in term.results)[-3:])
+    result = execute(compile_plan(parse(f"65d{faces}")), rng=SeededRNG(1))
+    assert len(result.tree["children"][0]["dice"]) == 65
+
+
+def test_values_beyond_the_packed_range_are_not_packed():
+    assert isinstance(new_results([2**63] * 100, 6), list)
+
+
+@pytest.mark.parametrize(
+    "expression", ["200d6", "100d6kh3", "100d6dl10 + 1", "80d6!", "90d6r<2", "100dF"]
+)
+def test_packed_and_unpacked_pools_agree(expression, monkeypatch):
+    plan = compile_plan(parse(expression))
+    packed = execute(plan, rng=SeededRNG(11))
+    monkeypatch.setattr(die_results, "PACKED_RESULTS_THRESHOLD", 10**9)
+    unpacked = execute(plan, rng=SeededRNG(11))
+    assert packed.total == unpacked.total
+    assert packed.tree == unpacked.tree
+
+
+def test_packed_term_pickles():
+    term = DiceTerm(count=100, faces=6).evaluate(SeededRNG(2))
+    restored = pickle.loads(pickle.dumps(term))
+    assert restored.results == term.results
+    assert restored.total == term.total
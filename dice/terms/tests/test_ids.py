@@ -0,0 +1,61 @@
+import re
+
+import pytest
+
+from dice import roll
+from dice.grammar import parse
+from dice.rng import SeededRNG
+from dice.terms import NumericTerm, assign_ids
+
+
+def _ids(node):
+    yield node["id"]
+    for child in node.get("children", []):
+        yield from _ids(child)
+
+
+def test_path_ids_are_the_default():
+    ast = parse("1d20 + (2d6 * floor(1d4 / 2))").ast
+    assert ast.id == "0"
+    assert [c.id for c in ast.children] == ["0.0", "0.1", "0.2"]
+    paren = ast.children[2]
+    assert [c.id for c in paren.children] == ["0.2.0", "0.2.1", "0.2.2"]
+    assert paren.children[2].children[0].id == "0.2.2.0"
+
+
+def test_path_ids_are_unique_within_an_expression():
+    ast = parse("4d6kh3 + (1d8 + (2 * 3)) - abs(1d4 - 2)").ast
+    ids = list(_ids(ast.to_dict()))
+    assert len(ids) == len(set(ids))
+
+
+def test_path_ids_are_reproducible():
+    assert parse("2d6+3").ast.to_dict() == parse("2d6+3").ast.to_dict()
+
+
+def test_seeded_rolls_give_identical_trees():
+    a = roll("4d6kh3 + (1d8 * 2) [fire]", rng=SeededRNG(9))
+    b = roll(" 4d6kh3 + (1d8 * 2) [fire]", rng=SeededRNG(9))
+    assert a.tree == b.tree
+
+
+def test_uuid_ids_on_request():
+    ast = parse("2d6 + (1d4 * 3)", ids="uuid").ast
+    ids = list(_ids(ast.to_dict()))
+    assert all(re.fullmatch(r"[0-9a-f]{8}", i) for i in ids)
+    assert len(set(ids)) == len(ids)
+    assert ast.id != parse("2d6 + (1d4 * 3)", ids="uuid").ast.id
+
+
+def test_unknown_strategy_rejected():
+    with pytest.raises(ValueError, match="id strategy"):
+        parse("1d6", ids="serial")
+    with pytest.raises(ValueError, match="id strategy"):
+        assign_ids(NumericTerm(value=1), "serial")
+
+
+def test_hand_built_terms_get_unique_non_path_ids():
+    a, b = NumericTerm(value=1), NumericTerm(value=2)
+    assert a.id != b.id
+    assert a.id.startswith("t")
+    assert NumericTerm(value=1, id="x").id == "x"
@@ -0,0 +1,159 @@
+import pytest
+
+import dice
+from dice import roll
+from dice.cache import ExpressionCache, expression_cache
+from dice.errors import DiceParseError
+from dice.execution import execute
+from dice.grammar import parse
+from dice.rng import SeededRNG
+
+
+def test_miss_then_hit():
+    cache = ExpressionCache(maxsize=4)
+    cache.parse("1d20+7")
+    cache.parse("1d20+7")
+    info = cache.info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert info.currsize == 1
+
+
+def test_key_is_normalized():
+    cache = ExpressionCache(maxsize=4)
+    cache.parse("1d20+7")
+    r = cache.parse("  1d20+7 ")
+    assert cache.info().hits == 1
+    assert r.expression == "  1d20+7 "
+    assert r.ast.expression == "1d20+7"
+
+
+def test_hit_returns_independent_ast():
+    cache = ExpressionCache(maxsize=4)
+    first = cache.parse("4d6kh3")
+    second = cache.parse("4d6kh3")
+    assert first.ast is not second.ast
+    execute(first.ast, rng=SeededRNG(42))
+    assert first.ast.children[0].results
+    assert second.ast.children[0].results == []
+
+
+def test_lru_eviction():
+    cache = ExpressionCache(maxsize=2)
+    cache.parse("1d4")
+    cache.parse("1d6")
+    cache.parse("1d4")  # refresh 1d4
+    cache.parse("1d8")  # evicts 1d6
+    assert "1d4" in cache
+    assert "1d6" not in cache
+    assert "1d8" in cache
+    assert cache.info().evictions == 1
+
+
+def test_resize_evicts():
+    cache = ExpressionCache(maxsize=3)
+    for expr in ("1d4", "1d6", "1d8"):
+        cache.parse(expr)
+    cache.resize(1)
+    assert len(cache) == 1
+    assert "1d8" in cache
+    assert cache.info().evictions == 2
+
+
+def test_clear_resets():
+    cache = ExpressionCache(maxsize=4)
+    cache.parse("1d6")
+    cache.parse("1d6")
+    cache.clear()
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (0, 0, 0, 0)
+
+
+def test_zero_maxsize_disables_caching():
+    cache = ExpressionCache(maxsize=0)
+    cache.parse("1d6")
+    cache.parse("1d6")
+    assert cache.info().hits == 0
+    assert len(cache) == 0
+
+
+def test_negative_maxsize_rejected():
+    with pytest.raises(ValueError):
+        ExpressionCache(maxsize=-1)
+
+
+def test_errors_are_cached_with_caller_expression():
+    cache = ExpressionCache(maxsize=4)
+    cache.parse("xyz")
+    r = cache.parse(" xyz ")
+    assert cache.info().hits == 1
+    assert r.errors[0].code == "PARSE_ERROR"
+    assert r.errors[0].expression == " xyz "
+
+
+def test_roll_uses_shared_cache():
+    expression_cache.clear()
+    roll("2d6+3", rng=SeededRNG(1))
+    roll("2d6+3", rng=SeededRNG(1))
+    info = expression_cache.info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_plan_is_shared_between_lookups():
+    cache = ExpressionCache(maxsize=4)
+    first = cache.plan("1d20+7")
+    second = cache.plan(" 1d20+7")
+    assert first is second
+    assert cache.info().hits == 1
+
+
+def test_plan_raises_parse_error():
+    cache = ExpressionCache(maxsize=4)
+    with pytest.raises(DiceParseError) as exc_info:
+        cache.plan("1d")
+    assert exc_info.value.expression == "1d"
+
+
+def test_error_positions_follow_caller_whitespace():
+    cache = ExpressionCache(maxsize=4)
+    assert cache.parse("1d20+x").errors[0].position == 5
+    assert cache.parse("   1d20+x").errors[0].position == 8
+
+
+def test_parse_many_dedupes_and_keeps_order():
+    cache = ExpressionCache(maxsize=16)
+    cache.parse("1d20+7")
+    batch = cache.parse_many(["2d6", "1d20+7", " 2d6 ", "xyz", "2d6"])
+    assert [r.expression for r in batch.results] == [
+        "2d6", "1d20+7", " 2d6 ", "xyz", "2d6",
+    ]
+    assert (batch.unique, batch.cache_hits, batch.parsed) == (3, 1, 2)
+    assert batch.duplicates == 2
+    assert batch.results[3].errors[0].code == "PARSE_ERROR"
+    assert batch.results[0].ast is not batch.results[4].ast
+    assert "2d6" in cache
+
+
+def test_parse_many_matches_parse():
+    exprs = ["4d6kh3", "  1d20+x", "(2d6+3)*2", ""]
+    batch = ExpressionCache(maxsize=0).parse_many(exprs)
+    for expr, result in zip(exprs, batch.results):
+        assert result.errors == parse(expr).errors
+        assert result.ast.expression == parse(expr).ast.expression
+
+
+def test_parse_many_process_pool(monkeypatch):
+    monkeypatch.setattr("dice.cache.PARSE_POOL_THRESHOLD", 2)
+    exprs = [f"{n}d6+{n}" for n in range(1, 21)] * 2
+    batch = ExpressionCache(maxsize=64).parse_many(exprs, processes=2)
+    assert (batch.unique, batch.parsed) == (20, 20)
+    result = execute(batch.results[5].ast, rng=SeededRNG(1))
+    assert result.expression == "6d6+6"
+
+
+def test_dice_parse_many_uses_shared_cache():
+    expression_cache.clear()
+    batch = dice.parse_many(["1d6", "1d6", "1d8"])
+    assert (batch.unique, batch.parsed) == (2, 2)
+    assert dice.parse_many(["1d8"]).cache_hits == 1
@@ -0,0 +1,71 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import dice
+
+# Cumulative microseconds reported by ``python -X importtime`` for ``dice``.
+IMPORT_BUDGET_US = 20_000
+
+HEAVY_MODULES = ["pyparsing", "dice.grammar", "dice.terms", "dice.modifiers"]
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_us(stderr: str, module: str) -> int:
+    for line in stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+def test_import_is_lazy():
+    proc = _run(
+        "import json, sys, dice; "
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    assert json.loads(proc.stdout) == []
+
+
+def test_rolling_does_not_import_multiprocessing():
+    proc = _run(
+        "import sys, dice; "
+        "dice.roll('1d20'); "
+        "print('concurrent.futures' in sys.modules, 'multiprocessing' in sys.modules)"
+    )
+    assert proc.stdout.split() == ["False", "False"]
+
+
+def test_import_within_budget():
+    proc = _run("import dice")
+    assert _cumulative_us(proc.stderr, "dice") < IMPORT_BUDGET_US
+
+
+def test_import_does_not_configure_logging():
+    proc = _run(
+        "import logging, dice; "
+        "dice.roll('1d20'); "
+        "print(len(logging.getLogger().handlers))"
+    )
+    assert proc.stdout.strip() == "0"
+
+
+def test_public_names_resolve():
+    for name in dice.__all__:
+        assert getattr(dice, name) is not None
+    assert set(dice.__all__) <= set(dir(dice))
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="no_such_name"):
+        dice.no_such_name
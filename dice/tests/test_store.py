@@ -0,0 +1,112 @@
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+from dice.cache import ExpressionCache
+from dice.execution import compile_plan, execute
+from dice.grammar import parse
+from dice.rng import SeededRNG
+from dice.store import PlanStore
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "plans.db"
+
+
+def test_round_trip(path):
+    plan = compile_plan(parse("4d6kh3+3d6!>=5+floor(1d6/2)"))
+    with PlanStore(path) as store:
+        store.put(" 4d6kh3+3d6!>=5+floor(1d6/2) ", plan)
+        loaded = store.get("4d6kh3+3d6!>=5+floor(1d6/2)")
+        assert loaded == plan
+        assert len(store) == 1
+    expected = execute(plan, rng=SeededRNG(5))
+    assert execute(loaded, rng=SeededRNG(5)).tree == expected.tree
+
+
+def test_missing_expression(path):
+    with PlanStore(path) as store:
+        assert store.get("1d20") is None
+        assert "1d20" not in store
+
+
+def test_syntax_version_change_invalidates(path, monkeypatch):
+    monkeypatch.setattr("dice.store.SYNTAX_VERSION", "0.9")
+    with PlanStore(path) as store:
+        store.warm(["1d20"])
+        assert "1d20" in store
+    monkeypatch.undo()
+    with PlanStore(path, readonly=True) as store:
+        assert store.get("1d20") is None
+    with PlanStore(path) as store:
+        pass
+    rows = sqlite3.connect(path).execute("SELECT COUNT(*) FROM plans").fetchone()
+    assert rows == (0,)
+
+
+def test_warm_skips_invalid_and_duplicates(path):
+    with PlanStore(path) as store:
+        assert store.warm(["1d20+7", " 1d20+7", "xyz", "2d6"]) == 2
+        assert store.warm(["1d20+7"]) == 0
+
+
+def test_readonly_cannot_write(path):
+    PlanStore(path).close()
+    with PlanStore(path, readonly=True) as store:
+        with pytest.raises(sqlite3.OperationalError):
+            store.put("1d6", compile_plan(parse("1d6")))
+
+
+@pytest.mark.parametrize("name", ["plans?mode=rw.db", "plans#1.db", "100%20.db"])
+def test_readonly_path_with_uri_characters(tmp_path, name):
+    path = tmp_path / "a b?#%" / name
+    path.parent.mkdir()
+    with PlanStore(path) as store:
+        store.warm(["1d20"])
+    with PlanStore(path, readonly=True) as store:
+        assert store.get("1d20") == compile_plan(parse("1d20"))
+        with pytest.raises(sqlite3.OperationalError):
+            store.put("1d6", compile_plan(parse("1d6")))
+    assert sorted(p.name for p in path.parent.iterdir())[0] == name
+
+
+def test_shared_read_only_across_processes(path):
+    with PlanStore(path) as store:
+        store.warm(["2d6+3"])
+    code = (
+        "from dice.store import PlanStore\n"
+        f"store = PlanStore({str(path)!r}, readonly=True)\n"
+        "print(store.get('2d6+3').expression)\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert proc.stdout.strip() == "2d6+3"
+
+
+def test_cache_misses_served_from_store(path, monkeypatch):
+    with PlanStore(path) as store:
+        store.warm(["1d20+7"])
+
+    def boom(expression):
+        raise AssertionError("parsed despite stored plan")
+
+    monkeypatch.setattr("dice.cache.parse", boom)
+    with PlanStore(path, readonly=True) as store:
+        cache = ExpressionCache(plan_store=store)
+        assert cache.plan("1d20+7").expression == "1d20+7"
+        batch = cache.parse_many(["1d20+7", "1d20+7"])
+        assert (batch.cache_hits, batch.parsed) == (1, 0)
+
+
+def test_cache_writes_back_to_store(path):
+    with PlanStore(path) as store:
+        cache = ExpressionCache(plan_store=store)
+        cache.parse("3d6")
+        cache.parse_many(["1d8", "xyz"])
+        assert "3d6" in store
+        assert "1d8" in store
+        assert "xyz" not in store
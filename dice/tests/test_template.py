@@ -0,0 +1,126 @@
+import pytest
+
+import dice
+from dice.errors import DiceParseError, DiceValidationError
+from dice.execution import execute
+from dice.rng import SeededRNG
+from dice.template import compile_template
+
+
+def test_roll_matches_literal_expression():
+    template = compile_template("1d20+{str}+{prof}")
+    for seed in range(10):
+        bound = template.roll(rng=SeededRNG(seed), str=3, prof=2)
+        literal = dice.roll("1d20+3+2", rng=SeededRNG(seed)).execution
+        assert bound.total == literal.total
+        assert bound.expression == "1d20+3+2"
+
+
+def test_placeholders_are_typed():
+    template = compile_template("{a}*{b:float}+{a}")
+    assert {n: p.type for n, p in template.placeholders.items()} == {
+        "a": "int",
+        "b": "float",
+    }
+    assert template.roll(a=2, b=1.5).total == 5.0
+
+
+def test_nested_placeholders_rendered():
+    template = compile_template("floor(({lvl}+1)/2)+1d4 [heal]")
+    plan = template.bind(lvl=5)
+    assert plan.expression == "floor((5+1)/2)+1d4 [heal]"
+    assert plan.children[0].children[0].expression == "(5+1)"
+    assert plan.label == "heal"
+
+
+def test_render_repeated_placeholders_and_flavor():
+    template = compile_template("  {a}+2d6+{b:float}*{a} [dmg] ")
+    assert template.render(a=2, b=0.5) == "2+2d6+0.5*2 [dmg]"
+
+
+def test_bind_does_not_parse(monkeypatch):
+    template = compile_template("1d20+{mod}")
+
+    def boom(*args, **kwargs):
+        raise AssertionError("grammar used while binding")
+
+    monkeypatch.setattr("dice.grammar.parser.parse", boom)
+    monkeypatch.setattr("dice.template.parse", boom)
+    assert execute(template.bind(mod=4), rng=SeededRNG(1)).total >= 5
+
+
+def test_bind_leaves_template_plan_unchanged():
+    template = compile_template("2d6+{x}")
+    template.bind(x=7)
+    assert template.plan.children[-1].value == 0
+
+
+@pytest.mark.parametrize(
+    "text, position",
+    [
+        ("1d{x}", 2),
+        ("{n}d6", 0),
+        ("4d6kh{n}", 5),
+        ("1{a}", 1),
+        ("1d20+{rng}", 5),
+        ("{a:str}", 0),
+        ("{a}+{a:float}", 4),
+        ("1d20+{1x}", 5),
+        ("  1d20+{}", 7),
+    ],
+)
+def test_invalid_placeholders_rejected_at_compile_time(text, position):
+    with pytest.raises(DiceParseError) as exc_info:
+        compile_template(text)
+    assert exc_info.value.code == "INVALID_PLACEHOLDER"
+    assert exc_info.value.position == position
+
+
+def test_grammar_errors_reported_against_template():
+    with pytest.raises(DiceParseError) as exc_info:
+        compile_template("1d20+{x}+")
+    assert exc_info.value.expression == "1d20+{x}+"
+
+
+@pytest.mark.parametrize(
+    "values, code",
+    [
+        ({"a": 1}, "MISSING_PLACEHOLDER"),
+        ({"a": 1, "b": 2, "c": 3}, "UNKNOWN_PLACEHOLDER"),
+        ({"a": 1.5, "b": 2}, "INVALID_PLACEHOLDER_VALUE"),
+        ({"a": True, "b": 2}, "INVALID_PLACEHOLDER_VALUE"),
+        ({"a": 1, "b": "2"}, "INVALID_PLACEHOLDER_VALUE"),
+    ],
+)
+def test_bind_validates_values(values, code):
+    template = compile_template("1d20+{a}+{b:float}")
+    with pytest.raises(DiceValidationError, match=code):
+        template.bind(**values)
+
+
+def test_dice_compile_template_export():
+    assert dice.compile_template("1d6+{x}").bind(x=1).expression == "1d6+1"
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("1d20+{mod}", "1d20+(0-3)"),
+        ("{mod}*2+1d4", "(0-3)*2+1d4"),
+        ("floor((1d8+{mod})/2)", "floor((1d8+(0-3))/2)"),
+    ],
+)
+def test_negative_values_render_as_valid_notation(text, expected):
+    plan = compile_template(text).bind(mod=-3)
+    assert plan.expression == expected
+    for seed in range(5):
+        bound = execute(plan, rng=SeededRNG(seed))
+        literal = dice.roll(expected, rng=SeededRNG(seed)).execution
+        assert bound.total == literal.total
+
+
+def test_negative_values_in_parentheticals_render_as_valid_notation():
+    plan = compile_template("2*({a}+{b:float})").bind(a=-1, b=-0.5)
+    assert plan.expression == "2*((0-1)+(0-0.5))"
+    assert plan.children[2].expression == "((0-1)+(0-0.5))"
+    assert execute(plan).total == -3.0